@@ -0,0 +1,13 @@
+"""Faststrap benchmark suite.
+
+Run from the repository root:
+
+    python -m benchmarks                       # full run, compare with baseline.json
+    python -m benchmarks --quick               # fewer iterations (CI smoke test)
+    python -m benchmarks --only micro          # micro, macro or import
+    python -m benchmarks --update-baseline     # store the results as the new baseline
+
+Results are printed as JSON (or written with ``--output``). Any metric that is
+worse than the stored baseline by more than ``--threshold`` (default 15%) is
+reported as a regression and the process exits with status 1.
+"""
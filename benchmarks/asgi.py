@@ -0,0 +1,65 @@
+"""Minimal in-process ASGI client for benchmarking.
+
+Calls the application directly with an HTTP scope, so measurements include
+routing, the endpoint and FastHTML's response rendering but no sockets or
+HTTP client overhead (and no extra dependencies such as ``httpx``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+
+class AsgiClient:
+    """Send GET requests to an ASGI app in-process.
+
+    Args:
+        app: ASGI application (e.g. a ``FastHTML`` instance)
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+
+    def close(self) -> None:
+        self.loop.close()
+
+    def get(self, path: str, headers: dict[str, str] | None = None) -> tuple[int, bytes]:
+        """Return ``(status_code, body)`` for a GET request."""
+        return self.loop.run_until_complete(self._request("GET", path, headers or {}))
+
+    async def _request(self, method: str, path: str, headers: dict[str, str]) -> tuple[int, bytes]:
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [
+                (b"host", b"testserver"),
+                *((k.lower().encode(), v.encode()) for k, v in headers.items()),
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        status = 0
+        body: list[bytes] = []
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return status, b"".join(body)
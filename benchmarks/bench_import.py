@@ -0,0 +1,69 @@
+"""Cold-start benchmark for ``import faststrap``.
+
+Part of the ``python -m benchmarks`` suite; can also be run on its own.
+Each sample runs ``import faststrap`` in a fresh interpreter and measures
+the import alone (interpreter startup is excluded). Prints JSON and exits
+non-zero when the median exceeds ``--max-ms``.
+
+    python benchmarks/bench_import.py --runs 20 --max-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_SNIPPETS = {
+    "import faststrap": "import faststrap",
+    "from faststrap import Button": "from faststrap import Button",
+    "add_bootstrap": "from faststrap import add_bootstrap",
+}
+
+_TIMER = (
+    "import time\n" "t = time.perf_counter()\n" "{code}\n" "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def measure(code: str, runs: int) -> dict[str, float]:
+    """Median/min/max import time in milliseconds over ``runs`` fresh interpreters."""
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(code=code)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(float(out.stdout))
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def run(runs: int = 10) -> dict[str, dict[str, float]]:
+    return {name: measure(code, runs) for name, code in _SNIPPETS.items()}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--max-ms", type=float, default=None, help="Fail if 'import faststrap' median exceeds this"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.runs)
+    print(json.dumps(results, indent=2))
+    if args.max_ms is not None and results["import faststrap"]["median_ms"] > args.max_ms:
+        print(f"import faststrap exceeded {args.max_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
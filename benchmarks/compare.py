@@ -0,0 +1,58 @@
+"""Compare benchmark results against a stored baseline."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Metrics where a larger value is better; every other compared metric is a cost
+HIGHER_IS_BETTER = frozenset({"calls_per_sec", "requests_per_sec"})
+COMPARED = HIGHER_IS_BETTER | {
+    "alloc_peak_bytes",
+    "output_bytes",
+    "mean_ms",
+    "p95_ms",
+    "median_ms",
+    "response_bytes",
+}
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.15
+) -> list[dict[str, Any]]:
+    """Return the metrics that regressed by more than ``threshold``.
+
+    Args:
+        results: Current results (``{"micro": {...}, "macro": {...}, ...}``)
+        baseline: Stored results in the same shape
+        threshold: Allowed relative change, e.g. ``0.15`` for 15%
+
+    Returns:
+        One dict per regression with ``suite``, ``case``, ``metric``,
+        ``baseline``, ``current`` and the relative ``change``
+    """
+    regressions: list[dict[str, Any]] = []
+    for suite, cases in results.items():
+        if suite in ("meta", "regressions"):
+            continue
+        for case, metrics in cases.items():
+            base_metrics = baseline.get(suite, {}).get(case)
+            if not base_metrics:
+                continue
+            for metric, current in metrics.items():
+                base = base_metrics.get(metric)
+                if metric not in COMPARED or not base:
+                    continue
+                change = (current - base) / base
+                worse = -change if metric in HIGHER_IS_BETTER else change
+                if worse > threshold:
+                    regressions.append(
+                        {
+                            "suite": suite,
+                            "case": case,
+                            "metric": metric,
+                            "baseline": base,
+                            "current": current,
+                            "change": round(change, 4),
+                        }
+                    )
+    return regressions
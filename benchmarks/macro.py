@@ -0,0 +1,75 @@
+"""Macro-benchmarks: serve full example pages in-process.
+
+Each example app is loaded from ``examples/`` and its pages are requested
+through :class:`benchmarks.asgi.AsgiClient`, so the numbers cover routing,
+page construction and FastHTML's response rendering.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.asgi import AsgiClient
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+# Example file -> pages to request
+PAGES: dict[str, tuple[str, ...]] = {
+    "05_examples/modern_dashboard.py": ("/",),
+    "ecommerce.py": ("/", "/cart", "/checkout", "/orders", "/admin"),
+}
+
+
+def load_app(relpath: str) -> Any:
+    """Import an example module by path and return its ``app``."""
+    path = EXAMPLES / relpath
+    name = "bench_example_" + path.stem
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load example {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module.app
+
+
+def measure(client: AsgiClient, path: str, min_time: float = 0.5) -> dict[str, float]:
+    """Request ``path`` repeatedly for at least ``min_time`` seconds."""
+    status, body = client.get(path)  # warm-up
+    if status != 200:
+        raise RuntimeError(f"GET {path} returned {status}")
+
+    samples: list[float] = []
+    deadline = time.perf_counter() + min_time
+    while time.perf_counter() < deadline or len(samples) < 5:
+        start = time.perf_counter()
+        client.get(path)
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    total = sum(samples)
+    return {
+        "requests_per_sec": round(len(samples) / total, 1),
+        "mean_ms": round(total / len(samples) * 1000, 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1] * 1000, 3),
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "response_bytes": len(body),
+    }
+
+
+def run(min_time: float = 0.5) -> dict[str, dict[str, float]]:
+    """Benchmark every page in :data:`PAGES`."""
+    results: dict[str, dict[str, float]] = {}
+    for relpath, paths in PAGES.items():
+        client = AsgiClient(load_app(relpath))
+        try:
+            for path in paths:
+                results[f"{relpath} GET {path}"] = measure(client, path, min_time)
+        finally:
+            client.close()
+    return results
@@ -0,0 +1,253 @@
+"""Micro-benchmarks: build and render every public component.
+
+For each component the benchmark reports:
+
+- ``calls_per_sec``: component construction plus ``to_xml`` per second
+- ``alloc_peak_bytes``: peak memory allocated while building and rendering once
+- ``output_bytes``: size of the rendered HTML (UTF-8)
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from fasthtml.common import Div, P, to_xml
+
+from faststrap import (
+    Accordion,
+    AccordionItem,
+    Alert,
+    Badge,
+    Breadcrumb,
+    Button,
+    ButtonGroup,
+    ButtonToolbar,
+    Card,
+    Checkbox,
+    CloseButton,
+    Col,
+    Collapse,
+    Column,
+    ConfirmDialog,
+    Container,
+    DataTable,
+    Drawer,
+    Dropdown,
+    DropdownDivider,
+    DropdownItem,
+    EmptyState,
+    ExportButton,
+    FacetGroup,
+    FacetIndex,
+    FacetRange,
+    FacetSidebar,
+    Figure,
+    FileInput,
+    FloatingLabel,
+    Hero,
+    Icon,
+    IconSprite,
+    Input,
+    InputGroup,
+    InputGroupText,
+    ListGroup,
+    ListGroupItem,
+    ListSource,
+    Modal,
+    Navbar,
+    Pagination,
+    Popover,
+    Progress,
+    ProgressBar,
+    Radio,
+    Range,
+    Row,
+    Select,
+    SimpleToast,
+    Spinner,
+    StatCard,
+    Switch,
+    Table,
+    TabPane,
+    Tabs,
+    TBody,
+    TCell,
+    THead,
+    Toast,
+    ToastContainer,
+    Tooltip,
+    TRow,
+    VirtualTable,
+)
+
+Factory = Callable[[], Any]
+
+_USERS = [
+    {"id": i, "name": f"User {i}", "email": f"user{i}@example.com", "age": 20 + i % 50}
+    for i in range(1000)
+]
+_FACETS = FacetIndex(_USERS, facets=["age"], ranges=["id"])
+
+# One representative call per public component (AccordionItem only renders inside Accordion)
+CASES: dict[str, Factory] = {
+    "Accordion": lambda: Accordion(
+        AccordionItem("One", title="First", expanded=True),
+        AccordionItem("Two", title="Second"),
+        AccordionItem("Three", title="Third"),
+    ),
+    "Alert": lambda: Alert("Your changes were saved.", variant="success", dismissible=True),
+    "Badge": lambda: Badge("New", variant="info", pill=True),
+    "Breadcrumb": lambda: Breadcrumb(("Home", "/"), ("Library", "/lib"), ("Data", None, True)),
+    "Button": lambda: Button("Save", variant="success", icon="check", hx_post="/save"),
+    "ButtonGroup": lambda: ButtonGroup(Button("Left"), Button("Middle"), Button("Right")),
+    "ButtonToolbar": lambda: ButtonToolbar(
+        ButtonGroup(Button("1"), Button("2")), ButtonGroup(Button("3"))
+    ),
+    "Card": lambda: Card("Body text", title="Title", header="Header", footer="Footer"),
+    "Checkbox": lambda: Checkbox("agree", label="I agree", checked=True),
+    "CloseButton": lambda: CloseButton(),
+    "Col": lambda: Col("Column", md=6, lg=4),
+    "Collapse": lambda: Collapse(P("Hidden content"), collapse_id="more"),
+    "ConfirmDialog": lambda: ConfirmDialog("Delete this item?", dialog_id="confirm"),
+    "Container": lambda: Container(Row(Col("A", md=6), Col("B", md=6))),
+    "DataTable": lambda: DataTable(
+        ListSource(_USERS),
+        [Column("id", "#"), Column("name"), Column("email"), Column("age", cls="text-end")],
+        endpoint="/users",
+        sort="age",
+        query="user 1",
+        striped=True,
+    ),
+    "Drawer": lambda: Drawer(P("Menu"), title="Navigation", drawer_id="drawer"),
+    "Dropdown": lambda: Dropdown(
+        DropdownItem("Profile", href="/profile"),
+        DropdownDivider(),
+        DropdownItem("Logout", href="/logout"),
+        label="Account",
+    ),
+    "DropdownDivider": lambda: DropdownDivider(),
+    "DropdownItem": lambda: DropdownItem("Profile", href="/profile"),
+    "EmptyState": lambda: EmptyState(icon="inbox", title="No messages", description="All done"),
+    "ExportButton": lambda: ExportButton("/users/export", "xlsx", table_id="users"),
+    "FacetGroup": lambda: FacetGroup(
+        "brand", {f"Brand {i}": i * 7 % 50 for i in range(20)}, ["Brand 3"]
+    ),
+    "FacetRange": lambda: FacetRange("price", (4.99, 499.0), (20, 300), step=5),
+    "FacetSidebar": lambda: FacetSidebar(_FACETS.search({"age": [25, 30]}), "/users"),
+    "Figure": lambda: Figure("/img.png", caption="A caption", alt="Alt text"),
+    "FileInput": lambda: FileInput("upload", label="Attachment", multiple=True),
+    "FloatingLabel": lambda: FloatingLabel("email", label="Email", input_type="email"),
+    "Hero": lambda: Hero("Welcome", subtitle="Build faster", cta=Button("Get started")),
+    "Icon": lambda: Icon("heart-fill", cls="text-danger"),
+    "IconSprite": lambda: IconSprite("heart-fill", "house", "gear"),
+    "Input": lambda: Input("name", label="Name", placeholder="Jane", required=True),
+    "InputGroup": lambda: InputGroup(InputGroupText("@"), Input("username")),
+    "InputGroupText": lambda: InputGroupText("@"),
+    "ListGroup": lambda: ListGroup(
+        ListGroupItem("One", active=True), ListGroupItem("Two"), ListGroupItem("Three")
+    ),
+    "ListGroupItem": lambda: ListGroupItem("One", active=True),
+    "Modal": lambda: Modal("Body", title="Title", modal_id="modal", footer=Button("OK")),
+    "Navbar": lambda: Navbar(Div("Links"), brand="Brand", id="nav"),
+    "Pagination": lambda: Pagination(5, 20, base_url="/items", show_first_last=True),
+    "Popover": lambda: Popover("Title", "Content", Button("Open")),
+    "Progress": lambda: Progress(40, variant="success", label="40%"),
+    "ProgressBar": lambda: ProgressBar(25, striped=True),
+    "Radio": lambda: Radio("plan", label="Pro", value="pro"),
+    "Range": lambda: Range("volume", label="Volume", min_val=0, max_val=10),
+    "Row": lambda: Row(Col("A"), Col("B"), Col("C")),
+    "Select": lambda: Select("size", ("s", "Small"), ("m", "Medium", True), ("l", "Large")),
+    "SimpleToast": lambda: SimpleToast("Saved", title="Done"),
+    "Spinner": lambda: Spinner(variant="primary", size="sm"),
+    "StatCard": lambda: StatCard("Users", "1,200", icon="people", trend="+5%"),
+    "Switch": lambda: Switch("notifications", label="Notifications", checked=True),
+    "Table": lambda: Table(
+        THead(TRow(TCell("Name", header=True), TCell("Email", header=True))),
+        TBody(*(TRow(TCell(f"User {i}"), TCell(f"user{i}@example.com")) for i in range(20))),
+        striped=True,
+        hover=True,
+    ),
+    "Table.from_records": lambda: Table.from_records(
+        _USERS[:200],
+        [Column("id", "#"), Column("name"), Column("email"), Column("age", cls="text-end")],
+        striped=True,
+    ),
+    "Table.from_groups": lambda: Table.from_groups(
+        _USERS[:200],
+        [Column("id", "#"), Column("name"), Column("age", cls="text-end")],
+        by="age",
+        aggregates={"age": "mean"},
+        sort=True,
+        collapsible=True,
+    ),
+    "TabPane": lambda: TabPane("Content", tab_id="home", active=True),
+    "Tabs": lambda: Tabs(("home", "Home", True), ("profile", "Profile"), ("contact", "Contact")),
+    "TBody": lambda: TBody(TRow(TCell("A"), TCell("B"))),
+    "TCell": lambda: TCell("Cell", colspan=2),
+    "THead": lambda: THead(TRow(TCell("Name", header=True))),
+    "Toast": lambda: Toast("Hello there", title="Notification"),
+    "ToastContainer": lambda: ToastContainer(Toast("One"), position="top-end"),
+    "VirtualTable": lambda: VirtualTable(
+        lambda start, stop: _USERS[start:stop],
+        ["id", "name", "email", "age"],
+        endpoint="/users",
+        total=len(_USERS),
+        start=400,
+    ),
+    "Tooltip": lambda: Tooltip("Tip", Button("Hover me")),
+    "TRow": lambda: TRow(TCell("A"), TCell("B"), TCell("C")),
+}
+
+
+def _render(factory: Factory) -> str:
+    return to_xml(factory())
+
+
+def calls_per_sec(factory: Factory, min_time: float = 0.2) -> float:
+    """Build-and-render throughput, timed with the garbage collector disabled."""
+    number = 1
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                _render(factory)
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                return number / elapsed
+            number *= 2 if elapsed < min_time / 10 else max(2, int(min_time / elapsed) + 1)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def alloc_peak_bytes(factory: Factory) -> int:
+    """Peak memory allocated while building and rendering once."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        _render(factory)
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run(min_time: float = 0.2, only: list[str] | None = None) -> dict[str, dict[str, float]]:
+    """Benchmark every component in :data:`CASES` (or the names in ``only``)."""
+    results: dict[str, dict[str, float]] = {}
+    for name, factory in CASES.items():
+        if only and name not in only:
+            continue
+        html = _render(factory)  # warm-up (imports, caches)
+        results[name] = {
+            "calls_per_sec": round(calls_per_sec(factory, min_time), 1),
+            "alloc_peak_bytes": alloc_peak_bytes(factory),
+            "output_bytes": len(html.encode("utf-8")),
+        }
+    return results
@@ -0,0 +1,83 @@
+"""Command-line entry point for the benchmark suite (``python -m benchmarks``)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from benchmarks import bench_import, macro, micro
+from benchmarks.compare import compare
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+SUITES = ("micro", "macro", "import")
+
+
+def _meta() -> dict[str, Any]:
+    import faststrap
+
+    return {
+        "faststrap": faststrap.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def run_suites(suites: tuple[str, ...] = SUITES, quick: bool = False) -> dict[str, Any]:
+    """Run the selected suites and return their results keyed by suite name."""
+    results: dict[str, Any] = {"meta": _meta()}
+    if "micro" in suites:
+        results["micro"] = micro.run(min_time=0.02 if quick else 0.2)
+    if "macro" in suites:
+        results["macro"] = macro.run(min_time=0.05 if quick else 0.5)
+    if "import" in suites:
+        results["import"] = bench_import.run(runs=3 if quick else 10)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--only", choices=SUITES, action="append", help="Suite(s) to run")
+    parser.add_argument("--quick", action="store_true", help="Short runs (smoke test)")
+    parser.add_argument("--output", type=Path, help="Write results JSON to this file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="Baseline JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Allowed relative regression before failing (default: 0.15 = 15%%)",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Store the results as the new baseline"
+    )
+    args = parser.parse_args(argv)
+
+    suites = tuple(args.only) if args.only else SUITES
+    results = run_suites(suites, quick=args.quick)
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        results["regressions"] = compare(results, baseline, args.threshold)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    regressions = results.get("regressions", [])
+    for item in regressions:
+        print(
+            f"REGRESSION {item['suite']}/{item['case']} {item['metric']}: "
+            f"{item['baseline']} -> {item['current']} ({item['change']:+.1%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
@@ -7,95 +7,257 @@ __version__ = "0.3.1"
 __author__ = "FastStrap Contributors"
 __license__ = "MIT"
 
-# Core functionality
-# Display
-from .components.display import (
-    Badge,
-    Card,
-    EmptyState,
-    Figure,
-    StatCard,
-    Table,
-    TBody,
-    TCell,
-    THead,
-    TRow,
-)
+from typing import TYPE_CHECKING
 
-# Feedback
-from .components.feedback import (
-    Alert,
-    ConfirmDialog,
-    Modal,
-    Popover,
-    Progress,
-    ProgressBar,
-    SimpleToast,
-    Spinner,
-    Toast,
-    ToastContainer,
-    Tooltip,
-)
+from .core.lazy import lazy_exports
 
-# Forms
-from .components.forms import (
-    Button,
-    ButtonGroup,
-    ButtonToolbar,
-    Checkbox,
-    CloseButton,
-    FileInput,
-    FloatingLabel,
-    Input,
-    InputGroup,
-    InputGroupText,
-    Radio,
-    Range,
-    Select,
-    Switch,
-)
+if TYPE_CHECKING:
+    # Core functionality
+    # Display
+    from .components.display import (
+        Badge,
+        Card,
+        CellFormat,
+        Column,
+        DataSource,
+        DataTable,
+        EmptyState,
+        ExportButton,
+        Figure,
+        ListSource,
+        StatCard,
+        Table,
+        TableSnapshot,
+        TBody,
+        TCell,
+        THead,
+        TRow,
+        VirtualTable,
+        diff_rows,
+        export_response,
+        formats,
+        group_records,
+        iter_export,
+    )
+
+    # Feedback
+    from .components.feedback import (
+        Alert,
+        ConfirmDialog,
+        Modal,
+        Popover,
+        Progress,
+        ProgressBar,
+        SimpleToast,
+        Spinner,
+        Toast,
+        ToastContainer,
+        Tooltip,
+    )
+
+    # Forms
+    from .components.forms import (
+        Button,
+        ButtonGroup,
+        ButtonToolbar,
+        Checkbox,
+        CloseButton,
+        FacetGroup,
+        FacetIndex,
+        FacetRange,
+        FacetSidebar,
+        FileInput,
+        FloatingLabel,
+        Input,
+        InputGroup,
+        InputGroupText,
+        Radio,
+        Range,
+        Select,
+        Switch,
+    )
+
+    # Layout
+    from .components.layout import Col, Container, Hero, Row
+
+    # Navigation
+    from .components.navigation import (
+        Accordion,
+        AccordionItem,
+        Breadcrumb,
+        Collapse,
+        Drawer,
+        Dropdown,
+        DropdownDivider,
+        DropdownItem,
+        ListGroup,
+        ListGroupItem,
+        Navbar,
+        Pagination,
+        TabPane,
+        Tabs,
+        page_fragment,
+        page_url,
+    )
+    from .core import cache, profiler, purge
+    from .core.assets import add_bootstrap, get_assets
+    from .core.base import merge_classes
+    from .core.compiled import CompiledComponent, compile
+    from .core.ids import id_scope, set_id_provider, unique_id
+    from .core.render import render_html, write_html
+    from .core.static import CompressedStaticFiles, precompress
+    from .core.streaming import aiter_html, iter_html, stream_page
+    from .core.theme import (
+        Theme,
+        component_defaults,
+        create_theme,
+        get_builtin_theme,
+        list_builtin_themes,
+        reset_component_defaults,
+        resolve_defaults,
+        set_component_defaults,
+    )
 
-# Layout
-from .components.layout import Col, Container, Hero, Row
+    # Utils
+    from .utils import cleanup_static_resources, get_faststrap_static_url
+    from .utils.icons import Icon, IconSprite
 
-# Navigation
-from .components.navigation import (
-    Accordion,
-    AccordionItem,
-    Breadcrumb,
-    Collapse,
-    Drawer,
-    Dropdown,
-    DropdownDivider,
-    DropdownItem,
-    ListGroup,
-    ListGroupItem,
-    Navbar,
-    Pagination,
-    TabPane,
-    Tabs,
-)
-from .core.assets import add_bootstrap, get_assets
-from .core.base import merge_classes
-from .core.theme import (
-    Theme,
-    create_theme,
-    get_builtin_theme,
-    list_builtin_themes,
-    reset_component_defaults,
-    resolve_defaults,
-    set_component_defaults,
-)
+# Public API, imported on first access (PEP 562) to keep ``import faststrap`` cheap
+_EXPORTS: dict[str, str] = {
+    # Core
+    "add_bootstrap": ".core.assets:add_bootstrap",
+    "get_assets": ".core.assets:get_assets",
+    "merge_classes": ".core.base:merge_classes",
+    "compile": ".core.compiled:compile",
+    "CompiledComponent": ".core.compiled:CompiledComponent",
+    "render_html": ".core.render:render_html",
+    "write_html": ".core.render:write_html",
+    "iter_html": ".core.streaming:iter_html",
+    "aiter_html": ".core.streaming:aiter_html",
+    "stream_page": ".core.streaming:stream_page",
+    "CompressedStaticFiles": ".core.static:CompressedStaticFiles",
+    "precompress": ".core.static:precompress",
+    "cache": ".core.cache",
+    "profiler": ".core.profiler",
+    "purge": ".core.purge",
+    "unique_id": ".core.ids:unique_id",
+    "id_scope": ".core.ids:id_scope",
+    "set_id_provider": ".core.ids:set_id_provider",
+    # Theme
+    "Theme": ".core.theme:Theme",
+    "create_theme": ".core.theme:create_theme",
+    "get_builtin_theme": ".core.theme:get_builtin_theme",
+    "list_builtin_themes": ".core.theme:list_builtin_themes",
+    "set_component_defaults": ".core.theme:set_component_defaults",
+    "reset_component_defaults": ".core.theme:reset_component_defaults",
+    "component_defaults": ".core.theme:component_defaults",
+    "resolve_defaults": ".core.theme:resolve_defaults",
+    # Forms
+    "Button": ".components.forms:Button",
+    "CloseButton": ".components.forms:CloseButton",
+    "ButtonGroup": ".components.forms:ButtonGroup",
+    "ButtonToolbar": ".components.forms:ButtonToolbar",
+    "Checkbox": ".components.forms:Checkbox",
+    "FileInput": ".components.forms:FileInput",
+    "Radio": ".components.forms:Radio",
+    "Switch": ".components.forms:Switch",
+    "Range": ".components.forms:Range",
+    "FacetIndex": ".components.forms:FacetIndex",
+    "FacetGroup": ".components.forms:FacetGroup",
+    "FacetRange": ".components.forms:FacetRange",
+    "FacetSidebar": ".components.forms:FacetSidebar",
+    "Input": ".components.forms:Input",
+    "InputGroup": ".components.forms:InputGroup",
+    "InputGroupText": ".components.forms:InputGroupText",
+    "FloatingLabel": ".components.forms:FloatingLabel",
+    "Select": ".components.forms:Select",
+    # Display
+    "Badge": ".components.display:Badge",
+    "Card": ".components.display:Card",
+    "EmptyState": ".components.display:EmptyState",
+    "Figure": ".components.display:Figure",
+    "StatCard": ".components.display:StatCard",
+    "Table": ".components.display:Table",
+    "THead": ".components.display:THead",
+    "TBody": ".components.display:TBody",
+    "TRow": ".components.display:TRow",
+    "DataTable": ".components.display:DataTable",
+    "DataSource": ".components.display:DataSource",
+    "ListSource": ".components.display:ListSource",
+    "Column": ".components.display:Column",
+    "VirtualTable": ".components.display:VirtualTable",
+    "TableSnapshot": ".components.display:TableSnapshot",
+    "diff_rows": ".components.display:diff_rows",
+    "ExportButton": ".components.display:ExportButton",
+    "export_response": ".components.display:export_response",
+    "iter_export": ".components.display:iter_export",
+    "group_records": ".components.display:group_records",
+    "formats": ".components.display.formats",
+    "CellFormat": ".components.display.formats:CellFormat",
+    "TCell": ".components.display:TCell",
+    "Alert": ".components.feedback:Alert",
+    "ConfirmDialog": ".components.feedback:ConfirmDialog",
+    "Toast": ".components.feedback:Toast",
+    "SimpleToast": ".components.feedback:SimpleToast",
+    "ToastContainer": ".components.feedback:ToastContainer",
+    "Modal": ".components.feedback:Modal",
+    "Popover": ".components.feedback:Popover",
+    "Tooltip": ".components.feedback:Tooltip",
+    "Progress": ".components.feedback:Progress",
+    "ProgressBar": ".components.feedback:ProgressBar",
+    "Spinner": ".components.feedback:Spinner",
+    # Layout
+    "Container": ".components.layout:Container",
+    "Row": ".components.layout:Row",
+    "Col": ".components.layout:Col",
+    "Hero": ".components.layout:Hero",
+    # Navigation
+    "Accordion": ".components.navigation:Accordion",
+    "AccordionItem": ".components.navigation:AccordionItem",
+    "Collapse": ".components.navigation:Collapse",
+    "Drawer": ".components.navigation:Drawer",
+    "ListGroup": ".components.navigation:ListGroup",
+    "ListGroupItem": ".components.navigation:ListGroupItem",
+    "Navbar": ".components.navigation:Navbar",
+    "Pagination": ".components.navigation:Pagination",
+    "page_fragment": ".components.navigation:page_fragment",
+    "page_url": ".components.navigation:page_url",
+    "Breadcrumb": ".components.navigation:Breadcrumb",
+    "Dropdown": ".components.navigation:Dropdown",
+    "DropdownItem": ".components.navigation:DropdownItem",
+    "DropdownDivider": ".components.navigation:DropdownDivider",
+    "Tabs": ".components.navigation:Tabs",
+    "TabPane": ".components.navigation:TabPane",
+    # Utils
+    "Icon": ".utils.icons:Icon",
+    "IconSprite": ".utils.icons:IconSprite",
+    "get_faststrap_static_url": ".utils:get_faststrap_static_url",
+    "cleanup_static_resources": ".utils:cleanup_static_resources",
+}
 
-# Utils
-from .utils import cleanup_static_resources, get_faststrap_static_url
-from .utils.icons import Icon
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Core
     "add_bootstrap",
     "get_assets",
     "merge_classes",
+    # "compile" is reachable as faststrap.compile but kept out of star imports,
+    # which would otherwise shadow the builtin compile()
+    "CompiledComponent",
+    "render_html",
+    "write_html",
+    "iter_html",
+    "aiter_html",
+    "stream_page",
+    "CompressedStaticFiles",
+    "precompress",
+    "cache",
+    "profiler",
+    "purge",
+    "unique_id",
+    "id_scope",
+    "set_id_provider",
     # Theme
     "Theme",
     "create_theme",
@@ -103,6 +265,7 @@ __all__ = [
     "list_builtin_themes",
     "set_component_defaults",
     "reset_component_defaults",
+    "component_defaults",
     "resolve_defaults",
     # Forms
     "Button",
@@ -114,6 +277,10 @@ __all__ = [
     "Radio",
     "Switch",
     "Range",
+    "FacetIndex",
+    "FacetGroup",
+    "FacetRange",
+    "FacetSidebar",
     "Input",
     "InputGroup",
     "InputGroupText",
@@ -130,6 +297,19 @@ __all__ = [
     "TBody",
     "TRow",
     "TCell",
+    "DataTable",
+    "DataSource",
+    "ListSource",
+    "Column",
+    "VirtualTable",
+    "TableSnapshot",
+    "diff_rows",
+    "ExportButton",
+    "export_response",
+    "iter_export",
+    "group_records",
+    "formats",
+    "CellFormat",
     "Alert",
     "ConfirmDialog",
     "Toast",
@@ -155,6 +335,8 @@ __all__ = [
     "ListGroupItem",
     "Navbar",
     "Pagination",
+    "page_fragment",
+    "page_url",
     "Breadcrumb",
     "Dropdown",
     "DropdownItem",
@@ -163,6 +345,7 @@ __all__ = [
     "TabPane",
     # Utils
     "Icon",
+    "IconSprite",
     "get_faststrap_static_url",
     "cleanup_static_resources",
     # Metadata
@@ -1,69 +1,172 @@
-"""FastStrap components."""
+"""FastStrap components.
 
-# Forms
-# Display
-from .display import (
-    Badge,
-    Card,
-    EmptyState,
-    Figure,
-    StatCard,
-    Table,
-    TBody,
-    TCell,
-    THead,
-    TRow,
-)
+Component categories are imported on first access (see ``core.lazy``).
+"""
 
-# Feedback
-from .feedback import (
-    Alert,
-    ConfirmDialog,
-    Modal,
-    Popover,
-    Progress,
-    ProgressBar,
-    Spinner,
-    Toast,
-    ToastContainer,
-    Tooltip,
-)
-from .forms import (
-    Button,
-    ButtonGroup,
-    ButtonToolbar,
-    Checkbox,
-    FileInput,
-    FloatingLabel,
-    Input,
-    InputGroup,
-    InputGroupText,
-    Radio,
-    Range,
-    Select,
-    Switch,
-)
+from typing import TYPE_CHECKING
 
-# Layout
-from .layout import Col, Container, Hero, Row
+from ..core.lazy import lazy_exports
 
-# Navigation
-from .navigation import (
-    Accordion,
-    AccordionItem,
-    Breadcrumb,
-    Collapse,
-    Drawer,
-    Dropdown,
-    DropdownDivider,
-    DropdownItem,
-    ListGroup,
-    ListGroupItem,
-    Navbar,
-    Pagination,
-    TabPane,
-    Tabs,
-)
+if TYPE_CHECKING:
+    # Forms
+    # Display
+    from .display import (
+        Badge,
+        Card,
+        Column,
+        DataSource,
+        DataTable,
+        EmptyState,
+        ExportButton,
+        Figure,
+        ListSource,
+        StatCard,
+        Table,
+        TableSnapshot,
+        TBody,
+        TCell,
+        THead,
+        TRow,
+        VirtualTable,
+        diff_rows,
+        export_response,
+        group_records,
+        iter_export,
+    )
+
+    # Feedback
+    from .feedback import (
+        Alert,
+        ConfirmDialog,
+        Modal,
+        Popover,
+        Progress,
+        ProgressBar,
+        Spinner,
+        Toast,
+        ToastContainer,
+        Tooltip,
+    )
+    from .forms import (
+        Button,
+        ButtonGroup,
+        ButtonToolbar,
+        Checkbox,
+        FacetGroup,
+        FacetIndex,
+        FacetRange,
+        FacetSidebar,
+        FileInput,
+        FloatingLabel,
+        Input,
+        InputGroup,
+        InputGroupText,
+        Radio,
+        Range,
+        Select,
+        Switch,
+    )
+
+    # Layout
+    from .layout import Col, Container, Hero, Row
+
+    # Navigation
+    from .navigation import (
+        Accordion,
+        AccordionItem,
+        Breadcrumb,
+        Collapse,
+        Drawer,
+        Dropdown,
+        DropdownDivider,
+        DropdownItem,
+        ListGroup,
+        ListGroupItem,
+        Navbar,
+        Pagination,
+        TabPane,
+        Tabs,
+        page_fragment,
+        page_url,
+    )
+
+_EXPORTS: dict[str, str] = {
+    # Forms
+    "Button": ".forms:Button",
+    "ButtonGroup": ".forms:ButtonGroup",
+    "ButtonToolbar": ".forms:ButtonToolbar",
+    "Checkbox": ".forms:Checkbox",
+    "FacetGroup": ".forms:FacetGroup",
+    "FacetIndex": ".forms:FacetIndex",
+    "FacetRange": ".forms:FacetRange",
+    "FacetSidebar": ".forms:FacetSidebar",
+    "FileInput": ".forms:FileInput",
+    "FloatingLabel": ".forms:FloatingLabel",
+    "Input": ".forms:Input",
+    "InputGroup": ".forms:InputGroup",
+    "InputGroupText": ".forms:InputGroupText",
+    "Radio": ".forms:Radio",
+    "Range": ".forms:Range",
+    "Select": ".forms:Select",
+    "Switch": ".forms:Switch",
+    # Display
+    "Badge": ".display:Badge",
+    "Card": ".display:Card",
+    "EmptyState": ".display:EmptyState",
+    "Figure": ".display:Figure",
+    "StatCard": ".display:StatCard",
+    "Table": ".display:Table",
+    "TBody": ".display:TBody",
+    "TCell": ".display:TCell",
+    "THead": ".display:THead",
+    "TRow": ".display:TRow",
+    "DataTable": ".display:DataTable",
+    "DataSource": ".display:DataSource",
+    "ListSource": ".display:ListSource",
+    "Column": ".display:Column",
+    "VirtualTable": ".display:VirtualTable",
+    "TableSnapshot": ".display:TableSnapshot",
+    "diff_rows": ".display:diff_rows",
+    "ExportButton": ".display:ExportButton",
+    "export_response": ".display:export_response",
+    "iter_export": ".display:iter_export",
+    "group_records": ".display:group_records",
+    # Feedback
+    "Alert": ".feedback:Alert",
+    "ConfirmDialog": ".feedback:ConfirmDialog",
+    "Modal": ".feedback:Modal",
+    "Popover": ".feedback:Popover",
+    "Progress": ".feedback:Progress",
+    "ProgressBar": ".feedback:ProgressBar",
+    "Spinner": ".feedback:Spinner",
+    "Toast": ".feedback:Toast",
+    "ToastContainer": ".feedback:ToastContainer",
+    "Tooltip": ".feedback:Tooltip",
+    # Layout
+    "Col": ".layout:Col",
+    "Container": ".layout:Container",
+    "Hero": ".layout:Hero",
+    "Row": ".layout:Row",
+    # Navigation
+    "Accordion": ".navigation:Accordion",
+    "AccordionItem": ".navigation:AccordionItem",
+    "Breadcrumb": ".navigation:Breadcrumb",
+    "Collapse": ".navigation:Collapse",
+    "Drawer": ".navigation:Drawer",
+    "Dropdown": ".navigation:Dropdown",
+    "DropdownDivider": ".navigation:DropdownDivider",
+    "DropdownItem": ".navigation:DropdownItem",
+    "ListGroup": ".navigation:ListGroup",
+    "ListGroupItem": ".navigation:ListGroupItem",
+    "Navbar": ".navigation:Navbar",
+    "Pagination": ".navigation:Pagination",
+    "page_fragment": ".navigation:page_fragment",
+    "page_url": ".navigation:page_url",
+    "TabPane": ".navigation:TabPane",
+    "Tabs": ".navigation:Tabs",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Forms
@@ -71,6 +174,10 @@ __all__ = [
     "ButtonGroup",
     "ButtonToolbar",
     "Checkbox",
+    "FacetGroup",
+    "FacetIndex",
+    "FacetRange",
+    "FacetSidebar",
     "FileInput",
     "FloatingLabel",
     "Input",
@@ -91,6 +198,17 @@ __all__ = [
     "TBody",
     "TRow",
     "TCell",
+    "DataTable",
+    "DataSource",
+    "ListSource",
+    "Column",
+    "VirtualTable",
+    "TableSnapshot",
+    "diff_rows",
+    "ExportButton",
+    "export_response",
+    "iter_export",
+    "group_records",
     # Feedback
     "Alert",
     "ConfirmDialog",
@@ -113,6 +231,8 @@ __all__ = [
     "Drawer",
     "Navbar",
     "Pagination",
+    "page_fragment",
+    "page_url",
     "Breadcrumb",
     "Dropdown",
     "DropdownItem",
@@ -2,10 +2,17 @@
 
 from .badge import Badge
 from .card import Card
+from .columns import Column, row_id
+from .datatable import DataSource, DataTable, ListSource
 from .empty_state import EmptyState
+from .export import ExportButton, export_response, iter_export
 from .figure import Figure
+from .formats import CellFormat, compile_format
+from .grouping import Group, group_records
 from .stat_card import StatCard
-from .table import Table, TBody, TCell, THead, TRow
+from .table import RowSource, Table, TBody, TCell, THead, TRow
+from .table_diff import RowDiff, TableSnapshot, diff_rows
+from .virtual_table import VirtualTable
 
 __all__ = [
     "Badge",
@@ -13,9 +20,26 @@ __all__ = [
     "EmptyState",
     "Figure",
     "StatCard",
+    "DataTable",
+    "DataSource",
+    "ListSource",
+    "Column",
+    "VirtualTable",
     "Table",
     "THead",
     "TBody",
     "TRow",
     "TCell",
+    "RowSource",
+    "TableSnapshot",
+    "RowDiff",
+    "diff_rows",
+    "row_id",
+    "ExportButton",
+    "export_response",
+    "iter_export",
+    "CellFormat",
+    "compile_format",
+    "Group",
+    "group_records",
 ]
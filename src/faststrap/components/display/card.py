@@ -5,10 +5,12 @@ from typing import Any
 from fasthtml.common import H5, Div, Img
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...utils.attrs import convert_attrs
 
 
+@register(category="display")
 def Card(
     *children: Any,
     title: str | None = None,
@@ -0,0 +1,233 @@
+"""Column definitions shared by the data-driven table components."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from operator import itemgetter
+from typing import Any, Literal
+
+from fastcore.xml import FT
+
+from .formats import compile_format
+
+_new = object.__new__
+
+_SAFE_KEY = re.compile(r"[A-Za-z0-9-]+")
+_UNSAFE_CHAR = re.compile(r"[^A-Za-z0-9-]")
+
+TableVariantType = Literal[
+    "primary", "secondary", "success", "danger", "warning", "info", "light", "dark"
+]
+
+Formatter = Callable[[Any], Any]
+
+
+def get_value(record: Any, key: str | int) -> Any:
+    """Read ``key`` from a record (mapping key, sequence index or attribute)."""
+    if isinstance(record, Mapping):
+        return record.get(key)
+    if isinstance(key, int):
+        return record[key]
+    return getattr(record, key, None)
+
+
+class Column:
+    """Describes one column of a data-driven table.
+
+    Args:
+        key: Mapping key, attribute name or tuple index of the value
+        label: Header text (defaults to the key in title case)
+        sortable: Whether the column can be sorted (DataTable)
+        formatter: Function turning a raw value into cell content, a compiled
+                   formatter from ``faststrap.formats`` (applied to the whole
+                   column at once) or a format spec string such as ``",.2f"``
+                   or ``"%d %b %Y"``
+        cls: CSS classes for every cell in the column
+        header_cls: CSS classes for the header cell
+        variant: Bootstrap color variant for every cell in the column
+
+    Example:
+        >>> Column("price", "Price", formatter=formats.currency("$"), cls="text-end")
+        >>> Column("updated", formatter="%d %b %Y")
+    """
+
+    __slots__ = ("key", "label", "sortable", "formatter", "cls", "header_cls", "variant")
+
+    def __init__(
+        self,
+        key: str | int,
+        label: str | None = None,
+        sortable: bool = True,
+        formatter: Formatter | str | None = None,
+        cls: str | None = None,
+        header_cls: str | None = None,
+        variant: TableVariantType | None = None,
+    ):
+        self.key = key
+        self.label = label if label is not None else str(key).replace("_", " ").title()
+        self.sortable = sortable
+        self.formatter = compile_format(formatter) if isinstance(formatter, str) else formatter
+        self.cls = cls
+        self.header_cls = header_cls
+        self.variant = variant
+
+    def __repr__(self) -> str:
+        return f"Column({self.key!r}, {self.label!r})"
+
+    @property
+    def cell_cls(self) -> str | None:
+        """Combined class attribute for body cells (None when the column has none)."""
+        parts = [f"table-{self.variant}" if self.variant else None, self.cls]
+        joined = " ".join(p for p in parts if p)
+        return joined or None
+
+    def value(self, record: Any) -> Any:
+        """Raw value of this column for ``record``."""
+        return get_value(record, self.key)
+
+    def format(self, value: Any) -> Any:
+        """Cell content for a raw value."""
+        if self.formatter is not None:
+            return self.formatter(value)
+        return "" if value is None else value
+
+    def format_all(self, values: Iterable[Any]) -> Iterable[Any]:
+        """Cell contents for a whole column of raw values.
+
+        Compiled formatters (with a ``batch`` method) format the column in
+        one call; plain functions are mapped over the values.
+        """
+        formatter = self.formatter
+        if formatter is None:
+            return ("" if value is None else value for value in values)
+        batch = getattr(formatter, "batch", None)
+        if batch is not None:
+            return batch(values)
+        return map(formatter, values)
+
+    @property
+    def batched(self) -> bool:
+        """Whether the formatter takes whole columns (raw arrays are passed through)."""
+        return hasattr(self.formatter, "batch")
+
+
+def as_columns(columns: Any) -> list[Column]:
+    """Normalize column specs (``Column`` objects or plain keys) to ``Column`` objects."""
+    return [c if isinstance(c, Column) else Column(c) for c in columns]
+
+
+def row_id(key: Any) -> str:
+    """HTML ``id`` of a keyed table row (``TRow(key=...)``).
+
+    Characters that are not safe in a CSS ``#id`` selector (HTMX targets rows
+    by selector) are hex-escaped, keeping distinct keys distinct:
+    ``row_id("a@b.io") == "row-a_40_b_2e_io"``.
+    """
+    text = str(key)
+    if _SAFE_KEY.fullmatch(text):
+        return f"row-{text}"
+    return "row-" + _UNSAFE_CHAR.sub(lambda m: f"_{ord(m.group()):x}_", text)
+
+
+def _node(tag: str, children: tuple[Any, ...], attrs: dict[str, Any]) -> FT:
+    """Create an FT node without ``FT.__init__``.
+
+    ``FT.__setattr__`` routes every assignment through its attribute mapping;
+    setting the instance dict directly makes bulk cell creation about four
+    times cheaper. The node is indistinguishable from ``FT(tag, children, attrs)``.
+    """
+    node = _new(FT)
+    node.__dict__ = {
+        "tag": tag,
+        "children": children,
+        "attrs": attrs,
+        "void_": False,
+        "listeners_": [],
+    }
+    return node
+
+
+def _record_getter(sample: Any, keys: Sequence[str | int]) -> Callable[[Any], Sequence[Any]]:
+    """Pick the cheapest accessor returning all column values of a record."""
+    if isinstance(sample, Mapping):
+        return lambda record: [record.get(key) for key in keys]
+    if isinstance(sample, Sequence) and keys and all(isinstance(key, int) for key in keys):
+        if len(keys) == 1:
+            index = keys[0]
+            return lambda record: (record[index],)
+        return itemgetter(*keys)  # type: ignore[return-value]
+    return lambda record: [get_value(record, key) for key in keys]
+
+
+def header_row(columns: Sequence[Column]) -> FT:
+    """Header row (``<tr>`` of ``<th scope="col">``) for ``columns``."""
+    return _node(
+        "tr",
+        tuple(
+            _node(
+                "th",
+                (col.label,),
+                {"scope": "col", "class": col.header_cls} if col.header_cls else {"scope": "col"},
+            )
+            for col in columns
+        ),
+        {},
+    )
+
+
+def columns_to_rows(columns: Sequence[Column], values: Sequence[Iterable[Any]]) -> list[FT]:
+    """Build body rows from column-oriented values.
+
+    Each column is formatted in one pass (``Column.format_all``) and cells
+    are created as plain FT nodes: the ``class`` attribute is computed once
+    per column and cells of columns without attributes get no attribute
+    processing at all. The output renders identically to
+    ``TRow(TCell(...), ...)`` rows.
+
+    Args:
+        columns: Column definitions
+        values: One iterable of raw values per column (lists, tuples, arrays)
+
+    Returns:
+        List of ``<tr>`` FT nodes
+    """
+    cell_columns = []
+    for col, raw in zip(columns, values, strict=True):
+        formatted = col.format_all(raw)
+        cls = col.cell_cls
+        if cls:
+            cells = [
+                _node("td", value if type(value) is tuple else (value,), {"class": cls})
+                for value in formatted
+            ]
+        else:
+            cells = [
+                _node("td", value if type(value) is tuple else (value,), {}) for value in formatted
+            ]
+        cell_columns.append(cells)
+    return [_node("tr", cells, {}) for cells in zip(*cell_columns, strict=True)]
+
+
+def records_to_rows(
+    columns: Sequence[Column], records: Iterable[Any], key: str | int | None = None
+) -> list[FT]:
+    """Build body rows from records (mappings, tuples or objects).
+
+    Args:
+        columns: Column definitions
+        records: Records to display; all records must share one shape
+        key: Record field whose value keys each row (sets ``id=row_id(value)``)
+
+    Returns:
+        List of ``<tr>`` FT nodes
+    """
+    records = records if isinstance(records, Sequence) else list(records)
+    if not records or not columns:
+        return []
+    getter = _record_getter(records[0], [col.key for col in columns])
+    rows = columns_to_rows(columns, list(zip(*map(getter, records), strict=True)))
+    if key is not None:
+        for row, record in zip(rows, records, strict=True):
+            row.attrs["id"] = row_id(get_value(record, key))
+    return rows
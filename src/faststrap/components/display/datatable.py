@@ -0,0 +1,327 @@
+"""Server-side DataTable with HTMX sorting, filtering and pagination."""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Protocol
+
+from fasthtml.common import A, Div, Form, Small, Span, Tbody, Td, Th, Thead, Tr
+from fasthtml.common import Input as FTInput
+
+from ...core.registry import register
+from ..navigation.pagination import Pagination, page_url
+from .columns import Column, as_columns, get_value, records_to_rows
+from .table import Table
+
+
+class DataSource(Protocol):
+    """Query interface a DataTable reads from.
+
+    ``filter`` and ``sort`` return a new (narrowed or ordered) source, so
+    implementations can wrap lists, ORM query builders or SQL statements;
+    only the requested page is ever materialised through ``slice``.
+    """
+
+    def filter(self, query: str) -> DataSource:
+        """Return the records matching a free-text query."""
+        ...
+
+    def sort(self, key: str | int, descending: bool = False) -> DataSource:
+        """Return the records ordered by ``key``."""
+        ...
+
+    def count(self) -> int:
+        """Number of records."""
+        ...
+
+    def slice(self, start: int, stop: int) -> Iterable[Any]:
+        """Records ``start`` (inclusive) to ``stop`` (exclusive)."""
+        ...
+
+
+class ListSource:
+    """In-memory DataSource over a list of mappings, tuples or objects.
+
+    Args:
+        records: The records
+        search_keys: Keys matched by ``filter`` (default: every mapping value
+                     or tuple item, or the attributes of objects)
+
+    Example:
+        >>> DataTable(ListSource(users, search_keys=["name", "email"]), ["name", "email"], ...)
+    """
+
+    def __init__(self, records: Sequence[Any], search_keys: Sequence[str | int] | None = None):
+        self.records = records
+        self.search_keys = search_keys
+
+    def _values(self, record: Any) -> Iterable[Any]:
+        if self.search_keys is not None:
+            return (get_value(record, key) for key in self.search_keys)
+        if isinstance(record, Mapping):
+            return record.values()
+        if isinstance(record, (tuple, list)):
+            return record
+        return vars(record).values()
+
+    def filter(self, query: str) -> ListSource:
+        needle = query.casefold()
+        matches = [
+            record
+            for record in self.records
+            if any(
+                needle in str(value).casefold()
+                for value in self._values(record)
+                if value is not None
+            )
+        ]
+        return ListSource(matches, self.search_keys)
+
+    def sort(self, key: str | int, descending: bool = False) -> ListSource:
+        def sort_key(record: Any) -> tuple[bool, Any]:
+            value = get_value(record, key)
+            # Missing values sort last in either direction
+            return (value is None) != descending, value
+
+        def text_key(record: Any) -> tuple[bool, str]:
+            value = get_value(record, key)
+            return (value is None) != descending, "" if value is None else str(value)
+
+        try:
+            ordered = sorted(self.records, key=sort_key, reverse=descending)
+        except TypeError:  # mixed types: fall back to text order
+            ordered = sorted(self.records, key=text_key, reverse=descending)
+        return ListSource(ordered, self.search_keys)
+
+    def count(self) -> int:
+        return len(self.records)
+
+    def slice(self, start: int, stop: int) -> Sequence[Any]:
+        return self.records[start:stop]
+
+
+def query_view(
+    source: DataSource,
+    columns: Sequence[Column],
+    query: str = "",
+    sort: Any = None,
+    descending: bool = False,
+) -> tuple[DataSource, Column | None]:
+    """Filter and sort ``source`` the way ``DataTable`` displays it.
+
+    Only declared sortable columns are sorted by; ``sort`` may be the column
+    key or its string form (as read from a query string).
+
+    Returns:
+        The narrowed source and the sorted column (None when unsorted)
+    """
+    sortable = [col for col in columns if col.sortable]
+    sort_col = next((col for col in sortable if col.key == sort), None) or next(
+        (col for col in sortable if sort is not None and str(col.key) == str(sort)), None
+    )
+    view = source
+    if query:
+        view = view.filter(query)
+    if sort_col is not None:
+        view = view.sort(sort_col.key, descending)
+    return view, sort_col
+
+
+def _int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@register(category="display")
+def DataTable(
+    source: DataSource,
+    columns: Sequence[Column | str | int],
+    endpoint: str,
+    request: Any = None,
+    page: int | None = None,
+    per_page: int = 25,
+    sort: str | int | None = None,
+    descending: bool = False,
+    query: str = "",
+    table_id: str = "datatable",
+    searchable: bool = True,
+    search_placeholder: str = "Search...",
+    empty_message: str = "No matching records",
+    partial: bool | None = None,
+    **kwargs: Any,
+) -> Div | tuple[Any, ...]:
+    """Server-side data table with HTMX sorting, filtering and pagination.
+
+    Only the requested page is read from ``source``. Header clicks, the
+    search box and pager links issue ``hx-get`` requests to ``endpoint``;
+    the same handler then returns just the new ``<tbody>`` and pager (and the
+    header row when the sort changed) as a partial response.
+
+    Args:
+        source: DataSource to read from (e.g. ``ListSource(records)``)
+        columns: ``Column`` definitions or plain keys
+        endpoint: URL of the handler rendering this table
+        request: Starlette request; page, sort, direction and query are read
+                 from its query string and partial responses are detected
+                 from the HTMX headers
+        page: Current page (1-indexed, overrides the request)
+        per_page: Rows per page
+        sort: Key of the sorted column (overrides the request)
+        descending: Sort direction (used with ``sort``)
+        query: Filter text (overrides the request)
+        table_id: Base ID for the table and its parts
+        searchable: Show the filter box
+        search_placeholder: Placeholder of the filter box
+        empty_message: Text shown when no records match
+        partial: Force a full (False) or partial (True) render
+        **kwargs: Table options (striped, hover, small, ...) and HTML attributes
+
+    Returns:
+        Div with the full table, or a tuple of fragments for partial requests
+
+    Example:
+        >>> @app.get("/users")
+        ... def users(request):
+        ...     return DataTable(
+        ...         ListSource(USERS),
+        ...         [Column("name"), Column("email"), Column("age", cls="text-end")],
+        ...         endpoint="/users",
+        ...         request=request,
+        ...         striped=True,
+        ...     )
+    """
+    cols = as_columns(columns)
+    sortable = {col.key for col in cols if col.sortable}
+    ids = {part: f"{table_id}-{part}" for part in ("head", "body", "pager", "state", "search")}
+
+    # ---- Resolve state from the request and explicit arguments -------------
+    params: Mapping[str, Any] = getattr(request, "query_params", None) or {}
+    headers: Mapping[str, Any] = getattr(request, "headers", None) or {}
+
+    c_query = query or str(params.get("q", "")).strip()
+    c_sort: Any = sort
+    c_descending = descending
+    sort_changed = False
+    if c_sort is None:
+        c_sort = params.get("sort") or None
+        c_descending = params.get("dir") == "desc"
+        clicked = params.get("sort_by")
+        if clicked:
+            # Clicking the sorted column flips the direction, others sort ascending
+            c_descending = not c_descending if clicked == str(c_sort) else False
+            c_sort = clicked
+            sort_changed = True
+    view, sort_col = query_view(source, cols, c_query, c_sort, c_descending)
+
+    total = view.count()
+    total_pages = max(1, math.ceil(total / per_page))
+    c_page = min(max(1, page if page is not None else _int(params.get("page"), 1)), total_pages)
+    start = (c_page - 1) * per_page
+    records = view.slice(start, start + per_page)
+
+    if partial is None:
+        partial = bool(headers.get("hx-request")) and headers.get("hx-target") == ids["body"]
+
+    # ---- Shared HTMX request settings ---------------------------------------
+    include = f"#{ids['state']}" + (f", #{ids['search']}" if searchable else "")
+    hx = {
+        "hx_target": f"#{ids['body']}",
+        "hx_swap": "outerHTML",
+        "hx_include": include,
+    }
+    sort_key = sort_col.key if sort_col is not None else None
+
+    # ---- Parts ----------------------------------------------------------------
+    rows = records_to_rows(cols, records)
+    if not rows:
+        rows = [
+            Tr(Td(empty_message, colspan=str(len(cols)), cls="text-center text-body-secondary"))
+        ]
+    body = Tbody(*rows, id=ids["body"])
+
+    def header_cell(col: Column) -> Th:
+        if col.key not in sortable:
+            return Th(col.label, scope="col", cls=col.header_cls)
+        active = col.key == sort_key
+        indicator = (" ▼" if c_descending else " ▲") if active else ""
+        href_params = {"sort": col.key, "dir": "desc" if active and not c_descending else "asc"}
+        if c_query:
+            href_params["q"] = c_query
+        link = A(
+            col.label,
+            Span(indicator, aria_hidden="true") if indicator else "",
+            href=page_url(endpoint, **href_params),
+            hx_get=endpoint,
+            hx_vals=json.dumps({"sort_by": str(col.key)}),
+            cls="text-reset text-decoration-none",
+            **hx,
+        )
+        aria_sort = ("descending" if c_descending else "ascending") if active else None
+        return Th(link, scope="col", cls=col.header_cls, aria_sort=aria_sort)
+
+    head = Thead(Tr(*[header_cell(col) for col in cols]), id=ids["head"])
+
+    first, last = start + 1, min(start + per_page, total)
+    summary = f"Showing {first:,}–{last:,} of {total:,}" if total else "No results"
+    state = Form(
+        FTInput(type="hidden", name="sort", value="" if sort_key is None else str(sort_key)),
+        FTInput(type="hidden", name="dir", value="desc" if c_descending else "asc"),
+        id=ids["state"],
+        cls="d-none",
+    )
+    # Page links carry the sort and filter, so they also work without HTMX
+    pager_url = page_url(
+        endpoint,
+        sort=sort_key,
+        dir=("desc" if c_descending else "asc") if sort_key is not None else None,
+        q=c_query or None,
+    )
+    pager = Div(
+        Small(summary, cls="text-body-secondary"),
+        Pagination(
+            c_page,
+            total_pages,
+            base_url=pager_url,
+            cls="mb-0",
+            hx_boost="true",
+            hx_push_url="false",
+            **hx,
+        ),
+        state,
+        id=ids["pager"],
+        cls="d-flex justify-content-between align-items-center gap-3",
+    )
+
+    if partial:
+        pager.attrs["hx-swap-oob"] = "true"
+        if sort_changed:
+            head.attrs["hx-swap-oob"] = "true"
+            return body, head, pager
+        return body, pager
+
+    parts: list[Any] = []
+    if searchable:
+        parts.append(
+            Div(
+                FTInput(
+                    type="search",
+                    name="q",
+                    value=c_query,
+                    placeholder=search_placeholder,
+                    id=ids["search"],
+                    cls="form-control",
+                    aria_label=search_placeholder,
+                    hx_get=endpoint,
+                    hx_trigger="input changed delay:300ms, search",
+                    **hx,
+                ),
+                cls="mb-3",
+            )
+        )
+    parts.append(Table(head, body, **kwargs))
+    parts.append(pager)
+    return Div(*parts, id=table_id, cls="faststrap-datatable")
@@ -5,9 +5,11 @@ from typing import Any
 from fasthtml.common import H4, Div, P
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...utils.attrs import convert_attrs
 
 
+@register(category="display")
 def EmptyState(
     icon: Any | None = None,
     title: str = "No data available",
@@ -0,0 +1,426 @@
+"""Streaming CSV, NDJSON and XLSX export of table data."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+import zipfile
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Literal
+from xml.sax.saxutils import escape
+
+from fastcore.xml import FT
+from fasthtml.common import A
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+
+from ...core.base import merge_classes
+from ...core.registry import register
+from ...utils.attrs import convert_attrs
+from ...utils.icons import icon_element
+from ..navigation.pagination import page_url
+from .columns import Column, _record_getter, as_columns
+from .datatable import DataSource, query_view
+
+ExportFormat = Literal["csv", "ndjson", "xlsx"]
+
+EXPORT_FORMATS: dict[str, tuple[str, str]] = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _plain(value: Any) -> Any:
+    """Text of formatter output that is markup (e.g. a ``Badge``)."""
+    if isinstance(value, FT):
+        return "".join(str(_plain(child)) for child in value.children)
+    if isinstance(value, (tuple, list)):
+        return "".join(str(_plain(child)) for child in value)
+    return value
+
+
+def _batches(source: DataSource | Iterable[Any], batch_size: int) -> Iterator[Sequence[Any]]:
+    """Read records one batch at a time (``slice`` for sources, chunks for iterables)."""
+    if hasattr(source, "slice") and hasattr(source, "count"):
+        total = source.count()  # type: ignore[union-attr]
+        for start in range(0, total, batch_size):
+            batch = source.slice(start, min(start + batch_size, total))  # type: ignore[union-attr]
+            yield batch if isinstance(batch, Sequence) else list(batch)
+        return
+    batch: list[Any] = []
+    for record in source:  # type: ignore[union-attr]
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_export_rows(
+    source: DataSource | Iterable[Any],
+    columns: Sequence[Column | str | int],
+    formatted: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[list[Any]]:
+    """Yield one list of cell values per record.
+
+    Args:
+        source: DataSource (read with ``slice``) or any iterable of records
+        columns: ``Column`` definitions or plain keys
+        formatted: Apply the column formatters (markup is reduced to its text)
+        batch_size: Records read from the source at a time
+
+    Yields:
+        Cell values of one record, in column order
+    """
+    cols = as_columns(columns)
+    keys = [col.key for col in cols]
+    getter = None
+    for batch in _batches(source, batch_size):
+        if not batch:
+            continue
+        if getter is None:
+            getter = _record_getter(batch[0], keys)
+        if not formatted:
+            for record in batch:
+                yield list(getter(record))
+            continue
+        # Format column by column so compiled formatters work on whole batches
+        raw = list(zip(*map(getter, batch), strict=True))
+        cells = [map(_plain, col.format_all(values)) for col, values in zip(cols, raw, strict=True)]
+        yield from map(list, zip(*cells, strict=True))
+
+
+def _csv_chunks(header: list[str], rows: Iterator[list[Any]], batch_size: int) -> Iterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(header)
+    for i, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if i % batch_size == 0:
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue().encode()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def _ndjson_chunks(
+    header: list[str], rows: Iterator[list[Any]], batch_size: int
+) -> Iterator[bytes]:
+    lines: list[str] = []
+    for row in rows:
+        lines.append(
+            json.dumps(
+                dict(zip(header, row, strict=True)), default=_json_default, ensure_ascii=False
+            )
+        )
+        if len(lines) >= batch_size:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+# ---- XLSX ------------------------------------------------------------------------
+# A minimal SpreadsheetML package: one worksheet with inline strings, written
+# through an unseekable zip stream so rows are compressed and sent as they come.
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+        'relationships/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+        'relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        "</Relationships>"
+    ),
+}
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+
+# Characters XML 1.0 does not allow (other than tab, newline and carriage return)
+_XML_INVALID = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+
+def _xlsx_cell(value: Any) -> str:
+    if value is None or value == "":
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, Decimal)) or (isinstance(value, float) and math.isfinite(value)):
+        return f"<c><v>{value}</v></c>"
+    text = escape(str(value).translate(_XML_INVALID))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+class _Pipe:
+    """Write-only, unseekable file object collecting what ``zipfile`` writes."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _xlsx_chunks(
+    header: list[str], rows: Iterator[list[Any]], batch_size: int, sheet_name: str
+) -> Iterator[bytes]:
+    pipe = _Pipe()
+    with zipfile.ZipFile(pipe, "w", compression=zipfile.ZIP_DEFLATED) as package:  # type: ignore[arg-type]
+        for name, xml in _XLSX_PARTS.items():
+            package.writestr(name, xml)
+        package.writestr("xl/workbook.xml", _XLSX_WORKBOOK.format(name=escape(sheet_name[:31])))
+        with package.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                b"<sheetData>"
+            )
+            lines = ["<row>" + "".join(map(_xlsx_cell, header)) + "</row>"]
+            for row in rows:
+                lines.append("<row>" + "".join(map(_xlsx_cell, row)) + "</row>")
+                if len(lines) >= batch_size:
+                    sheet.write("".join(lines).encode())
+                    lines.clear()
+                    chunk = pipe.drain()
+                    if chunk:
+                        yield chunk
+            sheet.write(("".join(lines) + "</sheetData></worksheet>").encode())
+    yield pipe.drain()
+
+
+def iter_export(
+    source: DataSource | Iterable[Any],
+    columns: Sequence[Column | str | int],
+    format: ExportFormat = "csv",
+    formatted: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    sheet_name: str = "Sheet1",
+) -> Iterator[bytes]:
+    """Encode records as CSV, NDJSON or XLSX, one batch of rows at a time.
+
+    Records are read from ``source`` in batches of ``batch_size`` and each
+    batch is encoded and yielded before the next one is read, so memory use
+    is bounded by the batch size rather than the size of the export.
+
+    Args:
+        source: DataSource (read with ``slice``) or any iterable of records,
+                e.g. a database cursor
+        columns: ``Column`` definitions or plain keys; labels become the
+                 header row (CSV/XLSX) or object keys (NDJSON)
+        format: ``"csv"``, ``"ndjson"`` or ``"xlsx"``
+        formatted: Apply the column formatters; with False the raw values are
+                   exported (numbers stay numeric in NDJSON and XLSX)
+        batch_size: Records read and encoded at a time
+        sheet_name: Worksheet name (XLSX)
+
+    Yields:
+        Encoded chunks of the file
+
+    Raises:
+        ValueError: If ``format`` is not supported
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}, got {format!r}")
+    cols = as_columns(columns)
+    header = [col.label for col in cols]
+    rows = iter_export_rows(source, cols, formatted=formatted, batch_size=batch_size)
+    if format == "csv":
+        return _csv_chunks(header, rows, batch_size)
+    if format == "ndjson":
+        return _ndjson_chunks(header, rows, batch_size)
+    return _xlsx_chunks(header, rows, batch_size, sheet_name)
+
+
+def export_response(
+    source: DataSource | Iterable[Any],
+    columns: Sequence[Column | str | int],
+    format: ExportFormat | None = None,
+    request: Any = None,
+    filename: str = "export",
+    query: str | None = None,
+    sort: str | int | None = None,
+    descending: bool | None = None,
+    formatted: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Response:
+    """Stream a table export as a file download.
+
+    When ``source`` is a DataSource, the filter text and sort order are read
+    from the request's query string (``q``, ``sort``, ``dir``), exactly like
+    ``DataTable``, so the export contains the rows the user is looking at.
+    Unlike the table, every matching row is exported, read in batches.
+
+    Args:
+        source: DataSource (e.g. ``ListSource``) or any iterable of records
+        columns: ``Column`` definitions or plain keys (usually the table's)
+        format: ``"csv"``, ``"ndjson"`` or ``"xlsx"`` (default: the request's
+                ``format`` parameter, else CSV)
+        request: Starlette request to read the format, filter and sort from
+        filename: Download name without extension
+        query: Filter text (overrides the request)
+        sort: Key of the sorted column (overrides the request)
+        descending: Sort direction (overrides the request)
+        formatted: Apply the column formatters
+        batch_size: Records read and encoded at a time
+
+    Returns:
+        StreamingResponse with a ``Content-Disposition: attachment`` header, or
+        a 400 response if the request asks for an unsupported format
+
+    Raises:
+        ValueError: If the ``format`` argument is not supported
+
+    Example:
+        >>> COLUMNS = [Column("name"), Column("joined", formatter=lambda d: d.strftime("%b %Y"))]
+        >>> @app.get("/users/export")
+        ... def export_users(request):
+        ...     return export_response(ListSource(USERS), COLUMNS, request=request, filename="users")
+    """
+    params: Mapping[str, Any] = getattr(request, "query_params", None) or {}
+    if format is not None and format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}, got {format!r}")
+    c_format = format or params.get("format") or "csv"
+    if c_format not in EXPORT_FORMATS:
+        # A bad query string is the client's error, not a server error
+        return PlainTextResponse(
+            f"Unsupported export format {c_format!r}; use one of {', '.join(EXPORT_FORMATS)}",
+            status_code=400,
+        )
+    cols = as_columns(columns)
+
+    if hasattr(source, "filter") and hasattr(source, "sort"):
+        c_query = query if query is not None else str(params.get("q", "")).strip()
+        c_sort = sort if sort is not None else params.get("sort") or None
+        c_descending = descending if descending is not None else params.get("dir") == "desc"
+        source, _ = query_view(source, cols, c_query, c_sort, c_descending)  # type: ignore[arg-type]
+
+    media_type, extension = EXPORT_FORMATS[c_format]
+    return StreamingResponse(
+        iter_export(source, cols, c_format, formatted=formatted, batch_size=batch_size),  # type: ignore[arg-type]
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'},
+    )
+
+
+# Copies the table's current filter and sort into the link just before it is followed
+_SYNC_STATE = (
+    "const u = new URL(this.href, location.href);"
+    " const s = document.getElementById('{table_id}-state');"
+    " if (s) for (const [k, v] of new FormData(s)) u.searchParams.set(k, v);"
+    " const q = document.getElementById('{table_id}-search');"
+    " if (q) u.searchParams.set('q', q.value);"
+    " this.href = u.href;"
+)
+
+
+@register(category="display")
+def ExportButton(
+    endpoint: str,
+    format: ExportFormat = "csv",
+    label: str | None = None,
+    table_id: str | None = None,
+    request: Any = None,
+    variant: str = "outline-secondary",
+    size: str | None = "sm",
+    icon: str | None = "download",
+    **kwargs: Any,
+) -> A:
+    """Download link for an export endpoint, wired to a DataTable's state.
+
+    The link carries the filter text and sort order of the current request
+    and, when ``table_id`` is given, picks up the table's live state (after
+    HTMX sorting or searching) when clicked.
+
+    Args:
+        endpoint: URL of the handler returning ``export_response(...)``
+        format: ``"csv"``, ``"ndjson"`` or ``"xlsx"``
+        label: Button text (default: "Export CSV", ...)
+        table_id: ``table_id`` of the DataTable whose filter and sort to follow
+        request: Starlette request whose ``q``/``sort``/``dir`` are copied
+        variant: Bootstrap button variant (``outline-*`` for outline buttons)
+        size: Button size (sm, lg or None)
+        icon: Bootstrap icon name (None for no icon)
+        **kwargs: Additional HTML attributes
+
+    Returns:
+        A styled as a button
+
+    Raises:
+        ValueError: If ``format`` is not supported
+
+    Example:
+        >>> Div(
+        ...     ExportButton("/users/export", table_id="users", request=request),
+        ...     ExportButton("/users/export", "xlsx", table_id="users", request=request),
+        ...     DataTable(..., table_id="users", request=request),
+        ... )
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}, got {format!r}")
+    params: Mapping[str, Any] = getattr(request, "query_params", None) or {}
+    state = {key: params.get(key) or None for key in ("q", "sort", "dir")}
+    href = page_url(endpoint, format=format, **state)
+
+    classes = ["btn", f"btn-{variant}"]
+    if size:
+        classes.append(f"btn-{size}")
+    user_cls = kwargs.pop("cls", "")
+    attrs: dict[str, Any] = {"href": href, "cls": merge_classes(" ".join(classes), user_cls)}
+    attrs["download"] = True
+    if table_id:
+        attrs["onclick"] = _SYNC_STATE.replace("{table_id}", table_id)
+    attrs.update(convert_attrs(kwargs))
+
+    text = label or f"Export {format.upper()}"
+    if icon:
+        return A(icon_element(icon, f"bi bi-{icon} me-1", aria_hidden="true"), text, **attrs)
+    return A(text, **attrs)
@@ -8,9 +8,11 @@ from fasthtml.common import Figcaption, Img
 from fasthtml.common import Figure as FTFigure
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...utils.attrs import convert_attrs
 
 
+@register(category="display")
 def Figure(
     src: str,
     caption: str | Any | None = None,
@@ -0,0 +1,430 @@
+"""Precompiled cell formatters for numbers, currencies, dates and labels.
+
+A formatter compiles its format spec once (into bound ``str.format``
+methods or a ``strftime`` pattern) and formats a whole column with
+:meth:`CellFormat.batch`. The data-driven table builders (``DataTable``,
+``VirtualTable``, ``Table.from_records`` ...) call ``batch`` once per column
+instead of the formatter once per cell.
+
+    >>> from faststrap import formats
+    >>> Column("price", formatter=formats.currency("$"))
+    >>> Column("share", formatter=formats.percent(1))
+    >>> Column("created", formatter=formats.date_format("%d %b %Y"))
+    >>> Column("status", formatter=formats.labels({"ok": "Healthy", "err": "Failing"}))
+    >>> Column("total", formatter=",.2f")  # a format spec string is compiled too
+
+NumPy and pandas columns are formatted per distinct value: ``numpy.unique``
+finds the distinct values, each is formatted once and the texts are scattered
+back with one fancy-indexing step and a single ``tolist()`` call. Lists
+memoize distinct values only where repeats are the norm (dates, statuses) or
+with ``cache=True``. NumPy is only imported when such a column is formatted.
+"""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+from datetime import date, datetime, timezone
+from typing import Any
+
+_DATE_DIRECTIVE = re.compile(r"%[a-zA-Z]")
+
+
+def _is_array(values: Any) -> bool:
+    """Whether ``values`` is a NumPy array or pandas Series/Index."""
+    return hasattr(values, "dtype") and type(values).__module__.split(".")[0] in (
+        "numpy",
+        "pandas",
+    )
+
+
+def _is_pandas_na(value: Any) -> bool:
+    """Whether ``value`` is ``pandas.NA`` (checked without importing pandas)."""
+    return type(value).__name__ == "NAType" and type(value).__module__.startswith("pandas")
+
+
+def _is_missing(value: Any) -> bool:
+    """Whether ``value`` is None, NaN, NaT or ``pandas.NA``."""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except (TypeError, ValueError):  # pandas.NA, arrays: no single truth value
+        return _is_pandas_na(value)
+
+
+class CellFormat(ABC):
+    """Base class of compiled column formatters.
+
+    Subclasses implement ``_format`` for a single, non-missing value. A
+    formatter is called with one value like any formatter function, and
+    :meth:`batch` formats a whole column.
+
+    Args:
+        na: Text for missing values (None, NaN, NaT, ``pandas.NA``)
+        cache: Format each distinct value once: ``True`` for lists and
+               NumPy/pandas columns, ``None`` for NumPy/pandas columns only
+               (``numpy.unique`` is cheap there, a per-value memo on lists is
+               not), ``False`` never
+        cache_size: Number of distinct values remembered before the cache is
+                    reset
+    """
+
+    def __init__(self, na: str = "", cache: bool | None = None, cache_size: int = 4096):
+        self.na = na
+        self.cache = cache
+        self.cache_size = cache_size
+        self._memo: dict[Any, Any] = {}
+
+    def __call__(self, value: Any) -> Any:
+        # Inlined _is_missing: this runs once per cell
+        try:
+            if value is None or value != value:  # None, NaN, NaT
+                return self.na
+        except (TypeError, ValueError):  # pandas.NA, arrays: no single truth value
+            if _is_pandas_na(value):
+                return self.na
+        return self._format(value)
+
+    @abstractmethod
+    def _format(self, value: Any) -> Any:
+        """Format one non-missing value."""
+
+    def batch(self, values: Iterable[Any]) -> list[Any]:
+        """Format a whole column.
+
+        Args:
+            values: Column values (list, tuple, iterable, NumPy array or
+                    pandas Series)
+
+        Returns:
+            List of cell contents, one per value
+        """
+        if _is_array(values):
+            return self._batch_array(values)
+        if self.cache:
+            return self._batch_cached(values)
+        return list(map(self, values))
+
+    def _batch_cached(self, values: Iterable[Any]) -> list[Any]:
+        memo = self._memo
+        if len(memo) > self.cache_size:
+            memo.clear()
+        out: list[Any] = []
+        append = out.append
+        for value in values:
+            # Keyed by type too: 1, 1.0 and True are equal but format differently
+            key = (type(value), value)
+            try:
+                append(memo[key])
+            except KeyError:
+                text = memo[key] = self(value)
+                append(text)
+            except TypeError:  # unhashable
+                append(self(value))
+        return out
+
+    def _prepare(self, array: Any) -> Any:
+        """Vectorized conversion applied to NumPy input before ``tolist()``."""
+        return array
+
+    def _batch_array(self, values: Any) -> list[Any]:
+        import numpy as np
+
+        array = self._prepare(np.asarray(values))
+        if array.dtype.kind == "O" or array.ndim != 1:
+            return self._batch_cached(array.tolist()) if self.cache else list(map(self, array))
+        if self.cache is not False and array.size:
+            # Format each distinct value once, then scatter the texts
+            uniques, inverse = np.unique(array, return_inverse=True)
+            texts = np.empty(len(uniques), dtype=object)
+            texts[:] = list(map(self, uniques.tolist()))
+            return texts[inverse.reshape(-1)].tolist()
+        return list(map(self, array.tolist()))
+
+
+class NumberFormat(CellFormat):
+    """Numbers with fixed decimals, thousands separators and affixes.
+
+    Args:
+        decimals: Digits after the decimal point
+        thousands: Group thousands with commas
+        prefix: Text before the number (e.g. a currency symbol)
+        suffix: Text after the number (e.g. ``%``)
+        scale: Factor applied before formatting (100 for percentages)
+        na: Text for missing values
+        cache: Format each distinct value once (see :class:`CellFormat`)
+    """
+
+    def __init__(
+        self,
+        decimals: int = 0,
+        thousands: bool = True,
+        prefix: str = "",
+        suffix: str = "",
+        scale: float = 1,
+        na: str = "",
+        cache: bool | None = None,
+    ):
+        super().__init__(na=na, cache=cache)
+        self.scale = scale
+        spec = "{:" + ("," if thousands else "") + f".{decimals}f" + "}"
+        self._positive = (prefix + spec + suffix).format
+        # The sign goes before the prefix: -$5.00, not $-5.00
+        self._negative = ("-" + prefix + spec + suffix).format
+
+    def _format(self, value: Any) -> Any:
+        try:
+            if self.scale != 1:
+                value = value * self.scale
+            return self._negative(-value) if value < 0 else self._positive(value)
+        except (TypeError, ValueError):
+            return str(value)
+
+
+class SpecFormat(CellFormat):
+    """Values formatted with a Python format spec (``",.2f"``, ``"{:>8}"``).
+
+    Args:
+        spec: Format spec, with or without ``{:...}``
+        na: Text for missing values
+        cache: Format each distinct value once (see :class:`CellFormat`)
+    """
+
+    def __init__(self, spec: str, na: str = "", cache: bool | None = None):
+        super().__init__(na=na, cache=cache)
+        self._format_one = (spec if "{" in spec else "{:" + spec + "}").format
+
+    def _format(self, value: Any) -> Any:
+        try:
+            return self._format_one(value)
+        except (TypeError, ValueError):
+            return str(value)
+
+
+class DateFormat(CellFormat):
+    """Dates and datetimes formatted with a ``strftime`` pattern.
+
+    ISO 8601 strings are parsed first. Distinct values are cached by default.
+
+    Args:
+        pattern: ``strftime`` pattern
+        na: Text for missing values
+        cache: Remember the text of each distinct value
+    """
+
+    def __init__(self, pattern: str = "%Y-%m-%d", na: str = "", cache: bool = True):
+        super().__init__(na=na, cache=cache)
+        self.pattern = pattern
+
+    def _format(self, value: Any) -> Any:
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return value
+        try:
+            return value.strftime(self.pattern)
+        except AttributeError:
+            return str(value)
+
+    def _prepare(self, array: Any) -> Any:
+        # datetime64[ns].tolist() yields ints; microseconds yield datetimes
+        return array.astype("datetime64[us]") if array.dtype.kind == "M" else array
+
+
+_UNITS = (("minute", 60), ("hour", 3600), ("day", 86400))
+
+
+class RelativeTime(CellFormat):
+    """Datetimes relative to now ("5 minutes ago", "in 2 days").
+
+    Differences of ``max_days`` or more fall back to a ``strftime`` pattern.
+    The text of each (unit, count) pair is cached, so a column is formatted
+    with one clock read and one subtraction per value.
+
+    Args:
+        max_days: Age from which the absolute date is shown
+        fallback: ``strftime`` pattern for older values
+        now: Fixed reference time (default: the current time)
+        na: Text for missing values
+    """
+
+    def __init__(
+        self,
+        max_days: int = 30,
+        fallback: str = "%Y-%m-%d",
+        now: datetime | None = None,
+        na: str = "",
+    ):
+        super().__init__(na=na)
+        self.max_seconds = max_days * 86400
+        self.fallback = fallback
+        self.now = now
+        self._texts: dict[tuple[str, int], str] = {}
+
+    def _clock(self) -> tuple[datetime, datetime]:
+        if self.now is not None:
+            now = self.now
+            if now.tzinfo is None:
+                return now, now.replace(tzinfo=timezone.utc)
+            return now.astimezone(timezone.utc).replace(tzinfo=None), now
+        return datetime.now(), datetime.now(timezone.utc)
+
+    def _text(self, unit: str, count: int) -> str:
+        key = (unit, count)
+        text = self._texts.get(key)
+        if text is None:
+            amount = abs(count)
+            label = f"{amount} {unit}{'' if amount == 1 else 's'}"
+            text = self._texts[key] = f"in {label}" if count < 0 else f"{label} ago"
+        return text
+
+    def _relative(self, value: Any, naive_now: datetime, aware_now: datetime) -> Any:
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return value
+        if not isinstance(value, datetime):
+            if not isinstance(value, date):
+                return str(value)
+            value = datetime(value.year, value.month, value.day)
+        seconds = ((aware_now if value.tzinfo else naive_now) - value).total_seconds()
+        elapsed = abs(seconds)
+        if elapsed < 45:
+            return "just now"
+        if elapsed >= self.max_seconds:
+            return value.strftime(self.fallback)
+        unit, size = _UNITS[0]
+        for candidate, candidate_size in _UNITS[1:]:
+            if elapsed >= candidate_size * 0.9:
+                unit, size = candidate, candidate_size
+        count = max(1, round(elapsed / size))
+        return self._text(unit, count if seconds >= 0 else -count)
+
+    def _format(self, value: Any) -> Any:
+        return self._relative(value, *self._clock())
+
+    def batch(self, values: Iterable[Any]) -> list[Any]:
+        if _is_array(values):
+            import numpy as np
+
+            array = np.asarray(values)
+            if array.dtype.kind == "M":
+                array = array.astype("datetime64[us]")
+            values = array.tolist()
+        naive_now, aware_now = self._clock()
+        na = self.na
+        return [
+            na if _is_missing(value) else self._relative(value, naive_now, aware_now)
+            for value in values
+        ]
+
+
+class LabelFormat(CellFormat):
+    """Map values (statuses, enums, codes) to display labels.
+
+    Args:
+        mapping: Value -> label (labels may be components, e.g. ``Badge``)
+        default: Label for unmapped values (default: the value as text)
+        na: Text for missing values
+    """
+
+    def __init__(self, mapping: Mapping[Any, Any], default: Any = None, na: str = ""):
+        super().__init__(na=na, cache=True)
+        self.mapping = dict(mapping)
+        self.default = default
+
+    def _format(self, value: Any) -> Any:
+        try:
+            return self.mapping[value]
+        except (KeyError, TypeError):
+            return str(value) if self.default is None else self.default
+
+    def _batch_cached(self, values: Iterable[Any]) -> list[Any]:
+        # The mapping itself is the cache
+        mapping = self.mapping
+        out: list[Any] = []
+        append = out.append
+        for value in values:
+            try:
+                append(mapping[value])
+            except (KeyError, TypeError):
+                append(self(value))
+        return out
+
+
+def number(
+    decimals: int = 0,
+    thousands: bool = True,
+    prefix: str = "",
+    suffix: str = "",
+    na: str = "",
+    cache: bool | None = None,
+) -> NumberFormat:
+    """Number formatter: ``number(2)(1234.5) == "1,234.50"``.
+
+    Pass ``cache=True`` to also memoize repeated values in plain lists.
+    """
+    return NumberFormat(decimals, thousands, prefix, suffix, na=na, cache=cache)
+
+
+def percent(decimals: int = 1, na: str = "", cache: bool | None = None) -> NumberFormat:
+    """Fraction as percentage: ``percent(1)(0.256) == "25.6%"``."""
+    return NumberFormat(decimals, suffix="%", scale=100, na=na, cache=cache)
+
+
+def currency(
+    symbol: str = "$",
+    decimals: int = 2,
+    after: bool = False,
+    na: str = "",
+    cache: bool | None = None,
+) -> NumberFormat:
+    """Currency formatter: ``currency("$")(-5) == "-$5.00"``.
+
+    With ``after=True`` the symbol follows the amount, separated by a
+    non-breaking space (``5.00 €``).
+    """
+    if after:
+        return NumberFormat(decimals, suffix=f"\u00a0{symbol}", na=na, cache=cache)
+    return NumberFormat(decimals, prefix=symbol, na=na, cache=cache)
+
+
+def date_format(pattern: str = "%Y-%m-%d", na: str = "") -> DateFormat:
+    """Date/datetime formatter using a ``strftime`` pattern (cached per distinct value)."""
+    return DateFormat(pattern, na=na)
+
+
+def relative_time(
+    max_days: int = 30, fallback: str = "%Y-%m-%d", now: datetime | None = None, na: str = ""
+) -> RelativeTime:
+    """Relative time formatter ("3 hours ago"), falling back to a date after ``max_days``."""
+    return RelativeTime(max_days, fallback, now, na=na)
+
+
+def labels(mapping: Mapping[Any, Any], default: Any = None, na: str = "") -> LabelFormat:
+    """Value-to-label formatter for statuses and enums."""
+    return LabelFormat(mapping, default, na=na)
+
+
+def compile_format(spec: str | Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Compile a format spec string into a formatter.
+
+    Strings with ``strftime`` directives (``"%d %b %Y"``) become a
+    :class:`DateFormat`, others a Python format spec (``",.2f"``,
+    ``".1%"``, ``"{:>10}"``). Callables are returned unchanged.
+
+    Args:
+        spec: Format spec or formatter
+
+    Returns:
+        A formatter
+    """
+    if not isinstance(spec, str):
+        return spec
+    if _DATE_DIRECTIVE.search(spec):
+        return DateFormat(spec)
+    return SpecFormat(spec)
@@ -0,0 +1,288 @@
+"""Grouped table sections with subtotal and grand-total rows."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+from fastcore.xml import FT
+
+from ...core.ids import unique_id
+from .columns import Column, _node, _record_getter, records_to_rows
+
+Aggregate = str | Callable[[list[Any]], Any]
+
+AGGREGATES = ("sum", "count", "mean", "min", "max")
+
+
+class _Accumulator:
+    """Running aggregates of one group, updated once per record."""
+
+    __slots__ = ("count", "sums", "present", "mins", "maxs", "values")
+
+    def __init__(self, width: int):
+        self.count = 0
+        self.sums: list[Any] = [0] * width
+        # Non-None values per column: the divisor of "mean"
+        self.present: list[int] = [0] * width
+        self.mins: list[Any] = [None] * width
+        self.maxs: list[Any] = [None] * width
+        self.values: list[list[Any]] = [[] for _ in range(width)]
+
+    def add(self, row: Sequence[Any], kinds: Sequence[str]) -> None:
+        self.count += 1
+        for i, (kind, value) in enumerate(zip(kinds, row, strict=True)):
+            if kind == "custom":
+                self.values[i].append(value)
+            elif value is None or kind == "count":
+                continue
+            elif kind == "sum":
+                self.sums[i] += value
+            elif kind == "mean":
+                self.sums[i] += value
+                self.present[i] += 1
+            elif kind == "min":
+                if self.mins[i] is None or value < self.mins[i]:
+                    self.mins[i] = value
+            elif self.maxs[i] is None or value > self.maxs[i]:
+                self.maxs[i] = value
+
+    def result(self, keys: Sequence[Any], specs: Sequence[Aggregate]) -> dict[Any, Any]:
+        totals: dict[Any, Any] = {}
+        for i, (key, spec) in enumerate(zip(keys, specs, strict=True)):
+            if callable(spec):
+                totals[key] = spec(self.values[i])
+            elif spec == "count":
+                totals[key] = self.count
+            elif spec == "sum":
+                totals[key] = self.sums[i]
+            elif spec == "mean":
+                present = self.present[i]
+                totals[key] = self.sums[i] / present if present else None
+            elif spec == "min":
+                totals[key] = self.mins[i]
+            else:
+                totals[key] = self.maxs[i]
+        return totals
+
+
+class Group:
+    """One group of records and its aggregates.
+
+    Attributes:
+        key: Value of the group-by field (None for the root)
+        level: Nesting depth (0 for top-level groups, -1 for the root)
+        path: Keys from the top-level group down to this one
+        children: Subgroups (empty for the innermost level)
+        records: Records of an innermost group (empty otherwise)
+        count: Number of records in the group
+        totals: Aggregate values by column key
+    """
+
+    __slots__ = ("key", "level", "path", "children", "records", "count", "totals", "_acc", "_index")
+
+    def __init__(self, key: Any, level: int, path: tuple[Any, ...], width: int):
+        self.key = key
+        self.level = level
+        self.path = path
+        self.children: list[Group] = []
+        self.records: list[Any] = []
+        self.count = 0
+        self.totals: dict[Any, Any] = {}
+        self._acc = _Accumulator(width)
+        self._index: dict[Any, Group] = {}
+
+    def __repr__(self) -> str:
+        return f"Group({self.key!r}, count={self.count}, totals={self.totals!r})"
+
+    def _finish(self, keys: Sequence[Any], specs: Sequence[Aggregate], sort: bool) -> None:
+        self.count = self._acc.count
+        self.totals = self._acc.result(keys, specs)
+        self._acc = self._index = None  # type: ignore[assignment]
+        if sort:
+            self.children.sort(key=lambda g: (g.key is None, g.key))
+        for child in self.children:
+            child._finish(keys, specs, sort)
+
+
+def group_records(
+    records: Iterable[Any],
+    by: str | int | Sequence[str | int],
+    aggregates: Mapping[str | int, Aggregate] | None = None,
+    sort: bool = False,
+) -> Group:
+    """Group records and compute aggregates in a single pass.
+
+    Every record is read once: it is appended to its innermost group and
+    added to the running aggregates of that group, each enclosing group and
+    the grand total, so no level needs another pass over the data.
+
+    Args:
+        records: Records (mappings, tuples or objects)
+        by: Group-by field, or fields from the outermost to the innermost level
+        aggregates: Column key -> ``"sum"``, ``"count"``, ``"mean"``,
+                    ``"min"``, ``"max"`` or a function of the group's values
+        sort: Order groups by key (default: order of first appearance)
+
+    Returns:
+        The root group, whose ``totals`` are the grand totals and whose
+        ``children`` are the top-level groups
+
+    Raises:
+        ValueError: If ``by`` is empty or an aggregate name is unknown
+
+    Example:
+        >>> root = group_records(sales, ["region", "country"], {"revenue": "sum"})
+        >>> [(g.key, g.totals["revenue"]) for g in root.children]
+    """
+    levels = [by] if isinstance(by, (str, int)) else list(by)
+    if not levels:
+        raise ValueError("group_records needs at least one group-by field")
+    specs = dict(aggregates or {})
+    for spec in specs.values():
+        if not callable(spec) and spec not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate {spec!r} (use one of {', '.join(AGGREGATES)})")
+    agg_keys = list(specs)
+    agg_specs = list(specs.values())
+    kinds = ["custom" if callable(spec) else spec for spec in agg_specs]
+    width = len(agg_keys)
+
+    root = Group(None, -1, (), width)
+    key_getter = agg_getter = None
+    for record in records:
+        if key_getter is None:
+            key_getter = _record_getter(record, levels)
+            agg_getter = _record_getter(record, agg_keys) if agg_keys else None
+        values = agg_getter(record) if agg_getter is not None else ()
+        group = root
+        root._acc.add(values, kinds)
+        for level, key in enumerate(key_getter(record)):
+            child = group._index.get(key)
+            if child is None:
+                child = group._index[key] = Group(key, level, (*group.path, key), width)
+                group.children.append(child)
+            child._acc.add(values, kinds)
+            group = child
+        group.records.append(record)
+    root._finish(agg_keys, agg_specs, sort)
+    return root
+
+
+def _total_row(columns: Sequence[Column], totals: Mapping[Any, Any], label: str, cls: str) -> FT:
+    """Row with the formatted aggregates under their columns and ``label`` in front."""
+    cells = []
+    for i, col in enumerate(columns):
+        if col.key in totals:
+            content: Any = col.format(totals[col.key])
+        else:
+            content = label if i == 0 else ""
+        attrs = {"class": col.cell_cls} if col.cell_cls else {}
+        cells.append(_node("td", content if type(content) is tuple else (content,), attrs))
+    return _node("tr", tuple(cells), {"class": cls})
+
+
+def _group_label(group: Group, by: Sequence[str | int], columns: Sequence[Column]) -> Any:
+    field = by[group.level]
+    col = next((c for c in columns if c.key == field), None)
+    return col.format(group.key) if col is not None else ("" if group.key is None else group.key)
+
+
+def grouped_sections(
+    columns: Sequence[Column],
+    root: Group,
+    by: Sequence[str | int],
+    key: str | int | None = None,
+    collapsible: bool = False,
+    collapsed: bool = False,
+    subtotals: bool = True,
+    total_label: str | None = "Total",
+) -> list[FT]:
+    """Render grouped records as ``<tbody>`` sections plus a grand-total ``<tfoot>``.
+
+    Each group gets a header row (group label and record count), its rows
+    and a subtotal row. Top-level groups start with a ``table-group-divider``.
+    With ``collapsible`` the rows of each innermost group sit in their own
+    ``<tbody>`` carrying Bootstrap's collapse classes, toggled from the
+    header; subtotals stay visible while a group is collapsed.
+
+    Args:
+        columns: Column definitions
+        root: Result of :func:`group_records`
+        by: The group-by fields passed to :func:`group_records`
+        key: Record field used as row key (see ``TRow(key=...)``)
+        collapsible: Let users collapse the rows of innermost groups
+        collapsed: Start with groups collapsed (with ``collapsible``)
+        subtotals: Render a subtotal row after each group
+        total_label: Label of the grand-total row (None to omit it)
+
+    Returns:
+        List of ``<tbody>`` nodes followed by the ``<tfoot>`` (if any)
+    """
+    width = str(len(columns))
+    sections: list[FT] = []
+
+    def header(group: Group, target: str | None) -> FT:
+        label = _group_label(group, by, columns)
+        count = _node("span", (f" ({group.count:,})",), {"class": "text-body-secondary fw-normal"})
+        if target is None:
+            content: tuple[Any, ...] = (label, count)
+        else:
+            content = (
+                _node(
+                    "button",
+                    (label,),
+                    {
+                        "type": "button",
+                        "class": "btn btn-link p-0 text-reset text-decoration-none fw-semibold"
+                        + (" collapsed" if collapsed else ""),
+                        "data-bs-toggle": "collapse",
+                        "data-bs-target": f"#{target}",
+                        "aria-expanded": "false" if collapsed else "true",
+                        "aria-controls": target,
+                    },
+                ),
+                count,
+            )
+        attrs = {"colspan": width, "scope": "rowgroup"}
+        if group.level:
+            attrs["style"] = f"padding-left: {0.5 + group.level * 1.25}rem;"
+        return _node("tr", (_node("th", content, attrs),), {"class": "faststrap-group-header"})
+
+    def subtotal(group: Group) -> FT:
+        label = _group_label(group, by, columns)
+        return _total_row(
+            columns, group.totals, f"{label} subtotal", "faststrap-subtotal fw-semibold"
+        )
+
+    def render(group: Group) -> None:
+        opening = {"class": "table-group-divider"} if group.level == 0 else {}
+        if group.children:
+            sections.append(_node("tbody", (header(group, None),), opening))
+            for child in group.children:
+                render(child)
+            if subtotals:
+                sections.append(_node("tbody", (subtotal(group),), {}))
+            return
+        rows = records_to_rows(columns, group.records, key=key)
+        if not collapsible:
+            tail = [subtotal(group)] if subtotals else []
+            sections.append(_node("tbody", (header(group, None), *rows, *tail), opening))
+            return
+        target = unique_id("group", *group.path)
+        sections.append(_node("tbody", (header(group, target),), opening))
+        sections.append(
+            _node(
+                "tbody",
+                tuple(rows),
+                {"id": target, "class": "collapse" if collapsed else "collapse show"},
+            )
+        )
+        if subtotals:
+            sections.append(_node("tbody", (subtotal(group),), {}))
+
+    for group in root.children:
+        render(group)
+    if total_label is not None:
+        grand = _total_row(columns, root.totals, total_label, "faststrap-total fw-bold")
+        sections.append(_node("tfoot", (grand,), {}))
+    return sections
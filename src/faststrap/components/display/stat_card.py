@@ -4,10 +4,12 @@ from typing import Any, Literal
 
 from fasthtml.common import H3, Div, P, Span
 
+from ...core.registry import register
 from ...core.types import VariantType
 from .card import Card
 
 
+@register(category="display")
 def StatCard(
     title: str,
     value: str | int | float,
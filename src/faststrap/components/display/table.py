@@ -2,20 +2,103 @@
 
 from __future__ import annotations
 
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from typing import Any, Literal
 
+from fastcore.xml import FT
 from fasthtml.common import Div, Tbody, Td, Th, Thead, Tr
 from fasthtml.common import Table as FTTable
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...utils.attrs import convert_attrs
+from .columns import (
+    Column,
+    TableVariantType,
+    as_columns,
+    columns_to_rows,
+    header_row,
+    records_to_rows,
+    row_id,
+)
+from .grouping import Aggregate, group_records, grouped_sections
 
-# Table-specific types
-TableVariantType = Literal[
-    "primary", "secondary", "success", "danger", "warning", "info", "light", "dark"
-]
+RowMapper = Callable[[Any], Any]
 
 
+def _default_row_mapper(record: Any) -> Tr:
+    """Map a record (mapping or sequence of values) to a plain table row."""
+    values = record.values() if isinstance(record, Mapping) else record
+    return Tr(*[Td(value) for value in values])
+
+
+class RowSource:
+    """Lazily mapped table rows from a sync or async iterable of records.
+
+    Created by ``TBody(rows=...)``. Records are pulled and mapped to rows one
+    batch at a time, so streaming renderers (``iter_html``, ``aiter_html``,
+    ``stream_page``) keep memory flat regardless of the number of rows.
+
+    Rendering with ``to_xml`` materialises all rows (sync sources only).
+    """
+
+    def __init__(
+        self,
+        records: Iterable[Any] | AsyncIterable[Any],
+        row_mapper: RowMapper | None = None,
+        batch_size: int = 500,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.records = records
+        self.row_mapper = row_mapper or _default_row_mapper
+        self.batch_size = batch_size
+        self.is_async = not isinstance(records, Iterable) and isinstance(records, AsyncIterable)
+
+    def __ft_batches__(self) -> Iterator[list[Any]]:
+        """Yield lists of mapped rows, ``batch_size`` records at a time."""
+        if self.is_async:
+            raise TypeError("Async row sources can only be rendered with aiter_html()")
+        mapper, size = self.row_mapper, self.batch_size
+        batch: list[Any] = []
+        for record in self.records:  # type: ignore[union-attr]
+            batch.append(mapper(record))
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def __ft_abatches__(self) -> AsyncIterator[list[Any]]:
+        """Async version of ``__ft_batches__``; accepts sync sources too."""
+        if not self.is_async:
+            for batch in self.__ft_batches__():
+                yield batch
+            return
+        mapper, size = self.row_mapper, self.batch_size
+        batch: list[Any] = []
+        async for record in self.records:  # type: ignore[union-attr]
+            batch.append(mapper(record))
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def __ft__(self) -> tuple[Any, ...]:
+        """Materialise all rows for the non-streaming ``to_xml`` path."""
+        return tuple(row for batch in self.__ft_batches__() for row in batch)
+
+
+@register(category="display")
 def Table(
     *children: Any,
     striped: bool = False,
@@ -27,6 +110,9 @@ def Table(
     variant: TableVariantType | None = None,
     responsive: bool | Literal["sm", "md", "lg", "xl", "xxl"] = False,
     caption_top: bool = False,
+    rows: Iterable[Any] | AsyncIterable[Any] | None = None,
+    row_mapper: RowMapper | None = None,
+    batch_size: int = 500,
     **kwargs: Any,
 ) -> FTTable | Div:
     """Bootstrap Table component.
@@ -46,6 +132,10 @@ def Table(
         responsive: Make table horizontally scrollable. True for all breakpoints,
                    or specify breakpoint (sm, md, lg, xl, xxl)
         caption_top: Place caption at top of table
+        rows: Sync or async iterable of records, rendered lazily in a
+              trailing TBody (see ``TBody``)
+        row_mapper: Function mapping one record to a TRow
+        batch_size: Records mapped and flushed per batch when streaming
         **kwargs: Additional HTML attributes (cls, id, hx-*, data-*, etc.)
 
     Returns:
@@ -72,6 +162,13 @@ def Table(
         Responsive at breakpoint:
         >>> Table(..., responsive="lg")
 
+        Streaming rows from an iterator:
+        >>> Table(THead(...), rows=records, row_mapper=to_row, batch_size=1000)
+
+        Bulk construction from data (see ``from_records``, ``from_columns``,
+        ``from_arrays``):
+        >>> Table.from_records(users, ["name", "email"], striped=True)
+
     See Also:
         Bootstrap docs: https://getbootstrap.com/docs/5.3/content/tables/
     """
@@ -110,6 +207,9 @@ def Table(
     attrs: dict[str, Any] = {"cls": all_classes}
     attrs.update(convert_attrs(kwargs))
 
+    if rows is not None:
+        children = (*children, TBody(rows=rows, row_mapper=row_mapper, batch_size=batch_size))
+
     # Create table
     table = FTTable(*children, **attrs)
 
@@ -124,6 +224,7 @@ def Table(
     return table
 
 
+@register(category="display")
 def THead(
     *children: Any,
     variant: TableVariantType | None = None,
@@ -161,10 +262,14 @@ def THead(
     return Thead(*children, **attrs)
 
 
+@register(category="display")
 def TBody(
     *children: Any,
     variant: TableVariantType | None = None,
     divider: bool = False,
+    rows: Iterable[Any] | AsyncIterable[Any] | None = None,
+    row_mapper: RowMapper | None = None,
+    batch_size: int = 500,
     **kwargs: Any,
 ) -> Tbody:
     """Bootstrap table body section.
@@ -173,6 +278,11 @@ def TBody(
         *children: Body rows (TRow elements)
         variant: Bootstrap color variant for body background
         divider: Add a thicker border on top (table-group-divider)
+        rows: Sync or async iterable of records (lists, dicts, DB cursor rows)
+              rendered lazily after ``children``
+        row_mapper: Function mapping one record to a TRow (defaults to one
+                    plain cell per value)
+        batch_size: Records mapped and flushed per batch when streaming
         **kwargs: Additional HTML attributes
 
     Returns:
@@ -184,7 +294,17 @@ def TBody(
         ...     TRow(TCell("Bob"), TCell("bob@example.com")),
         ...     divider=True
         ... )
+
+        Lazy rows from an async DB cursor (use with ``stream_page``):
+        >>> TBody(
+        ...     rows=cursor,
+        ...     row_mapper=lambda r: TRow(TCell(r["name"]), TCell(r["email"])),
+        ...     batch_size=1000,
+        ... )
     """
+    if rows is not None:
+        children = (*children, RowSource(rows, row_mapper, batch_size))
+
     classes = []
 
     if variant:
@@ -204,10 +324,12 @@ def TBody(
     return Tbody(*children, **attrs)
 
 
+@register(category="display")
 def TRow(
     *children: Any,
     variant: TableVariantType | None = None,
     active: bool = False,
+    key: Any = None,
     **kwargs: Any,
 ) -> Tr:
     """Bootstrap table row.
@@ -216,6 +338,8 @@ def TRow(
         *children: Row cells (TCell elements)
         variant: Bootstrap color variant for row background
         active: Highlight row as selected/active
+        key: Stable identity of the row (e.g. a primary key); sets the row
+             ``id`` (``row_id(key)``) so ``TableSnapshot`` can update it in place
         **kwargs: Additional HTML attributes
 
     Returns:
@@ -224,6 +348,7 @@ def TRow(
     Example:
         >>> TRow(TCell("Data 1"), TCell("Data 2"), variant="success")
         >>> TRow(TCell("Selected"), TCell("Row"), active=True)
+        >>> TRow(TCell("Alice"), TCell("online"), key=user.id)
     """
     classes = []
 
@@ -239,11 +364,14 @@ def TRow(
     attrs: dict[str, Any] = {}
     if all_classes:
         attrs["cls"] = all_classes
+    if key is not None:
+        attrs["id"] = row_id(key)
     attrs.update(convert_attrs(kwargs))
 
     return Tr(*children, **attrs)
 
 
+@register(category="display")
 def TCell(
     *children: Any,
     header: bool = False,
@@ -303,3 +431,217 @@ def TCell(
     if header:
         return Th(*children, **attrs)
     return Td(*children, **attrs)
+
+
+def _to_list(values: Any, col: Column | None = None) -> Any:
+    """Convert NumPy/pandas arrays to lists of Python scalars (fast C iteration).
+
+    Columns with a compiled formatter receive the array itself, which
+    formats it vectorized.
+    """
+    if col is not None and col.batched:
+        return values
+    tolist = getattr(values, "tolist", None)
+    return tolist() if callable(tolist) else values
+
+
+def _bulk_table(
+    cols: list[Column], rows: list[FT], header: bool, kwargs: dict[str, Any]
+) -> FTTable | Div:
+    body = FT("tbody", tuple(rows), {})
+    if header:
+        return Table(FT("thead", (header_row(cols),), {}), body, **kwargs)
+    return Table(body, **kwargs)
+
+
+def from_records(
+    records: Iterable[Any],
+    columns: Sequence[Column | str | int] | None = None,
+    header: bool = True,
+    key: str | int | None = None,
+    **kwargs: Any,
+) -> FTTable | Div:
+    """Build a table from a list of dicts, tuples or objects.
+
+    Rows are emitted in one tight loop: each column is formatted in a single
+    pass and cells skip the per-cell ``merge_classes``/``convert_attrs`` work
+    of ``TCell`` (column classes are computed once). The HTML is identical to
+    the equivalent ``TRow``/``TCell`` tree.
+
+    Args:
+        records: Records to display (all of the same shape)
+        columns: ``Column`` definitions or keys (default: keys of the first
+                 mapping, or every index of the first tuple)
+        header: Render a header row from the column labels
+        key: Record field used as row key (see ``TRow(key=...)``)
+        **kwargs: ``Table`` options (striped, hover, responsive, ...)
+
+    Returns:
+        FastHTML Table element, wrapped in Div if responsive
+
+    Example:
+        >>> Table.from_records(
+        ...     users,
+        ...     [Column("name"), Column("balance", formatter="${:,.2f}".format, cls="text-end")],
+        ...     striped=True,
+        ... )
+    """
+    records = records if isinstance(records, Sequence) else list(records)
+    if columns is None:
+        first = records[0] if records else {}
+        columns = list(first.keys()) if isinstance(first, Mapping) else list(range(len(first)))
+    cols = as_columns(columns)
+    return _bulk_table(cols, records_to_rows(cols, records, key=key), header, kwargs)
+
+
+def from_columns(
+    data: Mapping[str, Any],
+    columns: Sequence[Column | str] | None = None,
+    header: bool = True,
+    **kwargs: Any,
+) -> FTTable | Div:
+    """Build a table from column-oriented data.
+
+    Accepts a dict of lists or arrays (``{"name": [...], "age": [...]}``) or
+    a pandas DataFrame. NumPy/pandas columns are converted with ``tolist()``
+    before formatting, unless the column has a compiled formatter from
+    ``faststrap.formats``, which formats the array directly.
+
+    Args:
+        data: Mapping of column key to values
+        columns: ``Column`` definitions or keys (default: every key of ``data``)
+        header: Render a header row from the column labels
+        **kwargs: ``Table`` options (striped, hover, responsive, ...)
+
+    Returns:
+        FastHTML Table element, wrapped in Div if responsive
+
+    Raises:
+        ValueError: If the columns have different lengths
+
+    Example:
+        >>> Table.from_columns({"city": cities, "population": populations}, hover=True)
+        >>> Table.from_columns(df, [Column("price", formatter="{:.2f}".format)])
+    """
+    cols = as_columns(columns if columns is not None else list(data.keys()))
+    values = [_to_list(data[col.key], col) for col in cols]
+    return _bulk_table(cols, columns_to_rows(cols, _check_lengths(values)), header, kwargs)
+
+
+def from_arrays(
+    arrays: Any,
+    columns: Sequence[Column | str],
+    header: bool = True,
+    **kwargs: Any,
+) -> FTTable | Div:
+    """Build a table from positional column arrays.
+
+    Args:
+        arrays: Sequence of 1-D arrays/lists, one per column, or a 2-D NumPy
+                array of shape ``(rows, columns)``
+        columns: ``Column`` definitions or labels, matched to the arrays by
+                 position
+        header: Render a header row from the column labels
+        **kwargs: ``Table`` options (striped, hover, responsive, ...)
+
+    Returns:
+        FastHTML Table element, wrapped in Div if responsive
+
+    Raises:
+        ValueError: If the number of arrays and columns differ, or the arrays
+                    have different lengths
+
+    Example:
+        >>> Table.from_arrays([names, scores], ["Name", Column("Score", cls="text-end")])
+        >>> Table.from_arrays(np.random.rand(1000, 3), ["x", "y", "z"])
+    """
+    if getattr(arrays, "ndim", 1) == 2:
+        arrays = arrays.T
+    arrays = list(arrays)
+    cols = as_columns(columns)
+    if len(arrays) != len(cols):
+        raise ValueError(f"Got {len(arrays)} arrays for {len(cols)} columns")
+    values = [_to_list(array, col) for array, col in zip(arrays, cols, strict=True)]
+    return _bulk_table(cols, columns_to_rows(cols, _check_lengths(values)), header, kwargs)
+
+
+def from_groups(
+    records: Iterable[Any],
+    columns: Sequence[Column | str | int],
+    by: str | int | Sequence[str | int],
+    aggregates: Mapping[str | int, Aggregate] | None = None,
+    header: bool = True,
+    key: str | int | None = None,
+    sort: bool = False,
+    collapsible: bool = False,
+    collapsed: bool = False,
+    subtotals: bool = True,
+    total_label: str | None = "Total",
+    **kwargs: Any,
+) -> FTTable | Div:
+    """Build a grouped table with subtotal and grand-total rows.
+
+    Groups and aggregates are computed in a single pass over ``records``
+    (see ``group_records``). Each group renders as its own ``<tbody>`` with
+    a header row, the group's rows and a subtotal row; the grand total goes
+    in a ``<tfoot>``. Aggregates are formatted with their column's formatter.
+
+    Args:
+        records: Records to display (all of the same shape)
+        columns: ``Column`` definitions or keys
+        by: Group-by field, or fields from the outermost to the innermost level
+        aggregates: Column key -> ``"sum"``, ``"count"``, ``"mean"``,
+                    ``"min"``, ``"max"`` or a function of the group's values
+        header: Render a header row from the column labels
+        key: Record field used as row key (see ``TRow(key=...)``)
+        sort: Order groups by key (default: order of first appearance)
+        collapsible: Let users collapse the rows of innermost groups
+                     (Bootstrap collapse; requires Bootstrap JS)
+        collapsed: Start with groups collapsed (with ``collapsible``)
+        subtotals: Render a subtotal row after each group
+        total_label: Label of the grand-total row (None to omit it)
+        **kwargs: ``Table`` options (striped, hover, responsive, ...)
+
+    Returns:
+        FastHTML Table element, wrapped in Div if responsive
+
+    Raises:
+        ValueError: If ``by`` is empty or an aggregate name is unknown
+
+    Example:
+        >>> Table.from_groups(
+        ...     sales,
+        ...     ["region", "country", Column("revenue", formatter=formats.currency())],
+        ...     by=["region", "country"],
+        ...     aggregates={"revenue": "sum"},
+        ...     collapsible=True,
+        ... )
+    """
+    cols = as_columns(columns)
+    levels = [by] if isinstance(by, (str, int)) else list(by)
+    root = group_records(records, levels, aggregates, sort=sort)
+    sections = grouped_sections(
+        cols,
+        root,
+        levels,
+        key=key,
+        collapsible=collapsible,
+        collapsed=collapsed,
+        subtotals=subtotals,
+        total_label=total_label,
+    )
+    if header:
+        return Table(FT("thead", (header_row(cols),), {}), *sections, **kwargs)
+    return Table(*sections, **kwargs)
+
+
+def _check_lengths(values: list[Any]) -> list[Any]:
+    if len({len(v) for v in values}) > 1:
+        raise ValueError("All columns must have the same length")
+    return values
+
+
+Table.from_records = from_records  # type: ignore[attr-defined]
+Table.from_columns = from_columns  # type: ignore[attr-defined]
+Table.from_arrays = from_arrays  # type: ignore[attr-defined]
+Table.from_groups = from_groups  # type: ignore[attr-defined]
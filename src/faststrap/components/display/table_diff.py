@@ -0,0 +1,175 @@
+"""Incremental table updates: diff keyed rows and emit out-of-band swaps."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+from fastcore.xml import FT
+from fasthtml.common import Tbody, Template, Tr
+
+from ...core.render import render_html
+
+
+class RowDiff(NamedTuple):
+    """Row keys (``id`` attributes) that differ between two snapshots."""
+
+    inserted: list[str]
+    removed: list[str]
+    changed: list[str]
+    reordered: bool
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.removed or self.changed or self.reordered)
+
+
+def _row_key(row: Any) -> str:
+    key = row.attrs.get("id") if isinstance(row, FT) else None
+    if not key:
+        raise ValueError("Diffed rows need a key: use TRow(..., key=...) or from_records(key=...)")
+    return str(key)
+
+
+def _fingerprints(rows: Iterable[Any]) -> dict[str, str]:
+    """Map row key -> digest of the rendered row, preserving row order.
+
+    The digest is stable across processes (unlike ``hash()``), so snapshots
+    stored in the session survive restarts and other workers.
+    """
+    prints: dict[str, str] = {}
+    for row in rows:
+        key = _row_key(row)
+        if key in prints:
+            raise ValueError(f"Duplicate row key: {key!r}")
+        html = render_html(row).encode("utf-8")
+        prints[key] = hashlib.blake2b(html, digest_size=16).hexdigest()
+    return prints
+
+
+def _diff(previous: dict[str, str], current: dict[str, str]) -> RowDiff:
+    inserted = [key for key in current if key not in previous]
+    removed = [key for key in previous if key not in current]
+    changed = [key for key, fp in current.items() if key in previous and previous[key] != fp]
+    # Rows present in both must keep their relative order to be patched in place
+    kept_before = [key for key in previous if key in current]
+    kept_now = [key for key in current if key in previous]
+    return RowDiff(inserted, removed, changed, kept_before != kept_now)
+
+
+class TableSnapshot:
+    """Server-side record of the rows a client currently displays.
+
+    Keep one snapshot per client (e.g. in the session or keyed by a client
+    ID). On every poll, :meth:`update` compares the new rows with the
+    snapshot and returns only the out-of-band swaps the client needs:
+    changed rows are replaced, removed rows deleted and inserted rows placed
+    after their predecessor. Rows are compared by key (``TRow(key=...)``) and
+    rendered HTML.
+
+    When rows were reordered, or more than ``max_ratio`` of the rows changed,
+    the whole body is replaced instead (still as a single out-of-band swap).
+
+    Args:
+        body_id: ``id`` of the table's ``<tbody>``
+        rows: Rows the client was initially sent
+        max_ratio: Fraction of changed rows above which the body is replaced
+
+    Example:
+        >>> snapshot = TableSnapshot("servers-body", rows)
+        >>> Table(THead(...), TBody(*rows, id="servers-body"))
+        ...
+        >>> @app.get("/servers/poll")
+        ... def poll():
+        ...     return snapshot.update(server_rows())  # hx-get, hx-swap="none"
+    """
+
+    def __init__(self, body_id: str, rows: Iterable[Any] = (), max_ratio: float = 0.5):
+        self.body_id = body_id
+        self.max_ratio = max_ratio
+        self.fingerprints = _fingerprints(rows)
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def diff(self, rows: Iterable[Any]) -> RowDiff:
+        """Compare ``rows`` with the snapshot without updating it."""
+        return _diff(self.fingerprints, _fingerprints(rows))
+
+    def update(self, rows: Iterable[Any]) -> tuple[Any, ...]:
+        """Record ``rows`` as the client's state and return the swaps to get there.
+
+        Args:
+            rows: The complete, current list of keyed rows
+
+        Returns:
+            Tuple of ``<template>``-wrapped out-of-band fragments (empty when
+            nothing changed)
+        """
+        rows = list(rows)
+        current = _fingerprints(rows)
+        changes = _diff(self.fingerprints, current)
+        self.fingerprints = current
+        return oob_updates(rows, changes, self.body_id, self.max_ratio)
+
+
+def diff_rows(
+    previous: Iterable[Any],
+    current: Iterable[Any],
+    body_id: str,
+    max_ratio: float = 0.5,
+) -> tuple[Any, ...]:
+    """Out-of-band swaps turning the ``previous`` rows into the ``current`` rows.
+
+    Stateless counterpart of :class:`TableSnapshot` for when both row lists
+    are at hand.
+
+    Args:
+        previous: Rows the client currently shows
+        current: Rows it should show
+        body_id: ``id`` of the table's ``<tbody>``
+        max_ratio: Fraction of changed rows above which the body is replaced
+
+    Returns:
+        Tuple of ``<template>``-wrapped out-of-band fragments
+    """
+    current = list(current)
+    changes = _diff(_fingerprints(previous), _fingerprints(current))
+    return oob_updates(current, changes, body_id, max_ratio)
+
+
+def _with_oob(row: FT, value: str) -> FT:
+    """Copy of ``row`` carrying ``hx-swap-oob`` (the caller's row is not mutated)."""
+    return FT(row.tag, row.children, {**row.attrs, "hx-swap-oob": value})
+
+
+def oob_updates(
+    rows: Sequence[Any], changes: RowDiff, body_id: str, max_ratio: float = 0.5
+) -> tuple[Any, ...]:
+    """Build the out-of-band fragments applying ``changes``.
+
+    Every fragment is wrapped in ``<template>`` so table markup survives
+    HTMX's fragment parsing. Changed rows replace their namesake, removed
+    rows are deleted, and inserted rows travel inside a ``<tbody>`` whose
+    content is placed after the preceding row. Fragments are applied in
+    document order, so an inserted row may follow a row inserted just
+    before it.
+    """
+    if not changes:
+        return ()
+    touched = len(changes.inserted) + len(changes.removed) + len(changes.changed)
+    if changes.reordered or touched > max_ratio * max(len(rows), 1):
+        return (Template(Tbody(*rows, hx_swap_oob=f"innerHTML:#{body_id}")),)
+
+    by_key = {_row_key(row): row for row in rows}
+    updates: list[Any] = [Template(Tr(id=key, hx_swap_oob="delete")) for key in changes.removed]
+    updates.extend(Template(_with_oob(by_key[key], "true")) for key in changes.changed)
+    inserted = set(changes.inserted)
+    previous_key: str | None = None
+    for row in rows:
+        key = _row_key(row)
+        if key in inserted:
+            target = f"afterend:#{previous_key}" if previous_key else f"afterbegin:#{body_id}"
+            updates.append(Template(Tbody(row, hx_swap_oob=target)))
+        previous_key = key
+    return tuple(updates)
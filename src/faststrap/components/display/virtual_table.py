@@ -0,0 +1,239 @@
+"""Virtual-scrolling table that renders only the visible window of rows."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+from fasthtml.common import Div, Style, Tbody, Td, Thead, Tr
+
+from ...core.registry import register
+from .columns import Column, as_columns, header_row, records_to_rows
+from .datatable import DataSource
+from .table import Table
+
+FetchRows = Callable[[int, int], Iterable[Any]]
+
+# Browsers cap element heights (Firefox at ~17.9M px); beyond this the spacer
+# rows are compressed so every row stays reachable with the scrollbar.
+MAX_SCROLL_HEIGHT = 8_000_000
+
+
+class _Geometry:
+    """Maps between row indexes and pixel offsets of the scroll viewport."""
+
+    def __init__(self, total: int, window: int, row_height: int, visible: int):
+        self.total = total
+        self.size = min(window, total)
+        self.row_height = row_height
+        self.visible = visible
+        spacer_rows = total - self.size
+        room = MAX_SCROLL_HEIGHT - self.size * row_height
+        # Height of one row inside the spacers (== row_height unless compressed)
+        self.spacer_row = row_height if spacer_rows * row_height <= room else room / spacer_rows
+
+    @property
+    def compressed(self) -> bool:
+        return self.spacer_row < self.row_height
+
+    def clamp(self, start: int) -> int:
+        return min(max(0, start), self.total - self.size)
+
+    def spacer(self, rows: int) -> int:
+        return round(rows * self.spacer_row)
+
+    def row_at(self, top: float, start: int) -> float:
+        """Row index shown at scroll offset ``top`` while ``start`` is rendered."""
+        window_top = start * self.spacer_row
+        window_bottom = window_top + self.size * self.row_height
+        if top < window_top:
+            return top / self.spacer_row
+        if top < window_bottom:
+            return start + (top - window_top) / self.row_height
+        return start + self.size + (top - window_bottom) / self.spacer_row
+
+    def offset_of(self, row: float, start: int) -> float:
+        """Scroll offset that shows ``row`` (inside the window starting at ``start``)."""
+        return start * self.spacer_row + (row - start) * self.row_height
+
+    def centered(self, row: float) -> int:
+        """Window start that centers the viewport beginning at ``row``."""
+        return self.clamp(int(row) + self.visible // 2 - self.size // 2)
+
+
+def _fetcher(source: DataSource | FetchRows, total: int | None) -> tuple[FetchRows, int]:
+    if hasattr(source, "slice") and hasattr(source, "count"):
+        return source.slice, source.count() if total is None else total  # type: ignore[union-attr]
+    if total is None:
+        raise ValueError("total is required when source is a fetch callback")
+    return source, total  # type: ignore[return-value]
+
+
+def _float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@register(category="display")
+def VirtualTable(
+    source: DataSource | FetchRows,
+    columns: Sequence[Column | str | int],
+    endpoint: str,
+    total: int | None = None,
+    request: Any = None,
+    start: int | None = None,
+    window: int = 200,
+    row_height: int = 41,
+    height: int = 600,
+    table_id: str = "vtable",
+    partial: bool | None = None,
+    **kwargs: Any,
+) -> Div | Tbody:
+    """Virtual-scrolling table for very large datasets.
+
+    Renders a fixed-height scroll viewport holding one window of ``window``
+    rows between two spacer rows that stand in for the rows above and below.
+    When the user scrolls close to either edge of the window (or past it,
+    onto a spacer) an HTMX ``intersect`` trigger sends the scroll position to
+    ``endpoint``, which answers with the ``<tbody>`` for the window around
+    it. The DOM never holds more than ``window`` rows, however far the user
+    scrolls.
+
+    Rows must have a fixed height (``row_height``, enforced with a scoped
+    style; long cell text is truncated) so spacer heights match the rows they
+    replace. Above ``MAX_SCROLL_HEIGHT`` pixels the spacers are compressed
+    and the viewport re-anchors its scroll position after each swap.
+
+    Args:
+        source: DataSource (e.g. ``ListSource``) or ``fetch(start, stop)``
+                callback returning the records of one window
+        columns: ``Column`` definitions or plain keys
+        endpoint: URL of the handler rendering this table
+        total: Total number of rows (required with a fetch callback)
+        request: Starlette request; the window position is read from its
+                 query string and partial responses are detected from the
+                 HTMX headers
+        start: First row of the window (overrides the request)
+        window: Rows rendered per window
+        row_height: Height of one row in pixels
+        height: Height of the scroll viewport in pixels
+        table_id: ID of the viewport (the body is ``{table_id}-body``)
+        partial: Force a full (False) or partial (True) render
+        **kwargs: Table options (striped, hover, small, ...) and HTML attributes
+
+    Returns:
+        Div viewport with the table, or the new Tbody for partial requests
+
+    Raises:
+        ValueError: If ``window`` is smaller than four viewports of rows, or
+                    ``total`` is missing for a fetch callback
+
+    Example:
+        >>> @app.get("/audit")
+        ... def audit(request):
+        ...     return VirtualTable(
+        ...         lambda start, stop: db.audit_log(offset=start, limit=stop - start),
+        ...         [Column("ts", "Time"), Column("user"), Column("action")],
+        ...         endpoint="/audit",
+        ...         total=db.audit_log_count(),
+        ...         request=request,
+        ...     )
+    """
+    visible = math.ceil(height / row_height)
+    if window < 4 * visible:
+        raise ValueError(
+            f"window must be at least {4 * visible} rows (four viewports of {visible} rows)"
+        )
+    fetch, c_total = _fetcher(source, total)
+    cols = as_columns(columns)
+    geo = _Geometry(c_total, window, row_height, visible)
+    body_id = f"{table_id}-body"
+
+    params: Mapping[str, Any] = getattr(request, "query_params", None) or {}
+    headers: Mapping[str, Any] = getattr(request, "headers", None) or {}
+
+    # ---- Resolve the window -------------------------------------------------
+    scroll_top = _float(params.get("top"))
+    c_start = start
+    anchor: float | None = None
+    if c_start is None:
+        previous = geo.clamp(int(_float(params.get("start")) or 0))
+        if scroll_top is not None:
+            # The header row sits inside the viewport above the body rows
+            anchor = geo.row_at(max(0.0, scroll_top - row_height), previous)
+            c_start = geo.centered(anchor)
+        else:
+            c_start = previous
+    c_start = geo.clamp(c_start)
+    stop = c_start + geo.size
+
+    if partial is None:
+        partial = bool(headers.get("hx-request")) and headers.get("hx-target") == body_id
+
+    # ---- Body: spacer, window rows, spacer ------------------------------------
+    trigger = {
+        "hx-get": endpoint,
+        "hx-trigger": f"intersect once root:#{table_id}",
+        "hx-vals": (
+            f"js:{{top: document.getElementById('{table_id}').scrollTop, start: {c_start}}}"
+        ),
+        "hx-target": f"#{body_id}",
+        "hx-swap": "outerHTML",
+        "hx-sync": f"#{body_id}:replace",
+    }
+
+    def spacer(rows: int) -> Tr:
+        return Tr(
+            Td(
+                colspan=str(len(cols)),
+                style=f"height: {geo.spacer(rows)}px; padding: 0; border: 0;",
+            ),
+            cls="faststrap-vspacer",
+            aria_hidden="true",
+            **trigger,
+        )
+
+    rows: list[Any] = records_to_rows(cols, fetch(c_start, stop))
+    # Sentinels one viewport inside each edge fetch the next/previous window
+    # before the user scrolls past the rendered rows.
+    if c_start > 0 and len(rows) > visible:
+        rows[visible].attrs.update(trigger)
+    if stop < c_total and len(rows) > visible:
+        rows[-1 - visible].attrs.update(trigger)
+    if c_start > 0:
+        rows.insert(0, spacer(c_start))
+    if stop < c_total:
+        rows.append(spacer(c_total - stop))
+
+    body_attrs: dict[str, Any] = {"id": body_id, "data_start": str(c_start)}
+    if geo.compressed and anchor is not None:
+        # Keep the anchored row in place although the spacers above changed height
+        body_attrs["data_scroll_top"] = str(round(geo.offset_of(anchor, c_start) + row_height))
+    body = Tbody(*rows, **body_attrs)
+
+    if partial:
+        return body
+
+    viewport_attrs: dict[str, Any] = {}
+    if geo.compressed:
+        viewport_attrs["hx-on::after-settle"] = (
+            "const b = this.querySelector('tbody[data-scroll-top]');"
+            " if (b) this.scrollTop = +b.dataset.scrollTop;"
+        )
+    css = (
+        f"#{table_id} tbody tr:not(.faststrap-vspacer) {{ height: {row_height}px; }}"
+        f" #{table_id} td {{ white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }}"
+        f" #{table_id} thead th {{ position: sticky; top: 0; z-index: 1;"
+        " background: var(--bs-body-bg); }"
+    )
+    return Div(
+        Style(css),
+        Table(Thead(header_row(cols)), body, **kwargs),
+        id=table_id,
+        cls="faststrap-vtable",
+        style=f"height: {height}px; overflow-y: auto; overflow-anchor: none;",
+        **viewport_attrs,
+    )
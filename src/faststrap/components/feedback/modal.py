@@ -7,6 +7,7 @@ from typing import Any, Literal
 from fasthtml.common import H5, Div
 
 from ...core.base import merge_classes
+from ...core.ids import unique_id
 from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...core.types import SizeType
@@ -86,9 +87,7 @@ def Modal(
 
     # Ensure modal id
     if modal_id is None:
-        from uuid import uuid4
-
-        modal_id = f"modal-{uuid4().hex}"
+        modal_id = unique_id("modal", title)
 
     # Build modal dialog classes
     dialog_classes = ["modal-dialog"]
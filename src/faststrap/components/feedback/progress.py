@@ -7,11 +7,13 @@ from typing import Any
 from fasthtml.common import Div
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...core.types import VariantType
 from ...utils.attrs import convert_attrs
 
 
+@register(category="feedback")
 def Progress(
     value: int,
     max_value: int = 100,
@@ -78,6 +80,7 @@ def Progress(
     return Div(bar, **wrapper_attrs)
 
 
+@register(category="feedback")
 def ProgressBar(
     value: int,
     max_value: int = 100,
@@ -3,6 +3,7 @@
 from .button import Button, CloseButton
 from .buttongroup import ButtonGroup, ButtonToolbar
 from .checks import Checkbox, Radio, Range, Switch
+from .facets import FacetGroup, FacetIndex, FacetRange, FacetResult, FacetSidebar
 from .file import FileInput
 from .input import Input
 from .inputgroup import FloatingLabel, InputGroup, InputGroupText
@@ -17,6 +18,11 @@ __all__ = [
     "Radio",
     "Switch",
     "Range",
+    "FacetIndex",
+    "FacetResult",
+    "FacetGroup",
+    "FacetRange",
+    "FacetSidebar",
     "FileInput",
     "Input",
     "InputGroup",
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from fasthtml.common import A, I, Span
+from fasthtml.common import A, Span
 from fasthtml.common import Button as FTButton
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...core.types import SizeType, VariantType
 from ...utils.attrs import convert_attrs
+from ...utils.icons import icon_element
 
 
+@register(category="forms")
 def CloseButton(
     *children: Any,
     white: bool = False,
@@ -43,6 +46,7 @@ def CloseButton(
     return FTButton(*children, **attrs)
 
 
+@register(category="forms")
 def Button(
     *children: Any,
     as_: Literal["button", "a"] = "button",
@@ -197,7 +201,7 @@ def Button(
             default_icon_cls = f"bi bi-{icon} me-2"
         else:
             default_icon_cls = f"bi bi-{icon} ms-2"
-        icon_elem = I(cls=icon_cls or default_icon_cls, aria_hidden="true")
+        icon_elem = icon_element(icon, icon_cls or default_icon_cls, aria_hidden="true")
         if icon_pos == "start":
             content.insert(0, icon_elem)
         else:
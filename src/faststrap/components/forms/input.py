@@ -8,11 +8,13 @@ from fasthtml.common import Div, Label, Small
 from fasthtml.common import Input as FTInput
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...core.types import InputType, SizeType
 from ...utils.attrs import convert_attrs
 
 
+@register(category="forms")
 def Input(
     name: str,
     input_type: InputType | None = None,
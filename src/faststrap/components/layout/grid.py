@@ -5,12 +5,14 @@ from typing import Any, Literal
 from fasthtml.common import Div
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...utils.attrs import convert_attrs
 
 BreakpointType = Literal["sm", "md", "lg", "xl", "xxl"]
 ContainerType = Literal["fluid", "sm", "md", "lg", "xl", "xxl"]
 
 
+@register(category="layout")
 def Container(
     *children: Any,
     fluid: ContainerType | bool = False,
@@ -61,6 +63,7 @@ def Container(
     return Div(*children, **attrs)
 
 
+@register(category="layout")
 def Row(
     *children: Any,
     cols: int | None = None,
@@ -127,6 +130,7 @@ def Row(
     return Div(*children, **attrs)
 
 
+@register(category="layout")
 def Col(
     *children: Any,
     span: int | bool = True,
@@ -5,11 +5,13 @@ from typing import Any
 from fasthtml.common import H1, Div, P
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...core.types import VariantType
 from ...utils.attrs import convert_attrs
 from .grid import Container
 
 
+@register(category="layout")
 def Hero(
     title: str,
     subtitle: str | None = None,
@@ -6,7 +6,7 @@ from .drawer import Drawer
 from .dropdown import Dropdown, DropdownDivider, DropdownItem
 from .listgroup import Collapse, ListGroup, ListGroupItem
 from .navbar import Navbar
-from .pagination import Pagination
+from .pagination import Pagination, page_fragment, page_url
 from .tabs import TabPane, Tabs
 
 __all__ = [
@@ -18,6 +18,8 @@ __all__ = [
     "ListGroupItem",
     "Navbar",
     "Pagination",
+    "page_fragment",
+    "page_url",
     "Breadcrumb",
     "Dropdown",
     "DropdownItem",
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import uuid
 from typing import Any
 
 from fasthtml.common import H2, Button, Div
 
 from ...core.base import merge_classes
+from ...core.ids import unique_id
+from ...core.registry import register
 from ...utils.attrs import convert_attrs
 
 
+@register(category="navigation", requires_js=True)
 def Accordion(
     *children: Any,
     accordion_id: str | None = None,
@@ -58,7 +60,9 @@ def Accordion(
         Bootstrap docs: https://getbootstrap.com/docs/5.3/components/accordion/
     """
     # Generate ID if not provided
-    acc_id = accordion_id or f"accordion-{uuid.uuid4().hex[:8]}"
+    acc_id = accordion_id or unique_id(
+        "accordion", *(getattr(child, "title", None) for child in children)
+    )
 
     # Build classes
     classes = ["accordion"]
@@ -7,6 +7,7 @@ from typing import Any
 from fasthtml.common import H5, Div
 
 from ...core.base import merge_classes
+from ...core.ids import unique_id
 from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...core.types import PlacementType
@@ -71,9 +72,7 @@ def Drawer(
 
     # Ensure drawer id
     if drawer_id is None:
-        from uuid import uuid4
-
-        drawer_id = f"drawer-{uuid4().hex}"
+        drawer_id = unique_id("drawer", title)
 
     # Build offcanvas classes
     classes = ["offcanvas", f"offcanvas-{c_placement}"]
@@ -7,11 +7,14 @@ from typing import Any
 from fasthtml.common import A, Button, Div, Nav, Span
 
 from ...core.base import merge_classes
+from ...core.ids import unique_id
+from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...core.types import ExpandType
 from ...utils.attrs import convert_attrs
 
 
+@register(category="navigation", requires_js=True)
 def Navbar(
     *children: Any,
     items: list[Any] | None = None,
@@ -119,11 +122,7 @@ def Navbar(
 
         # Toggler for mobile (collapse button)
         if c_expand:
-            toggler_id = kwargs.get("id", "navbarContent")
-            if "id" not in kwargs:
-                import random
-
-                toggler_id = f"navbar{random.randint(1000, 9999)}"
+            toggler_id = kwargs["id"] if "id" in kwargs else unique_id("navbar", brand)
 
             toggler = Button(
                 Span(cls="navbar-toggler-icon"),
@@ -152,11 +151,7 @@ def Navbar(
 
         if c_expand:
             # Still need collapse for mobile
-            toggler_id = kwargs.get("id", "navbarContent")
-            if "id" not in kwargs:
-                import random
-
-                toggler_id = f"navbar{random.randint(1000, 9999)}"
+            toggler_id = kwargs["id"] if "id" in kwargs else unique_id("navbar", brand)
 
             toggler = Button(
                 Span(cls="navbar-toggler-icon"),
@@ -2,39 +2,225 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from fasthtml.common import A, Li, Nav, Span, Ul
+from fasthtml.common import A, Li, Nav, Script, Span, Ul
 
 from ...core.base import merge_classes
+from ...core.cache import FragmentCache, fragment
+from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...core.types import AlignType, SizeType
 from ...utils.attrs import convert_attrs
 
 
+def page_url(base_url: str, **params: Any) -> str:
+    """Set query parameters on ``base_url``, keeping all other parameters.
+
+    Parameters set to ``None`` are removed.
+
+    Args:
+        base_url: URL, possibly with a query string (e.g. ``str(request.url)``)
+        **params: Query parameters to set or remove
+
+    Returns:
+        The URL with the updated query string
+
+    Example:
+        >>> page_url("/items?sort=name&page=2", page=3)
+        '/items?sort=name&page=3'
+        >>> page_url("/items?after=abc&q=x", after=None, before="xyz")
+        '/items?q=x&before=xyz'
+    """
+    scheme, netloc, path, query, fragment = urlsplit(base_url)
+    pending = dict(params)
+    pairs: list[tuple[str, str]] = []
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        if key not in params:
+            pairs.append((key, value))
+        elif key in pending:
+            # Replace in place (first occurrence) so parameter order is kept
+            new = pending.pop(key)
+            if new is not None:
+                pairs.append((key, str(new)))
+    pairs.extend((key, str(value)) for key, value in pending.items() if value is not None)
+    return urlunsplit((scheme, netloc, path, urlencode(pairs), fragment))
+
+
+# Client side of ``prefetch=True``: hovering or focusing a marked link fetches
+# the page fragment once; clicking it swaps the fragment in without a request.
+PREFETCH_SCRIPT = """
+(() => {
+  if (window.faststrapPrefetch) return;
+  const cache = new Map(), limit = 32;
+  window.faststrapPrefetch = cache;
+  const link = (e) => e.target.closest && e.target.closest('a[data-fs-prefetch]');
+  const load = (e) => {
+    const a = link(e), url = a && a.getAttribute('hx-get');
+    if (!url || cache.has(url)) return;
+    const entry = {html: null};
+    cache.set(url, entry);
+    if (cache.size > limit) cache.delete(cache.keys().next().value);
+    const target = document.querySelector(a.getAttribute('hx-target'));
+    const headers = {'HX-Request': 'true', 'HX-Preloaded': 'true'};
+    if (target && target.id) headers['HX-Target'] = target.id;
+    fetch(url, {headers}).then((r) => r.ok ? r.text() : Promise.reject(r))
+      .then((html) => { entry.html = html; }, () => cache.delete(url));
+  };
+  document.addEventListener('mouseover', load);
+  document.addEventListener('focusin', load);
+  document.addEventListener('click', (e) => {
+    const a = link(e), url = a && a.getAttribute('hx-get'), entry = url && cache.get(url);
+    if (!entry || entry.html === null || !window.htmx) return;
+    if (e.button || e.ctrlKey || e.metaKey || e.shiftKey || e.altKey) return;
+    e.preventDefault();
+    e.stopPropagation();
+    cache.delete(url);
+    if (a.getAttribute('hx-push-url') === 'true') history.pushState({htmx: true}, '', url);
+    const target = document.querySelector(a.getAttribute('hx-target'));
+    htmx.swap(target, entry.html, {swapStyle: a.getAttribute('hx-swap') || 'innerHTML'});
+  }, true);
+})();
+"""
+
+
+def page_fragment(
+    func: Callable[..., Any] | None = None,
+    *,
+    tags: Iterable[str] = ("pagination",),
+    ttl: float | None = 60.0,
+    cache: FragmentCache | None = None,
+) -> Any:
+    """Serve a paginated fragment from the server-side fragment cache.
+
+    Decorate the function that renders one page (the region swapped by
+    ``Pagination(htmx=True)``); it is cached by its arguments with
+    ``faststrap.cache``. A ``prefetch=True`` request (sent with
+    ``HX-Preloaded: true``) renders the page once, and the click that follows,
+    or another visitor, is served the cached HTML.
+
+    Args:
+        func: Page renderer, keyed by its arguments (page number, cursor, filters)
+        tags: Tags for ``faststrap.cache.invalidate`` (default ``"pagination"``)
+        ttl: Seconds a rendered page is reused (default 60)
+        cache: FragmentCache to use (defaults to the process-wide cache)
+
+    Returns:
+        Decorated function, or a decorator when called with options only
+
+    Example:
+        >>> @page_fragment(tags=("products",))
+        ... def results(page: int):
+        ...     return Div(grid(page), Pagination(page, pages, target="#results", prefetch=True))
+        >>> cache.invalidate("products")  # after the catalogue changes
+    """
+    decorate = fragment(tags=tags, ttl=ttl, cache=cache)
+    return decorate if func is None else decorate(func)
+
+
+def _item(
+    label: str,
+    href: str | None,
+    aria_label: str | None = None,
+    active: bool = False,
+) -> Li:
+    """One page-item: a link, or a disabled/active span when ``href`` is None."""
+    if href is not None and not active:
+        return Li(A(label, href=href, cls="page-link", aria_label=aria_label), cls="page-item")
+    if active:
+        return Li(Span(label, cls="page-link"), cls="page-item active", aria_current="page")
+    return Li(Span(label, cls="page-link", aria_hidden="true"), cls="page-item disabled")
+
+
+def _status(text: str) -> Li:
+    """Non-interactive page-item (e.g. an approximate total)."""
+    return Li(Span(text, cls="page-link"), cls="page-item disabled")
+
+
+@register(category="navigation")
 def Pagination(
-    current_page: int,
-    total_pages: int,
+    current_page: int = 1,
+    total_pages: int | None = None,
     size: SizeType | None = None,
     align: AlignType | None = None,
     max_pages: int | None = None,
     base_url: str | None = None,
     show_first_last: bool | None = None,
     show_prev_next: bool | None = None,
+    page_param: str = "page",
+    approximate: bool = False,
+    cursor: bool | None = None,
+    before: str | None = None,
+    after: str | None = None,
+    jumps: Mapping[str, str] | None = None,
+    htmx: bool = False,
+    target: str = "body",
+    swap: str = "innerHTML",
+    push_url: bool = True,
+    prefetch: bool = False,
     **kwargs: Any,
 ) -> Nav:
     """Bootstrap Pagination component for page navigation.
 
+    Page mode renders numbered links for ``total_pages`` pages. Cursor mode
+    (keyset pagination) needs no total: previous/next links carry the opaque
+    ``before``/``after`` cursors supplied by the caller, so the query behind
+    the page never has to run ``COUNT(*)``.
+
+    Links are built from ``base_url`` with only the paging parameters
+    replaced, so filters and sort order in its query string are preserved.
+
+    With ``htmx=True`` the links fetch the next page with ``hx-get`` and swap
+    it into ``target`` instead of reloading the document, pushing the page URL
+    to the history (the plain ``href`` stays for new tabs and no-JS clients).
+    ``prefetch=True`` additionally fetches the adjacent pages when their links
+    are hovered or focused and keeps them in a small client-side cache, so the
+    click swaps without waiting for the server. The server sees prefetches as
+    ordinary HTMX requests (plus an ``HX-Preloaded`` header), so a
+    ``faststrap.cache.fragment`` on the page renderer serves both the prefetch
+    and any later request from its server-side cache.
+
     Args:
         current_page: Current active page (1-indexed)
-        total_pages: Total number of pages
+        total_pages: Total number of pages (omit for cursor mode)
         size: Pagination size (sm, lg)
         align: Alignment (start, center, end)
         max_pages: Maximum page numbers to show
-        base_url: Base URL for page links
+        base_url: Base URL for page links; existing query parameters are kept
+                  (pass ``str(request.url)`` to keep the current ones)
         show_first_last: Show first/last page buttons
         show_prev_next: Show previous/next buttons
+        page_param: Query parameter holding the page number
+        approximate: ``total_pages`` is an estimate (e.g. from table
+                     statistics): shown as "of ~N", Next stays enabled and no
+                     Last button is rendered
+        cursor: Use cursor mode (default: when ``total_pages`` is omitted or
+                a cursor is given)
+        before: Cursor of the previous page (cursor mode; None on the first page)
+        after: Cursor of the next page (cursor mode; None on the last page)
+        jumps: Extra cursor links, label -> ``after`` cursor (cursor mode)
+        htmx: Navigate with HTMX requests instead of full page loads
+        target: CSS selector of the region the page is swapped into (HTMX mode)
+        swap: ``hx-swap`` strategy for the page fragment (HTMX mode)
+        push_url: Push page URLs to the browser history (HTMX mode)
+        prefetch: Prefetch and cache the adjacent pages on hover (implies ``htmx``)
         **kwargs: Additional HTML attributes
+
+    Example:
+        Page numbers, keeping the current filters:
+        >>> Pagination(3, 10, base_url=str(request.url))
+
+        Keyset pagination without a total:
+        >>> Pagination(before=rows[0].id_cursor, after=rows[-1].id_cursor, base_url="/events")
+
+        Approximate total:
+        >>> Pagination(3, estimated_pages, approximate=True)
+
+        Partial navigation with prefetching, inside the swapped region:
+        >>> Div(grid, Pagination(3, 10, base_url="/products", target="#results", prefetch=True),
+        ...     id="results")
     """
     # Resolve API defaults
     cfg = resolve_defaults(
@@ -50,10 +236,13 @@ def Pagination(
     c_size = cfg.get("size")
     c_align = cfg.get("align", "start")
     c_max_pages = cfg.get("max_pages", 5)
-    c_base_url = cfg.get("base_url", "#")
+    c_base_url = cfg.get("base_url", "")
     c_show_first_last = cfg.get("show_first_last", False)
     c_show_prev_next = cfg.get("show_prev_next", True)
 
+    if cursor is None:
+        cursor = total_pages is None or before is not None or after is not None
+
     # Build pagination classes
     classes = ["pagination"]
     if c_size:
@@ -68,97 +257,145 @@ def Pagination(
     user_cls = kwargs.pop("cls", "")
     ul_cls = merge_classes(" ".join(classes), user_cls)
 
+    links: list[Any] = []
+    adjacent: set[str] = set()
+    if cursor:
+        links = _cursor_links(
+            c_base_url,
+            page_param,
+            before,
+            after,
+            jumps,
+            c_show_first_last,
+            total_pages if approximate else None,
+        )
+        adjacent = {
+            _cursor_url(c_base_url, page_param, **{name: value})
+            for name, value in (("before", before), ("after", after))
+            if value is not None
+        }
+    else:
+        if total_pages is None:
+            raise ValueError("total_pages is required unless cursor mode is used")
+        links = _page_links(
+            c_base_url,
+            page_param,
+            current_page,
+            total_pages,
+            c_max_pages,
+            c_show_first_last,
+            c_show_prev_next,
+            approximate,
+        )
+        adjacent = {
+            page_url(c_base_url, **{page_param: page})
+            for page in (current_page - 1, current_page + 1)
+            if page >= 1 and (approximate or page <= total_pages)
+        }
+
+    if htmx or prefetch:
+        hx = {"hx-target": target, "hx-swap": swap, "hx-push-url": "true" if push_url else "false"}
+        for item in links:
+            for link in item.children:
+                if link.tag != "a":
+                    continue
+                href = link.attrs["href"]
+                link.attrs.update(hx, **{"hx-get": href})
+                if prefetch and href in adjacent:
+                    link.attrs["data-fs-prefetch"] = "true"
+
+    # Build pagination
+    ul = Ul(*links, cls=ul_cls)
+
+    # Convert remaining kwargs
+    nav_attrs: dict[str, Any] = {"aria_label": "Page navigation"}
+    nav_attrs.update(convert_attrs(kwargs))
+
+    if prefetch:
+        return Nav(ul, Script(PREFETCH_SCRIPT), cls=justify_class, **nav_attrs)
+    return Nav(ul, cls=justify_class, **nav_attrs)
+
+
+def _page_links(
+    base_url: str,
+    page_param: str,
+    current_page: int,
+    total_pages: int,
+    max_pages: int,
+    show_first_last: bool,
+    show_prev_next: bool,
+    approximate: bool,
+) -> list[Any]:
+    def url(page: int) -> str:
+        return page_url(base_url, **{page_param: page})
+
     # Calculate page range
-    half = c_max_pages // 2
+    half = max_pages // 2
     start = max(1, current_page - half)
-    end = min(total_pages, start + c_max_pages - 1)
+    end = min(total_pages, start + max_pages - 1)
 
     # Adjust if at end
     if end == total_pages:
-        start = max(1, end - c_max_pages + 1)
+        start = max(1, end - max_pages + 1)
 
-    # Build page links
     links: list[Any] = []
 
     # First page
-    if c_show_first_last and current_page > 1:
-        links.append(
-            Li(
-                A("«", href=f"{c_base_url}?page=1", cls="page-link", aria_label="First"),
-                cls="page-item",
-            )
-        )
+    if show_first_last and current_page > 1:
+        links.append(_item("«", url(1), "First"))
 
     # Previous page
-    if c_show_prev_next:
-        prev_disabled = current_page == 1
-        prev_page = max(1, current_page - 1)
-        links.append(
-            Li(
-                (
-                    A(
-                        "‹",
-                        href=f"{c_base_url}?page={prev_page}",
-                        cls="page-link",
-                        aria_label="Previous",
-                    )
-                    if not prev_disabled
-                    else Span("‹", cls="page-link", aria_hidden="true")
-                ),
-                cls="page-item" + (" disabled" if prev_disabled else ""),
-            )
-        )
+    if show_prev_next:
+        links.append(_item("‹", url(current_page - 1) if current_page > 1 else None, "Previous"))
 
     # Page numbers
     for page in range(start, end + 1):
-        active = page == current_page
-        href = f"{c_base_url}?page={page}"
-        links.append(
-            Li(
-                (
-                    A(str(page), href=href, cls="page-link")
-                    if not active
-                    else Span(str(page), cls="page-link")
-                ),
-                cls="page-item" + (" active" if active else ""),
-                aria_current="page" if active else None,
-            )
-        )
+        links.append(_item(str(page), url(page), active=page == current_page))
 
-    # Next page
-    if c_show_prev_next:
-        next_disabled = current_page == total_pages
-        next_page = min(total_pages, current_page + 1)
-        links.append(
-            Li(
-                (
-                    A(
-                        "›",
-                        href=f"{c_base_url}?page={next_page}",
-                        cls="page-link",
-                        aria_label="Next",
-                    )
-                    if not next_disabled
-                    else Span("›", cls="page-link", aria_hidden="true")
-                ),
-                cls="page-item" + (" disabled" if next_disabled else ""),
-            )
-        )
+    if approximate:
+        links.append(_status(f"of ~{total_pages:,}"))
+
+    # Next page (an estimated total may be too low, so Next stays available)
+    if show_prev_next:
+        has_next = approximate or current_page < total_pages
+        links.append(_item("›", url(current_page + 1) if has_next else None, "Next"))
 
     # Last page
-    if c_show_first_last and current_page < total_pages:
-        links.append(
-            Li(
-                A("»", href=f"{c_base_url}?page={total_pages}", cls="page-link", aria_label="Last"),
-                cls="page-item",
-            )
-        )
+    if show_first_last and not approximate and current_page < total_pages:
+        links.append(_item("»", url(total_pages), "Last"))
 
-    # Build pagination
-    ul = Ul(*links, cls=ul_cls)
+    return links
 
-    # Convert remaining kwargs
-    nav_attrs: dict[str, Any] = {"aria_label": "Page navigation"}
-    nav_attrs.update(convert_attrs(kwargs))
 
-    return Nav(ul, cls=justify_class, **nav_attrs)
+def _cursor_url(base_url: str, page_param: str, **cursors: Any) -> str:
+    """Cursor-mode link: set ``cursors`` and drop the other paging parameters.
+
+    Without a ``base_url`` the cursor-less (first page) link is ``"?"``: an
+    empty ``href`` would reload the current URL, cursor included.
+    """
+    url = page_url(base_url, **{page_param: None, "before": None, "after": None, **cursors})
+    return url or "?"
+
+
+def _cursor_links(
+    base_url: str,
+    page_param: str,
+    before: str | None,
+    after: str | None,
+    jumps: Mapping[str, str] | None,
+    show_first: bool,
+    approx_pages: int | None,
+) -> list[Any]:
+    def url(**cursors: Any) -> str:
+        return _cursor_url(base_url, page_param, **cursors)
+
+    links: list[Any] = []
+    if show_first:
+        links.append(_item("«", url() if before is not None else None, "First"))
+    links.append(_item("‹", url(before=before) if before is not None else None, "Previous"))
+    for label, jump in (jumps or {}).items():
+        links.append(_item(label, url(after=jump)))
+    if approx_pages is not None:
+        links.append(_status(f"~{approx_pages:,} pages"))
+    links.append(_item("›", url(after=after) if after is not None else None, "Next"))
+    return links
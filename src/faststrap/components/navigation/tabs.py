@@ -7,11 +7,13 @@ from typing import Any
 from fasthtml.common import Button, Div, Li, Ul
 
 from ...core.base import merge_classes
+from ...core.registry import register
 from ...core.theme import resolve_defaults
 from ...core.types import TabType
 from ...utils.attrs import convert_attrs
 
 
+@register(category="navigation", requires_js=True)
 def Tabs(
     *items: tuple[str, Any, bool] | tuple[str, Any],
     variant: TabType | None = None,
@@ -123,6 +125,7 @@ def Tabs(
         return Div(nav)
 
 
+@register(category="navigation")
 def TabPane(
     *children: Any,
     tab_id: str,
@@ -1,6 +1,21 @@
 """Core functionality for FastStrap."""
 
-from .assets import add_bootstrap, get_assets
-from .base import BaseComponent, Component, merge_classes
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .assets import add_bootstrap, get_assets
+    from .base import BaseComponent, Component, merge_classes
+
+_EXPORTS: dict[str, str] = {
+    "add_bootstrap": ".assets:add_bootstrap",
+    "get_assets": ".assets:get_assets",
+    "Component": ".base:Component",
+    "BaseComponent": ".base:BaseComponent",
+    "merge_classes": ".base:merge_classes",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = ["add_bootstrap", "get_assets", "Component", "BaseComponent", "merge_classes"]
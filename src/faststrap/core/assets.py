@@ -5,13 +5,15 @@ Safe for multi-worker servers, thread-safe, with graceful fallbacks.
 
 from __future__ import annotations
 
+import os
 import warnings
+from collections.abc import Callable, Iterable, Mapping
 from os import environ
 from typing import Any
 
 from fasthtml.common import Link, Script, Style
-from starlette.staticfiles import StaticFiles
 
+from ..utils.icons import IconMode
 from ..utils.static_management import (
     create_favicon_links,
     get_default_favicon_url,
@@ -19,7 +21,17 @@ from ..utils.static_management import (
     is_mounted,
     resolve_static_url,
 )
-from .theme import ModeType, Theme, get_builtin_theme
+from .icon_sprite import SPRITE_STYLE, sprite_file
+from .icon_subset import ICONS_STYLESHEET, icon_stylesheet
+from .purge import ClassUsage, purged_stylesheet
+from .static import CompressedStaticFiles, asset_hashes, hashed_url
+from .theme import (
+    ModeType,
+    Theme,
+    get_builtin_theme,
+    resolve_defaults,
+    set_component_defaults,
+)
 
 # Bootstrap versions
 BOOTSTRAP_VERSION = "5.3.3"
@@ -47,14 +59,23 @@ CDN_ASSETS = (
 )
 
 
-def local_assets(static_url: str) -> tuple[Any, ...]:
-    """Generate local asset links for the given static URL."""
-    base = static_url.rstrip("/")
-    return (
-        Link(rel="stylesheet", href=f"{base}/css/bootstrap.min.css"),
-        Link(rel="stylesheet", href=f"{base}/css/bootstrap-icons.min.css"),
-        Script(src=f"{base}/js/bootstrap.bundle.min.js"),
-    )
+def local_assets(
+    static_url: str,
+    hashes: Mapping[str, str] | None = None,
+    stylesheet: str = "css/bootstrap.min.css",
+    icons_stylesheet: str | None = ICONS_STYLESHEET,
+) -> tuple[Any, ...]:
+    """Generate local asset links for the given static URL.
+
+    With ``hashes`` (see ``asset_hashes``) the URLs carry content hashes;
+    ``stylesheet`` and ``icons_stylesheet`` replace the full Bootstrap and
+    Bootstrap Icons CSS (e.g. with purged or subset copies). Pass
+    ``icons_stylesheet=None`` to leave out the icon font (sprite icons).
+    """
+    links = [Link(rel="stylesheet", href=hashed_url(static_url, stylesheet, hashes))]
+    if icons_stylesheet is not None:
+        links.append(Link(rel="stylesheet", href=hashed_url(static_url, icons_stylesheet, hashes)))
+    return (*links, Script(src=hashed_url(static_url, "js/bootstrap.bundle.min.js", hashes)))
 
 
 # Custom FastStrap enhancements
@@ -116,12 +137,39 @@ INIT_SCRIPT = Script(
 )
 
 
+def _generated_asset(
+    build: Callable[[], str], what: str, instead: str = "serving the full one"
+) -> str | None:
+    """Path of a generated asset, or None (with a warning) if it cannot be written."""
+    try:
+        return build()
+    except OSError as e:
+        warnings.warn(
+            f"FastStrap: Could not write the {what} ({e}); {instead}.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return None
+
+
+def _usage(classes: str | os.PathLike[str] | Iterable[str]) -> Iterable[str]:
+    """Classes from a file saved by ``ClassUsage.save`` or an iterable."""
+    if isinstance(classes, (str, os.PathLike)):
+        return ClassUsage.load(classes)
+    return classes
+
+
 def get_assets(
     use_cdn: bool | None = None,
     include_custom: bool = True,
     static_url: str | None = None,
     theme: str | Theme | None = None,
     mode: ModeType = "light",
+    hash_assets: bool = False,
+    purge_css: str | os.PathLike[str] | Iterable[str] | None = None,
+    safelist: Iterable[str] = (),
+    subset_icons: str | os.PathLike[str] | Iterable[str] | None = None,
+    icon_mode: IconMode | None = None,
 ) -> tuple[Any, ...]:
     """
     Get Bootstrap assets for injection.
@@ -132,6 +180,14 @@ def get_assets(
         static_url: Custom static URL (if using local assets)
         theme: Theme name (str) or Theme instance
         mode: Color mode - "light", "dark", or "auto"
+        hash_assets: Emit content-hashed local URLs (served by ``CompressedStaticFiles``)
+        purge_css: Classes in use (a file saved by ``purge.ClassUsage`` or an
+                   iterable); link a local stylesheet reduced to those classes
+        safelist: Extra classes or patterns to keep when purging
+        subset_icons: Icons in use (names, or a file saved by ``purge.ClassUsage``);
+                      link a local Bootstrap Icons subset with only those glyphs
+        icon_mode: "font" links the icon font; "sprite" leaves it out for SVG
+                   sprite icons (default: the ``Icon`` component default)
 
     Returns:
         Tuple of FastHTML elements for app.hdrs
@@ -139,13 +195,40 @@ def get_assets(
     if use_cdn is None:
         use_cdn = environ.get("FASTSTRAP_USE_CDN", "false").lower() == "true"
 
+    if icon_mode is None:
+        icon_mode = resolve_defaults("Icon")["mode"]
+    sprite = icon_mode == "sprite"
+
     if use_cdn:
-        assets = CDN_ASSETS
+        assets = CDN_ASSETS if not sprite else (CDN_ASSETS[0], CDN_ASSETS[2])
     else:
         actual_static_url = static_url if static_url is not None else "/static"
-        assets = local_assets(actual_static_url)
+        static_path = get_static_path()
+        stylesheet = "css/bootstrap.min.css"
+        if purge_css is not None:
+            classes = purge_css
+            stylesheet = (
+                _generated_asset(
+                    lambda: purged_stylesheet(_usage(classes), static_path, safelist=safelist),
+                    "purged stylesheet",
+                )
+                or stylesheet
+            )
+        icons_stylesheet: str | None = ICONS_STYLESHEET
+        if sprite:
+            icons_stylesheet = None
+        elif subset_icons is not None:
+            icons = subset_icons
+            icons_stylesheet = (
+                _generated_asset(lambda: icon_stylesheet(_usage(icons), static_path), "icon subset")
+                or icons_stylesheet
+            )
+        hashes = asset_hashes(static_path) if hash_assets else None
+        assets = local_assets(actual_static_url, hashes, stylesheet, icons_stylesheet)
 
     elements = list(assets)
+    if sprite:
+        elements.append(Style(SPRITE_STYLE))
 
     if include_custom:
         elements.append(CUSTOM_STYLES)
@@ -174,6 +257,13 @@ def add_bootstrap(
     force_static_url: bool = False,
     include_favicon: bool = True,
     favicon_url: str | None = None,
+    precompress: bool = True,
+    hash_assets: bool = True,
+    purge_css: str | os.PathLike[str] | Iterable[str] | None = None,
+    safelist: Iterable[str] = (),
+    subset_icons: str | os.PathLike[str] | Iterable[str] | None = None,
+    icon_mode: IconMode | None = None,
+    sprite_icons: str | os.PathLike[str] | Iterable[str] | None = None,
 ) -> Any:
     """
     Enhance FastHTML app with Bootstrap (production-safe).
@@ -192,6 +282,25 @@ def add_bootstrap(
         force_static_url: Force use of this URL even if already mounted
         include_favicon: Include default FastStrap favicon
         favicon_url: Custom favicon URL (overrides default)
+        precompress: Write ``.br``/``.gz`` variants of the local CSS/JS on first
+                     use and serve them to clients that accept them
+        hash_assets: Link the local CSS/JS under content-hashed names served with
+                     immutable one-year caching (only when FastStrap mounts the files)
+        purge_css: Classes in use (a file saved by ``purge.ClassUsage`` or an
+                   iterable); serve Bootstrap's CSS reduced to those classes.
+                   Ignored in CDN mode.
+        safelist: Extra classes or ``fnmatch`` patterns kept when purging, on top
+                  of the classes Bootstrap's JavaScript toggles
+        subset_icons: Icons in use (names, or a file saved by ``purge.ClassUsage``);
+                      serve Bootstrap Icons CSS (and, with ``fonttools``, font)
+                      reduced to those glyphs. Ignored in CDN mode.
+        icon_mode: Set how every ``Icon`` (and ``Button(icon=...)``, ``StatCard``,
+                   ...) renders: "font" for the icon font, "sprite" for
+                   ``<svg><use href="#bi-name"/></svg>`` without the font
+                   download (default: leave the current setting)
+        sprite_icons: Icons for the sprite file in sprite mode (names, or a file
+                      saved by ``purge.ClassUsage``), served from the static
+                      mount; without it, add an inline ``IconSprite`` to pages
 
     Returns:
         Modified app instance
@@ -213,6 +322,15 @@ def add_bootstrap(
 
         # CDN mode for production
         add_bootstrap(app, theme="blue-ocean", mode="auto", use_cdn=True)
+
+        # Only the CSS rules for classes recorded with faststrap.purge
+        add_bootstrap(app, purge_css="faststrap-classes.txt", safelist=["text-bg-*"])
+
+        # Only the icons recorded in the same file
+        add_bootstrap(app, subset_icons="faststrap-classes.txt")
+
+        # SVG sprite icons from a cached sprite file instead of the icon font
+        add_bootstrap(app, icon_mode="sprite", sprite_icons="faststrap-classes.txt")
     """
     # Clean up any previous FastStrap state on this app
     if hasattr(app, "_faststrap_static_url"):
@@ -243,12 +361,38 @@ def add_bootstrap(
         favicon_links = create_favicon_links(default_favicon)
 
     # 3. Get Bootstrap assets with theme and mode
+    # Hashed names are only resolved by our own mount, not by a user's StaticFiles
+    serves_hashed = (
+        not use_cdn
+        and mount_static
+        and (hasattr(app, "_faststrap_static_url") or not is_mounted(app, actual_static_url))
+    )
+    sprite_url = None
+    if icon_mode == "sprite" and sprite_icons is not None and not use_cdn and mount_static:
+        static_path = get_static_path()
+        icons = sprite_icons
+        relative = _generated_asset(
+            lambda: sprite_file(_usage(icons), static_path),
+            "icon sprite",
+            "using the icon font",
+        )
+        if relative is None:
+            icon_mode = "font"
+        else:
+            hashes = asset_hashes(static_path) if hash_assets and serves_hashed else None
+            sprite_url = hashed_url(actual_static_url, relative, hashes)
+
     bootstrap_assets = get_assets(
         use_cdn=use_cdn,
         include_custom=True,
         static_url=actual_static_url if not use_cdn else None,
         theme=theme,
         mode=mode,
+        hash_assets=hash_assets and serves_hashed,
+        purge_css=purge_css,
+        safelist=safelist,
+        subset_icons=subset_icons,
+        icon_mode=icon_mode,
     )
 
     # 4. Idempotent Header Management
@@ -278,7 +422,7 @@ def add_bootstrap(
                 static_path = get_static_path()
                 app.mount(
                     actual_static_url,
-                    StaticFiles(directory=str(static_path)),
+                    CompressedStaticFiles(directory=str(static_path), compress=precompress),
                     name="faststrap_static",
                 )
                 app._faststrap_static_url = actual_static_url
@@ -298,6 +442,12 @@ def add_bootstrap(
                 mount_static=False,
                 include_favicon=include_favicon,
                 favicon_url=favicon_url,
+                # A sprite file is not reachable without the mount; inline sprites are
+                icon_mode=icon_mode if sprite_url is None else "font",
             )
 
+    # 7. Switch icons over once the sprite file (if any) is being served
+    if icon_mode is not None:
+        set_component_defaults("Icon", mode=icon_mode, sprite_url=sprite_url)
+
     return app
@@ -1,8 +1,12 @@
 """Base classes and protocols for FastStrap components."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any, Protocol
 
+# Callbacks receiving every merged class string (see faststrap.core.purge.collect)
+_class_recorders: list[Callable[[str], None]] = []
+
 
 class Component(Protocol):
     """Protocol for FastStrap components."""
@@ -64,4 +68,8 @@ def merge_classes(*class_lists: str | None) -> str:
                 classes.append(cls)
                 seen.add(cls)
 
-    return " ".join(classes)
+    merged = " ".join(classes)
+    if _class_recorders:
+        for record in _class_recorders:
+            record(merged)
+    return merged
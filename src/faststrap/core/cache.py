@@ -0,0 +1,348 @@
+"""Fragment cache for rendered component subtrees.
+
+Sections that are identical for every user (navbars, sidebars, pricing
+cards, heroes, footers) can be rendered once and reused. Cached fragments are
+stored as ``Safe`` HTML strings, so they splice back into a normal FT tree
+without re-parsing or re-escaping.
+
+Decorator form, keyed by the function arguments:
+
+    >>> @fragment(tags=("layout",), ttl=300)
+    ... def SiteNavbar(active: str):
+    ...     return Navbar(..., brand="Acme")
+
+Context-manager form, keyed explicitly:
+
+    >>> with fragment("footer", tags=("layout",)) as frag:
+    ...     if not frag.cached:
+    ...         frag.set(Footer(...))
+    >>> Div(content, frag)
+
+Invalidate by tag with ``invalidate("layout")``; inspect hit/miss counters
+with ``stats()``.
+
+Fragments are built in a content-hashed ID scope (``id_scope("hash")``), so
+IDs such as ``modal-3f9a1c2e`` stay unique next to the page's ``modal-1``.
+Keys are combined with the component defaults in effect (``component_defaults``
+blocks and ``set_component_defaults``), so a fragment rendered under one
+tenant's defaults is never served to another.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from types import TracebackType
+from typing import Any
+
+from fasthtml.common import Safe
+
+from .ids import id_scope
+from .render import _html_recorders, _record_html, render_html
+from .theme import defaults_key
+
+
+class FragmentCache:
+    """Thread-safe LRU cache of rendered HTML with TTL and tag invalidation.
+
+    Args:
+        maxsize: Maximum number of fragments kept (least recently used are evicted)
+        ttl: Default time-to-live in seconds (None = never expires)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[Safe, float | None, frozenset[str]]] = (
+            OrderedDict()
+        )
+        self._tags: dict[str, set[Hashable]] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, count=False) is not None
+
+    def get(self, key: Hashable, count: bool = True) -> Safe | None:
+        """Return cached HTML for ``key`` or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                html, expires, _ = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    if _html_recorders:
+                        # Hits skip rendering, so record the cached HTML itself
+                        _record_html(html)
+                    return html
+                self._remove(key)
+            if count:
+                self.misses += 1
+            return None
+
+    def set(
+        self,
+        key: Hashable,
+        content: Any,
+        tags: Iterable[str] = (),
+        ttl: float | None = None,
+    ) -> Safe:
+        """Render ``content`` (if needed) and store it under ``key``.
+
+        Returns:
+            The cached HTML as a Safe string
+        """
+        html = content if isinstance(content, Safe) else render_html(content)
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        tag_set = frozenset(tags)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (html, expires, tag_set)
+            for tag in tag_set:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return html
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a single entry. Returns True if it existed."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def invalidate(self, *tags: str) -> int:
+        """Remove every entry carrying any of ``tags``. Returns the count removed."""
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    if key in self._entries:
+                        self._remove(key)
+                        removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+# Process-wide default cache used by ``fragment`` when no cache is given
+default_cache = FragmentCache()
+
+
+class FragmentBlock:
+    """Context manager form of :func:`fragment` for explicitly keyed sections.
+
+    The block itself renders as the cached HTML, so it can be placed directly
+    into an FT tree after the ``with`` statement.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        tags: Iterable[str] = (),
+        ttl: float | None = None,
+        cache: FragmentCache | None = None,
+    ):
+        self.key = key
+        self.tags = tuple(tags)
+        self.ttl = ttl
+        self.cache = cache if cache is not None else default_cache
+        self.html: Safe | None = None
+        self._pending: Any = None
+        self._store_key: Hashable = (key, None)
+
+    @property
+    def cached(self) -> bool:
+        """Whether the fragment was served from the cache."""
+        return self.html is not None and self._pending is None
+
+    def set(self, content: Any) -> None:
+        """Provide the content to cache on a miss."""
+        self._pending = content
+        self.html = render_html(content)
+
+    def __enter__(self) -> FragmentBlock:
+        self._store_key = (self.key, defaults_key())
+        self.html = self.cache.get(self._store_key)
+        self._pending = None
+        self._ids = id_scope("hash")
+        self._ids.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._ids.__exit__(exc_type, exc, tb)
+        if exc_type is None and self._pending is not None and self.html is not None:
+            self.cache.set(self._store_key, self.html, tags=self.tags, ttl=self.ttl)
+
+    def __html__(self) -> str:
+        return self.html or ""
+
+
+def _tagged(value: Any) -> Hashable:
+    """Value paired with its type, so ``1``, ``True`` and ``1.0`` key separately."""
+    if isinstance(value, (tuple, frozenset)):
+        items = tuple(_tagged(item) for item in value)
+        return (type(value), items if isinstance(value, tuple) else frozenset(items))
+    return (type(value), value)
+
+
+def _make_key(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[Hashable, ...]:
+    key = (
+        func.__module__,
+        func.__qualname__,
+        tuple(_tagged(arg) for arg in args),
+        tuple(sorted((name, _tagged(value)) for name, value in kwargs.items())),
+    )
+    hash(key)  # raises TypeError for unhashable arguments
+    return key
+
+
+def _decorate(
+    func: Callable[..., Any],
+    tags: Iterable[str],
+    ttl: float | None,
+    cache: FragmentCache | None,
+) -> Callable[..., Safe]:
+    tag_tuple = tuple(tags)
+    store = cache if cache is not None else default_cache
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Safe:
+        try:
+            key = (*_make_key(func, args, kwargs), defaults_key())
+        except TypeError:
+            # Unhashable arguments: render without caching
+            with store._lock:
+                store.misses += 1
+            with id_scope("hash"):
+                return render_html(func(*args, **kwargs))
+
+        html = store.get(key)
+        if html is None:
+            with id_scope("hash"):
+                content = func(*args, **kwargs)
+            html = store.set(key, content, tags=tag_tuple, ttl=ttl)
+        return html
+
+    def invalidate(*args: Any, **kwargs: Any) -> bool:
+        """Drop the cached fragments for one set of arguments (under any defaults)."""
+        call = _make_key(func, args, kwargs)
+        with store._lock:
+            keys = [
+                key
+                for key in store._entries
+                if isinstance(key, tuple) and len(key) == len(call) + 1 and key[:-1] == call
+            ]
+            for key in keys:
+                store.delete(key)
+        return bool(keys)
+
+    wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+    wrapper.cache = store  # type: ignore[attr-defined]
+    return wrapper
+
+
+def fragment(
+    key: Hashable | Callable[..., Any] | None = None,
+    *,
+    tags: Iterable[str] = (),
+    ttl: float | None = None,
+    cache: FragmentCache | None = None,
+) -> Any:
+    """Cache the rendered HTML of a component subtree.
+
+    Works as a decorator (keyed by the function arguments) or, when given an
+    explicit key, as a context manager.
+
+    Args:
+        key: Function to decorate, or an explicit cache key for block usage
+        tags: Tags for bulk invalidation via ``invalidate(tag)``
+        ttl: Time-to-live in seconds (defaults to the cache's ttl)
+        cache: FragmentCache to use (defaults to the process-wide cache)
+
+    Returns:
+        Decorated function, decorator, or FragmentBlock context manager
+
+    Example:
+        >>> @fragment
+        ... def PricingCard(plan: str):
+        ...     return Card(..., title=plan)
+
+        >>> @fragment(tags=("nav",), ttl=60)
+        ... def SiteNavbar():
+        ...     return Navbar(...)
+
+        >>> with fragment("footer", tags=("layout",)) as frag:
+        ...     if not frag.cached:
+        ...         frag.set(Footer(...))
+    """
+    if callable(key):
+        return _decorate(key, tags, ttl, cache)
+    if key is None:
+        return lambda func: _decorate(func, tags, ttl, cache)
+    return FragmentBlock(key, tags=tags, ttl=ttl, cache=cache)
+
+
+def invalidate(*tags: str) -> int:
+    """Invalidate fragments in the default cache by tag."""
+    return default_cache.invalidate(*tags)
+
+
+def clear() -> None:
+    """Clear the default fragment cache."""
+    default_cache.clear()
+
+
+def stats() -> dict[str, Any]:
+    """Hit/miss counters of the default fragment cache."""
+    return default_cache.stats()
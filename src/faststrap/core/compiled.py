@@ -0,0 +1,186 @@
+"""Compiled component templates.
+
+``compile()`` freezes a component call into a precompiled HTML template with
+holes. The static keyword arguments are rendered once; dynamic slots (child
+text, ``href``, ``id``, ``hx-*`` values, ...) are filled in on every call using
+only escaping and string joining.
+
+Templates are built lazily, one per call signature (number of children plus
+the names of the dynamic keyword arguments). The component is rendered once
+with placeholder markers in every dynamic slot and the resulting HTML is split
+around those markers. Output is byte-identical to ``to_xml(Component(...))``.
+
+Anything that cannot be expressed as a hole falls back to the normal path:
+non-scalar values (FT elements, dicts, booleans, ``None``), empty values, and
+slots the component transforms instead of passing through verbatim.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from fasthtml.common import Safe, to_xml
+
+from .render import _html_recorders, _record_html, escape_text, render_attr
+
+# Private-use code points never appear in real markup and survive escaping.
+_MARK_OPEN = "\ue000"
+_MARK_CLOSE = "\ue001"
+_MARK_RE = re.compile(f"{_MARK_OPEN}(\\d+){_MARK_CLOSE}")
+_ATTR_HOLE_RE = re.compile(f" ([^\\s\"'=<>/]+)=([\"']){_MARK_OPEN}(\\d+){_MARK_CLOSE}\\2")
+
+# Keyword arguments that components merge or restructure rather than pass through
+_UNSLOTTABLE = frozenset({"cls", "style", "css_vars", "data", "aria"})
+
+# Template part kinds
+_TEXT = 0
+_ATTR = 1
+
+_Part = tuple[int, int, str]
+_Template = tuple[tuple[str, ...], tuple[_Part, ...]]
+
+
+def _marker(index: int) -> str:
+    return f"{_MARK_OPEN}{index}{_MARK_CLOSE}"
+
+
+def _is_slottable(value: Any) -> bool:
+    """Whether a dynamic value can be filled into a hole verbatim."""
+    if isinstance(value, bool) or not value:
+        return False
+    return isinstance(value, (str, int, float))
+
+
+def _split_template(html: str, slot_count: int) -> _Template | None:
+    """Split rendered HTML around slot markers.
+
+    Returns ``None`` when a marker sits somewhere that cannot be filled by a
+    plain escape (e.g. inside a merged class list) or a slot was dropped.
+    """
+    statics: list[str] = []
+    parts: list[_Part] = []
+    seen: set[int] = set()
+    pos = 0
+
+    # Keyed by the position of the marker inside the attribute value
+    attr_holes = {m.end(2): m for m in _ATTR_HOLE_RE.finditer(html)}
+
+    for match in _MARK_RE.finditer(html):
+        start = match.start()
+        slot = int(match.group(1))
+
+        # Whole attribute value: `name="<marker>"` (leading space stays static)
+        attr_match = attr_holes.get(start)
+        if attr_match is not None:
+            hole_start = attr_match.start() + 1
+            statics.append(html[pos:hole_start])
+            parts.append((_ATTR, slot, attr_match.group(1)))
+            pos = attr_match.end()
+        else:
+            # Text node: the last tag delimiter before the marker must be '>'
+            if html.rfind("<", 0, start) > html.rfind(">", 0, start):
+                return None
+            statics.append(html[pos:start])
+            parts.append((_TEXT, slot, ""))
+            pos = match.end()
+        seen.add(slot)
+
+    if len(seen) != slot_count:
+        return None
+
+    statics.append(html[pos:])
+    return tuple(statics), tuple(parts)
+
+
+class CompiledComponent:
+    """A component call frozen into an HTML template.
+
+    Create instances with :func:`compile`. Calling the instance with children
+    and keyword arguments returns the same HTML as ``to_xml`` of the regular
+    component call, as a ``Safe`` string that can be embedded in FT trees.
+    """
+
+    def __init__(self, component: Callable[..., Any], **static_kwargs: Any):
+        self.component = component
+        self.static_kwargs = static_kwargs
+        self._templates: dict[tuple[int, tuple[str, ...]], _Template | None] = {}
+
+    def __repr__(self) -> str:
+        name = getattr(self.component, "__name__", repr(self.component))
+        return f"CompiledComponent({name}, {self.static_kwargs!r})"
+
+    def render_ft(self, *children: Any, **kwargs: Any) -> Any:
+        """Build the regular FT tree for this call (the uncompiled path)."""
+        return self.component(*children, **{**self.static_kwargs, **kwargs})
+
+    def _build(self, child_count: int, names: tuple[str, ...]) -> _Template | None:
+        markers = [_marker(i) for i in range(child_count + len(names))]
+        try:
+            tree = self.render_ft(
+                *markers[:child_count], **dict(zip(names, markers[child_count:], strict=True))
+            )
+        except Exception:
+            return None
+        return _split_template(to_xml(tree), len(markers))
+
+    def __call__(self, *children: Any, **kwargs: Any) -> Safe:
+        names = tuple(kwargs)
+        if _UNSLOTTABLE.intersection(names) or not all(
+            _is_slottable(v) for v in (*children, *kwargs.values())
+        ):
+            return Safe(to_xml(self.render_ft(*children, **kwargs)))
+
+        key = (len(children), names)
+        if key not in self._templates:
+            template = self._build(len(children), names)
+            if template is not None:
+                # Guard against slots that steer rendering logic
+                expected = to_xml(self.render_ft(*children, **kwargs))
+                if _fill(template, (*children, *kwargs.values())) != expected:
+                    template = None
+            self._templates[key] = template
+
+        template = self._templates[key]
+        if template is None:
+            return Safe(to_xml(self.render_ft(*children, **kwargs)))
+        html = _fill(template, (*children, *kwargs.values()))
+        if _html_recorders:
+            # Template hits never build the FT tree, so record the output itself
+            _record_html(html)
+        return Safe(html)
+
+    def write(self, buf: list[str], *children: Any, **kwargs: Any) -> None:
+        """Append the rendered HTML for this call to a shared buffer."""
+        buf.append(self(*children, **kwargs))
+
+
+def _fill(template: _Template, values: tuple[Any, ...]) -> str:
+    statics, parts = template
+    out = [statics[0]]
+    for (kind, slot, name), static in zip(parts, statics[1:], strict=True):
+        if kind == _TEXT:
+            out.append(escape_text(values[slot]))
+        else:
+            out.append(render_attr(name, values[slot]))
+        out.append(static)
+    return "".join(out)
+
+
+def compile(component: Callable[..., Any], **static_kwargs: Any) -> CompiledComponent:
+    """Freeze a component call into a precompiled HTML template.
+
+    Args:
+        component: Any Faststrap component function (``Button``, ``Badge``, ...)
+        **static_kwargs: Arguments shared by every call (variant, size, cls, ...)
+
+    Returns:
+        Callable that accepts the dynamic children and keyword arguments
+
+    Example:
+        >>> save_btn = compile(Button, variant="success", size="sm")
+        >>> save_btn("Save", id="save-1", hx_post="/items/1")
+        '<button hx-post="/items/1" id="save-1" class="btn btn-success btn-sm" ...'
+    """
+    return CompiledComponent(component, **static_kwargs)
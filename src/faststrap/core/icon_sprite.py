@@ -0,0 +1,311 @@
+"""SVG sprite sheets for Bootstrap Icons.
+
+In sprite mode ``Icon`` renders ``<svg><use href="#bi-name"/></svg>`` instead
+of an icon-font glyph, so pages need no font download. The ``<symbol>``
+elements are built from the outlines in the bundled ``bootstrap-icons.woff``
+(TrueType outlines in a zlib-compressed WOFF container, read with the
+standard library) and delivered either inline with ``IconSprite`` or as a
+static file written by :func:`sprite_file`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import struct
+import threading
+import zlib
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+from ..utils.static_management import get_static_path
+from .icon_subset import ICONS_STYLESHEET, icon_names
+from .static import _write_atomic
+
+ICONS_WOFF = "css/fonts/bootstrap-icons.woff"
+SPRITE_STEM = "icons/bootstrap-icons.sprite"
+
+# Replaces the ``.bi::before`` rules of the icon stylesheet for sprite icons
+SPRITE_STYLE = "svg.bi{display:inline-block;vertical-align:-.125em;overflow:visible}"
+
+_RULE_RE = re.compile(r'\.bi-([\w-]+)::before\{content:"\\([0-9a-fA-F]+)"\}')
+
+# Composite glyph flags
+_ARG_WORDS, _ARGS_XY, _SCALE, _MORE, _XY_SCALE, _TWO_BY_TWO = 0x1, 0x2, 0x8, 0x20, 0x40, 0x80
+
+
+def _tables(data: bytes) -> dict[str, bytes]:
+    """Tables of a WOFF 1.0 or plain TrueType/OpenType font."""
+    tables: dict[str, bytes] = {}
+    if data[:4] == b"wOFF":
+        (count,) = struct.unpack_from(">H", data, 12)
+        for i in range(count):
+            tag, offset, size, orig_size, _ = struct.unpack_from(">4sIIII", data, 44 + 20 * i)
+            raw = data[offset : offset + size]
+            tables[tag.decode("latin-1")] = zlib.decompress(raw) if size < orig_size else raw
+    elif data[:4] in (b"\x00\x01\x00\x00", b"true"):
+        (count,) = struct.unpack_from(">H", data, 4)
+        for i in range(count):
+            tag, _, offset, size = struct.unpack_from(">4sIII", data, 12 + 16 * i)
+            tables[tag.decode("latin-1")] = data[offset : offset + size]
+    else:
+        raise ValueError("Unsupported font format (expected WOFF 1.0 or TrueType)")
+    if "glyf" not in tables:
+        raise ValueError("Font has no TrueType outlines")
+    return tables
+
+
+def _cmap(table: bytes) -> dict[int, int]:
+    """Codepoint -> glyph id from the best Unicode subtable (format 12 or 4)."""
+    (count,) = struct.unpack_from(">H", table, 2)
+    offsets = {}
+    for i in range(count):
+        platform, encoding, offset = struct.unpack_from(">HHI", table, 4 + 8 * i)
+        if platform in (0, 3):
+            offsets[struct.unpack_from(">H", table, offset)[0]] = offset
+    mapping: dict[int, int] = {}
+    if 12 in offsets:
+        offset = offsets[12]
+        (groups,) = struct.unpack_from(">I", table, offset + 12)
+        for i in range(groups):
+            start, end, glyph = struct.unpack_from(">III", table, offset + 16 + 12 * i)
+            for code in range(start, end + 1):
+                mapping[code] = glyph + code - start
+    elif 4 in offsets:
+        offset = offsets[4]
+        segments = struct.unpack_from(">H", table, offset + 6)[0] // 2
+        ends = struct.unpack_from(f">{segments}H", table, offset + 14)
+        starts_at = offset + 16 + 2 * segments
+        starts = struct.unpack_from(f">{segments}H", table, starts_at)
+        deltas = struct.unpack_from(f">{segments}h", table, starts_at + 2 * segments)
+        ranges_at = starts_at + 4 * segments
+        range_offsets = struct.unpack_from(f">{segments}H", table, ranges_at)
+        for i in range(segments):
+            for code in range(starts[i], ends[i] + 1):
+                if code == 0xFFFF:
+                    continue
+                if range_offsets[i] == 0:
+                    glyph = (code + deltas[i]) & 0xFFFF
+                else:
+                    at = ranges_at + 2 * i + range_offsets[i] + 2 * (code - starts[i])
+                    glyph = struct.unpack_from(">H", table, at)[0]
+                    glyph = (glyph + deltas[i]) & 0xFFFF if glyph else 0
+                if glyph:
+                    mapping[code] = glyph
+    return mapping
+
+
+class _Font:
+    """Glyph outlines of a TrueType font, converted to SVG path data on demand."""
+
+    def __init__(self, data: bytes):
+        tables = _tables(data)
+        self.units_per_em = struct.unpack_from(">H", tables["head"], 18)[0]
+        long_loca = struct.unpack_from(">h", tables["head"], 50)[0] == 1
+        glyph_count = struct.unpack_from(">H", tables["maxp"], 4)[0]
+        self.ascent = struct.unpack_from(">h", tables["hhea"], 4)[0]
+        metrics = struct.unpack_from(">H", tables["hhea"], 34)[0]
+        self.advances = [struct.unpack_from(">H", tables["hmtx"], 4 * i)[0] for i in range(metrics)]
+        if long_loca:
+            self.loca = struct.unpack_from(f">{glyph_count + 1}I", tables["loca"])
+        else:
+            self.loca = tuple(
+                2 * v for v in struct.unpack_from(f">{glyph_count + 1}H", tables["loca"])
+            )
+        self.glyf = tables["glyf"]
+        self.cmap = _cmap(tables["cmap"])
+
+    def advance(self, glyph: int) -> int:
+        return self.advances[min(glyph, len(self.advances) - 1)]
+
+    def contours(self, glyph: int, depth: int = 0) -> list[list[tuple[float, float, bool]]]:
+        """Contours of ``glyph`` as ``(x, y, on_curve)`` points in font units."""
+        start, end = self.loca[glyph], self.loca[glyph + 1]
+        if start == end or depth > 8:
+            return []
+        data = self.glyf
+        (count,) = struct.unpack_from(">h", data, start)
+        at = start + 10
+        if count < 0:
+            return self._composite(at, depth)
+        ends = struct.unpack_from(f">{count}H", data, at)
+        at += 2 * count
+        (instructions,) = struct.unpack_from(">H", data, at)
+        at += 2 + instructions
+        total = ends[-1] + 1 if ends else 0
+        flags: list[int] = []
+        while len(flags) < total:
+            flag = data[at]
+            at += 1
+            flags.append(flag)
+            if flag & 0x8:
+                flags.extend([flag] * data[at])
+                at += 1
+        coords = []
+        for short, same in ((0x2, 0x10), (0x4, 0x20)):
+            value, values = 0, []
+            for flag in flags[:total]:
+                if flag & short:
+                    delta = data[at]
+                    at += 1
+                    value += delta if flag & same else -delta
+                elif not flag & same:
+                    value += struct.unpack_from(">h", data, at)[0]
+                    at += 2
+                values.append(value)
+            coords.append(values)
+        xs, ys = coords
+        points = [(x, y, bool(f & 1)) for x, y, f in zip(xs, ys, flags[:total], strict=True)]
+        contours, begin = [], 0
+        for last in ends:
+            contours.append(points[begin : last + 1])
+            begin = last + 1
+        return contours
+
+    def _composite(self, at: int, depth: int) -> list[list[tuple[float, float, bool]]]:
+        data, contours = self.glyf, []
+        while True:
+            flags, component = struct.unpack_from(">HH", data, at)
+            at += 4
+            if flags & _ARG_WORDS:
+                dx, dy = struct.unpack_from(">hh" if flags & _ARGS_XY else ">HH", data, at)
+                at += 4
+            else:
+                dx, dy = struct.unpack_from(">bb" if flags & _ARGS_XY else ">BB", data, at)
+                at += 2
+            if not flags & _ARGS_XY:
+                dx = dy = 0  # point-matching placement is not used by icon fonts
+            a, b, c, d = 1.0, 0.0, 0.0, 1.0
+            if flags & _SCALE:
+                a = d = struct.unpack_from(">h", data, at)[0] / 16384
+                at += 2
+            elif flags & _XY_SCALE:
+                a, d = (v / 16384 for v in struct.unpack_from(">hh", data, at))
+                at += 4
+            elif flags & _TWO_BY_TWO:
+                a, b, c, d = (v / 16384 for v in struct.unpack_from(">hhhh", data, at))
+                at += 8
+            for contour in self.contours(component, depth + 1):
+                contours.append(
+                    [(a * x + c * y + dx, b * x + d * y + dy, on) for x, y, on in contour]
+                )
+            if not flags & _MORE:
+                return contours
+
+    def path(self, glyph: int) -> str:
+        """SVG path data for ``glyph``, y axis flipped so the em box is ``0 0 em em``."""
+
+        def fmt(x: float, y: float) -> str:
+            return f"{round(x, 2):g} {round(self.ascent - y, 2):g}"
+
+        parts = []
+        for contour in self.contours(glyph):
+            if not contour:
+                continue
+            # Start on an on-curve point (or the implied midpoint of two off-curve ones)
+            first = next((i for i, p in enumerate(contour) if p[2]), None)
+            if first is None:
+                (x0, y0, _), (x1, y1, _) = contour[-1], contour[0]
+                start = ((x0 + x1) / 2, (y0 + y1) / 2)
+                points = contour
+            else:
+                start = contour[first][:2]
+                points = contour[first + 1 :] + contour[: first + 1]
+            parts.append("M" + fmt(*start))
+            control = None
+            for x, y, on in points:
+                if on:
+                    if control is None:
+                        parts.append("L" + fmt(x, y))
+                    else:
+                        parts.append("Q" + fmt(*control) + " " + fmt(x, y))
+                        control = None
+                elif control is None:
+                    control = (x, y)
+                else:
+                    mid = ((control[0] + x) / 2, (control[1] + y) / 2)
+                    parts.append("Q" + fmt(*control) + " " + fmt(*mid))
+                    control = (x, y)
+            if control is not None:
+                parts.append("Q" + fmt(*control) + " " + fmt(*start))
+            parts.append("Z")
+        return "".join(parts)
+
+
+_FONT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load(directory: str) -> tuple[_Font, dict[str, int]]:
+    root = Path(directory)
+    codepoints = {
+        name: int(code, 16)
+        for name, code in _RULE_RE.findall((root / ICONS_STYLESHEET).read_text(encoding="utf-8"))
+    }
+    return _Font((root / ICONS_WOFF).read_bytes()), codepoints
+
+
+@lru_cache(maxsize=4096)
+def _symbol(directory: str, name: str) -> str:
+    with _FONT_LOCK:
+        font, codepoints = _load(directory)
+    glyph = font.cmap.get(codepoints.get(name, -1))
+    if not glyph:
+        return ""
+    em = font.units_per_em
+    return (
+        f'<symbol id="bi-{name}" viewBox="0 0 {font.advance(glyph)} {em}">'
+        f'<path d="{font.path(glyph)}"/></symbol>'
+    )
+
+
+def sprite_symbols(icons: Iterable[str], directory: str | os.PathLike[str] | None = None) -> str:
+    """``<symbol>`` markup for the given icons; unknown names are skipped.
+
+    Args:
+        icons: Icon names (``"house"``) or classes (``"bi-house"``)
+        directory: Static directory holding the icon stylesheet and WOFF font
+                   (default: FastStrap's own)
+
+    Raises:
+        OSError: If the font or stylesheet cannot be read
+    """
+    root = os.fspath(directory if directory is not None else get_static_path())
+    return "".join(_symbol(root, name) for name in icon_names(icons))
+
+
+def sprite_sheet(icons: Iterable[str], directory: str | os.PathLike[str] | None = None) -> str:
+    """Standalone SVG document holding a ``<symbol>`` per icon."""
+    symbols = sprite_symbols(icons, directory)
+    return f'<svg xmlns="http://www.w3.org/2000/svg">{symbols}</svg>\n'
+
+
+def sprite_file(
+    icons: Iterable[str],
+    directory: str | os.PathLike[str],
+    source: str | os.PathLike[str] | None = None,
+) -> str:
+    """Write the sprite sheet for ``icons`` into ``directory``; return its relative path.
+
+    The file name carries a hash of the icon set, so an unchanged set is not
+    rebuilt and its URL can be cached for good.
+
+    Args:
+        icons: Icon names (``"house"``) or classes (``"bi-house"``)
+        directory: Static directory to write to
+        source: Directory holding the icon stylesheet and WOFF font
+                (default: FastStrap's own)
+
+    Raises:
+        OSError: If the font cannot be read or the sheet cannot be written
+    """
+    names = icon_names(icons)
+    key = hashlib.sha256("\n".join(names).encode()).hexdigest()[:10]
+    relative = f"{SPRITE_STEM}-{key}.svg"
+    target = Path(directory) / relative
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(target, sprite_sheet(names, source).encode("utf-8"))
+    return relative
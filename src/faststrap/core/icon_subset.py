@@ -0,0 +1,120 @@
+"""Subset Bootstrap Icons down to the glyphs an app uses.
+
+The full icon stylesheet declares 2000+ ``.bi-*`` rules and its font holds
+every glyph. Given the icon names recorded by :func:`faststrap.purge.collect`
+(or listed by hand), :func:`icon_stylesheet` writes a stylesheet with only
+those rules and, when ``fonttools`` with WOFF2 support is installed
+(``pip install "fonttools[woff]"``), a WOFF2 font with only those glyphs:
+
+    >>> add_bootstrap(app, subset_icons="faststrap-classes.txt")
+    >>> add_bootstrap(app, subset_icons=["house", "gear", "person-circle"])
+
+Without ``fonttools`` the subset stylesheet keeps pointing at the full font.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .purge import purge_css
+from .static import _brotli, _write_atomic
+
+ICONS_STYLESHEET = "css/bootstrap-icons.min.css"
+ICONS_FONT = "css/fonts/bootstrap-icons.woff2"
+
+_CONTENT_RE = re.compile(r'content:"\\([0-9a-fA-F]+)"')
+_FONT_SRC_RE = re.compile(r"(@font-face\{[^}]*?font-family:bootstrap-icons[^}]*?)src:[^;}]*")
+
+
+def _subsetter() -> Any:
+    """``fontTools.subset`` if it can write WOFF2 (needs brotli), else None."""
+    try:
+        from fontTools import subset
+    except ImportError:
+        return None
+    return subset if _brotli() is not None else None
+
+
+def icon_names(icons: Iterable[str]) -> list[str]:
+    """Normalize icon names or ``bi-<name>`` classes to sorted, unique names."""
+    names = {icon[3:] if icon.startswith("bi-") else icon for icon in icons}
+    names.discard("")
+    names.discard("bi")
+    return sorted(names)
+
+
+def subset_font(source: str | os.PathLike[str], codepoints: Iterable[int]) -> bytes:
+    """Return a WOFF2 copy of the font ``source`` holding only ``codepoints``.
+
+    Raises:
+        ImportError: If ``fonttools`` or ``brotli`` is not installed
+    """
+    subset = _subsetter()
+    if subset is None:
+        raise ImportError('Font subsetting requires "fonttools[woff]"')
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    font = subset.load_font(os.fspath(source), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=set(codepoints))
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    subset.save_font(font, buffer, options)
+    return buffer.getvalue()
+
+
+def icon_stylesheet(
+    icons: Iterable[str],
+    directory: str | os.PathLike[str],
+    source: str = ICONS_STYLESHEET,
+    font: str = ICONS_FONT,
+) -> str:
+    """Write a Bootstrap Icons subset next to ``source`` and return its relative path.
+
+    Unknown names are ignored. Files are named after the icon set, so an
+    unchanged set is not subset again and the URLs change with the set.
+
+    Args:
+        icons: Icon names (``"house"``) or classes (``"bi-house"``)
+        directory: Static directory holding ``source`` and ``font``
+        source: Icon stylesheet path relative to ``directory``
+        font: WOFF2 font path relative to ``directory``
+
+    Returns:
+        Path of the subset stylesheet relative to ``directory``
+
+    Raises:
+        OSError: If the source files cannot be read or the subset cannot be written
+    """
+    names = icon_names(icons)
+    subset = _subsetter()
+    key_source = "\n".join([*names, "woff2" if subset is not None else ""])
+    key = hashlib.sha256(key_source.encode()).hexdigest()[:10]
+    stem = source.rsplit(".min.css", 1)[0].rsplit(".css", 1)[0]
+    relative = f"{stem}.subset-{key}.min.css"
+    root = Path(directory)
+    target = root / relative
+    if target.exists():
+        return relative
+
+    css = purge_css(
+        (root / source).read_text(encoding="utf-8"),
+        ["bi", *(f"bi-{name}" for name in names)],
+        safelist=(),
+    )
+    if subset is not None:
+        codepoints = {int(code, 16) for code in _CONTENT_RE.findall(css)}
+        font_stem = font.rsplit(".woff2", 1)[0]
+        font_relative = f"{font_stem}.subset-{key}.woff2"
+        _write_atomic(root / font_relative, subset_font(root / font, codepoints))
+        url = os.path.relpath(font_relative, os.path.dirname(relative) or ".").replace(os.sep, "/")
+        css = _FONT_SRC_RE.sub(lambda m: f'{m.group(1)}src:url("{url}") format("woff2")', css)
+    _write_atomic(target, css.encode("utf-8"))
+    return relative
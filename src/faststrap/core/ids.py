@@ -0,0 +1,162 @@
+"""Deterministic element ID generation.
+
+Components that need an ID the caller did not supply (``Modal``, ``Drawer``,
+``Accordion``, ``Navbar`` togglers) ask :func:`unique_id` for one instead of
+using ``uuid4``/``random``. Identical inputs then render identical HTML, which
+keeps fragment caching, ETags and HTTP caches effective.
+
+IDs come from an ``IdScope`` held in a ``contextvars.ContextVar``. Outside an
+explicit scope each task (or thread) copies the counters it inherited on its
+first ID and then counts in place, so every ASGI request (which runs in its own
+copy of the context) counts from the same starting point and renders the same
+IDs. Use :func:`id_scope` to start from zero explicitly (scripts, tests).
+Cached fragments (``faststrap.cache``) always use content-hashed IDs, so they
+never clash with the counter IDs of the page they are spliced into.
+
+Two strategies are built in:
+
+- ``"counter"`` (default): ``modal-1``, ``modal-2``, ... per prefix
+- ``"hash"``: content-hashed, e.g. ``modal-3f9a1c2e``, stable regardless of
+  render order; repeated content within a scope gets a ``-2``, ``-3`` suffix
+
+Any callable ``(scope, prefix, content) -> str`` can be plugged in with
+:func:`set_id_provider`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Literal
+
+
+class IdScope:
+    """Per-render ID state: counters keyed by prefix (or prefix + digest)."""
+
+    def __init__(
+        self,
+        provider: IdProvider | None = None,
+        counters: dict[str, int] | None = None,
+        implicit: bool = False,
+        owner: object = None,
+    ):
+        self.provider = provider
+        self.counters: dict[str, int] = counters if counters is not None else {}
+        self.implicit = implicit
+        self.owner = owner
+
+    def next(self, key: str) -> int:
+        """Increment and return the counter for ``key`` (starting at 1)."""
+        value = self.counters.get(key, 0) + 1
+        self.counters[key] = value
+        return value
+
+
+IdProvider = Callable[[IdScope, str, tuple[Any, ...]], str]
+
+
+def counter_id(scope: IdScope, prefix: str, content: tuple[Any, ...]) -> str:
+    """Sequential IDs per prefix: ``modal-1``, ``modal-2``, ..."""
+    return f"{prefix}-{scope.next(prefix)}"
+
+
+def hashed_id(scope: IdScope, prefix: str, content: tuple[Any, ...]) -> str:
+    """Content-hashed IDs, de-duplicated within the scope."""
+    digest = hashlib.blake2s(repr(content).encode("utf-8"), digest_size=4).hexdigest()
+    base = f"{prefix}-{digest}"
+    count = scope.next(base)
+    return base if count == 1 else f"{base}-{count}"
+
+
+_STRATEGIES: dict[str, IdProvider] = {"counter": counter_id, "hash": hashed_id}
+
+_provider: IdProvider = counter_id
+_current_scope: ContextVar[IdScope | None] = ContextVar("faststrap_id_scope", default=None)
+
+
+def _resolve(provider: IdProvider | Literal["counter", "hash"] | None) -> IdProvider | None:
+    if provider is None or callable(provider):
+        return provider
+    try:
+        return _STRATEGIES[provider]
+    except KeyError:
+        raise ValueError(
+            f"Unknown ID strategy '{provider}'. Available: {', '.join(_STRATEGIES)}"
+        ) from None
+
+
+def set_id_provider(provider: IdProvider | Literal["counter", "hash"]) -> None:
+    """Set the process-wide ID provider.
+
+    Args:
+        provider: ``"counter"``, ``"hash"`` or a callable ``(scope, prefix, content) -> str``
+
+    Example:
+        >>> set_id_provider("hash")
+        >>> set_id_provider(lambda scope, prefix, content: f"{prefix}-{uuid4().hex}")
+    """
+    global _provider
+    resolved = _resolve(provider)
+    if resolved is None:
+        raise ValueError("provider must not be None")
+    _provider = resolved
+
+
+def get_id_provider() -> IdProvider:
+    """Return the process-wide ID provider."""
+    return _provider
+
+
+@contextmanager
+def id_scope(provider: IdProvider | Literal["counter", "hash"] | None = None) -> Iterator[IdScope]:
+    """Start a fresh ID scope (counters reset) for the duration of the block.
+
+    Args:
+        provider: Optional provider overriding the process-wide one in this scope
+
+    Example:
+        >>> with id_scope():
+        ...     page = Div(Modal("Hi"), Modal("There"))  # modal-1, modal-2
+    """
+    scope = IdScope(_resolve(provider))
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def _owner() -> object:
+    """The running asyncio task, or the current thread outside an event loop."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task if task is not None else threading.get_ident()
+
+
+def unique_id(prefix: str, *content: Any) -> str:
+    """Generate an element ID in the current scope.
+
+    Args:
+        prefix: ID prefix (e.g. ``"modal"``)
+        *content: Values describing the element (used by content-hashing providers)
+
+    Returns:
+        Deterministic ID string
+    """
+    scope = _current_scope.get()
+    if scope is None or scope.implicit:
+        # No explicit scope: copy the inherited counters once per task/thread so
+        # concurrent contexts never share state, then count in place
+        owner = _owner()
+        if scope is None or scope.owner != owner:
+            counters = dict(scope.counters) if scope is not None else {}
+            scope = IdScope(counters=counters, implicit=True, owner=owner)
+            _current_scope.set(scope)
+    provider = scope.provider or _provider
+    return provider(scope, prefix, content)
@@ -0,0 +1,49 @@
+"""Lazy attribute loading for package namespaces (PEP 562).
+
+``import faststrap`` should not pay for importing every component module,
+FastHTML and Starlette up front. Packages declare their public names in a
+static table mapping each name to ``"module"`` or ``"module:attribute"``; the
+module is imported the first time the name is accessed and the value is then
+stored on the package, so later lookups are plain attribute access.
+
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {"Button": ".components.forms:Button"})
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Args:
+        package: ``__name__`` of the package defining the exports
+        exports: Public name to ``"module"`` or ``"module:attribute"``
+            (relative module names are resolved against ``package``)
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at module level
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            target = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        module_name, _, attr = target.partition(":")
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, attr) if attr else module
+        # Cache on the package so __getattr__ is not hit again for this name
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
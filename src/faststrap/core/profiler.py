@@ -0,0 +1,390 @@
+"""Per-component render profiler.
+
+Answers "which component makes this page slow?" by recording, for every
+registered component (see ``core.registry``), the number of calls, the
+cumulative and self time spent building it and the size of what it emitted
+(FT nodes and rendered bytes).
+
+Profiling is opt-in. Components are only wrapped while a :func:`profile`
+block is active (the wrappers are removed again when the last one exits) or
+after :func:`instrument` / :class:`ProfilerMiddleware`; otherwise they are
+the plain functions with zero overhead. Once instrumented, a component call
+outside a profiling block costs one ``ContextVar`` lookup;
+:func:`uninstrument` restores the original functions.
+
+    >>> with profile() as prof:
+    ...     page = dashboard()
+    >>> print(prof.report())
+    >>> prof.to_json()
+
+Per request, as ASGI middleware, exporting to a metrics system:
+
+    >>> app = ProfilerMiddleware(app, callback=lambda prof: statsd.send(prof.to_dict()))
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastcore.foundation import L
+from fastcore.xml import FT
+
+from .registry import COMPONENT_MANIFEST, _component_registry
+from .render import render_html
+
+ProfileCallback = Callable[["RenderProfile"], None]
+
+
+@dataclass
+class ComponentStats:
+    """Aggregated measurements for one component within a profile."""
+
+    calls: int = 0
+    cumulative: float = 0.0
+    self_time: float = 0.0
+    nodes: int = 0
+    bytes: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "cumulative_ms": round(self.cumulative * 1000, 3),
+            "self_ms": round(self.self_time * 1000, 3),
+            "nodes": self.nodes,
+            "bytes": self.bytes,
+        }
+
+
+@dataclass
+class RenderProfile:
+    """Result of one profiling block (typically one request).
+
+    ``nodes`` and ``bytes`` are inclusive: a ``Card`` containing a ``Button``
+    counts the button's markup too. Times are in seconds. Children passed as
+    arguments are built before their parent, so only components a component
+    creates internally (``Modal`` -> ``CloseButton``) count towards its
+    cumulative time.
+    """
+
+    label: str = ""
+    duration: float = 0.0
+    components: dict[str, ComponentStats] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "label": self.label,
+            "duration_ms": round(self.duration * 1000, 3),
+            "components": {name: stats.to_dict() for name, stats in self.components.items()},
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Serialize the profile as JSON (keyword arguments go to ``json.dumps``)."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def report(self, sort: str = "self_time", limit: int | None = None) -> str:
+        """Format the profile as a text table.
+
+        Args:
+            sort: ``ComponentStats`` field to sort by (descending)
+            limit: Show only the first ``limit`` rows
+
+        Returns:
+            Multi-line report
+        """
+        rows = sorted(self.components.items(), key=lambda item: -getattr(item[1], sort))
+        if limit is not None:
+            rows = rows[:limit]
+
+        header = (
+            f"{'component':<20} {'calls':>7} {'cum ms':>10} {'self ms':>10} "
+            f"{'nodes':>8} {'bytes':>10}"
+        )
+        lines = [
+            f"{self.label or 'render profile'}: {self.duration * 1000:.3f} ms",
+            header,
+            "-" * len(header),
+        ]
+        for name, s in rows:
+            lines.append(
+                f"{name:<20} {s.calls:>7} {s.cumulative * 1000:>10.3f} "
+                f"{s.self_time * 1000:>10.3f} {s.nodes:>8} {s.bytes:>10}"
+            )
+        return "\n".join(lines)
+
+
+class _Session:
+    """Mutable state of an active profiling block."""
+
+    def __init__(self, label: str, measure_output: bool):
+        self.profile = RenderProfile(label=label)
+        self.measure_output = measure_output
+        self.child_time: list[float] = []
+        self.depth: dict[str, int] = {}
+        self.outputs: list[tuple[str, Any]] = []
+
+    def call(self, name: str, func: Callable[..., Any], args: Any, kwargs: Any) -> Any:
+        stack = self.child_time
+        depth = self.depth
+        stack.append(0.0)
+        depth[name] = depth.get(name, 0) + 1
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            depth[name] -= 1
+
+            stats = self.profile.components.get(name)
+            if stats is None:
+                stats = self.profile.components[name] = ComponentStats()
+            stats.calls += 1
+            stats.self_time += elapsed - children
+            if not depth[name]:
+                # Recursive calls (Row inside Row) count once towards cumulative time
+                stats.cumulative += elapsed
+        if self.measure_output:
+            self.outputs.append((name, result))
+        return result
+
+    def finish(self) -> RenderProfile:
+        # Output is measured after the block so it does not skew the timings
+        components = self.profile.components
+        for name, result in self.outputs:
+            stats = components[name]
+            nodes, lazy = _count_nodes(result)
+            stats.nodes += nodes
+            if not lazy:
+                # Rendering a lazy row source would consume it before the real render
+                stats.bytes += len(render_html(result).encode("utf-8"))
+        self.outputs.clear()
+        return self.profile
+
+
+def _count_nodes(elm: Any) -> tuple[int, bool]:
+    """Count FT nodes, and report whether the tree holds lazy rows (left unread)."""
+    if hasattr(elm, "__ft_batches__"):
+        return 0, True
+    if hasattr(elm, "__ft__") and not isinstance(elm, FT):
+        elm = elm.__ft__()
+    if isinstance(elm, (list, tuple, L)):
+        children, nodes = elm, 0
+    elif isinstance(elm, FT):
+        children, nodes = elm.children, 1
+    else:
+        return 0, False
+    lazy = False
+    for child in children:
+        count, child_lazy = _count_nodes(child)
+        nodes += count
+        lazy = lazy or child_lazy
+    return nodes, lazy
+
+
+_session: ContextVar[_Session | None] = ContextVar("faststrap_profile", default=None)
+
+# original function -> instrumented wrapper (and back) while instrumented
+_wrappers: dict[Callable[..., Any], Callable[..., Any]] = {}
+_lock = threading.Lock()
+# Active profile() blocks, and whether instrument() was called explicitly
+_active_sessions = 0
+_pinned = False
+
+
+def _wrap(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        session = _session.get()
+        if session is None:
+            return func(*args, **kwargs)
+        return session.call(name, func, args, kwargs)
+
+    wrapper.__faststrap_profiled__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _patch_modules(replacements: dict[Callable[..., Any], Callable[..., Any]]) -> None:
+    """Swap every module-level reference to a key for its value."""
+    # Keyed by identity so arbitrary module attributes are never hashed or compared
+    by_id = {id(old): new for old, new in replacements.items()}
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+        if not namespace:
+            continue
+        for attr, value in list(namespace.items()):
+            replacement = by_id.get(id(value))
+            if replacement is not None and value in replacements:
+                setattr(module, attr, replacement)
+
+
+def is_instrumented() -> bool:
+    """Whether component wrappers are currently installed."""
+    return bool(_wrappers)
+
+
+def _install() -> None:
+    # Caller holds _lock
+    if _wrappers:
+        return
+    for name, (module_name, _) in COMPONENT_MANIFEST.items():
+        func = getattr(importlib.import_module(module_name), name)
+        _wrappers[func] = _wrap(name, func)
+    for name, meta in _component_registry.items():
+        func = meta["func"]
+        if name not in COMPONENT_MANIFEST and func not in _wrappers:
+            _wrappers[func] = _wrap(name, func)
+    _patch_modules(_wrappers)
+
+
+def _uninstall() -> None:
+    # Caller holds _lock
+    if not _wrappers:
+        return
+    _patch_modules({wrapper: func for func, wrapper in _wrappers.items()})
+    _wrappers.clear()
+
+
+def instrument() -> None:
+    """Wrap every registered component for profiling until :func:`uninstrument`.
+
+    Imports the modules in the component manifest and replaces each component
+    in every loaded module that references it (the Faststrap packages as well
+    as application modules that did ``from faststrap import Button``).
+    Calling it again is a no-op. :func:`profile` blocks instrument on their
+    own for their duration; call this to keep the wrappers installed between
+    blocks (e.g. when profiling every request).
+    """
+    global _pinned
+    with _lock:
+        _pinned = True
+        _install()
+
+
+def uninstrument() -> None:
+    """Remove the component wrappers installed by :func:`instrument`."""
+    global _pinned
+    with _lock:
+        _pinned = False
+        _uninstall()
+
+
+def _enter_session() -> None:
+    global _active_sessions
+    with _lock:
+        _active_sessions += 1
+        _install()
+
+
+def _exit_session() -> None:
+    global _active_sessions
+    with _lock:
+        _active_sessions -= 1
+        if not _active_sessions and not _pinned:
+            _uninstall()
+
+
+@contextmanager
+def profile(
+    label: str = "",
+    callback: ProfileCallback | None = None,
+    measure_output: bool = True,
+) -> Iterator[RenderProfile]:
+    """Profile component calls made inside the block.
+
+    The profile is context-local: concurrent requests profiled at the same
+    time each get their own report.
+
+    Args:
+        label: Name shown in the report (e.g. the request path)
+        callback: Called with the finished profile (export to metrics here)
+        measure_output: Count emitted nodes and bytes (renders each output once;
+            outputs holding lazy ``TBody(rows=...)`` sources count nodes only)
+
+    Yields:
+        RenderProfile, complete once the block exits
+
+    Example:
+        >>> with profile("/dashboard") as prof:
+        ...     page = dashboard()
+        >>> print(prof.report(limit=10))
+    """
+    _enter_session()
+    session = _Session(label, measure_output)
+    token = _session.set(session)
+    start = time.perf_counter()
+    try:
+        yield session.profile
+    finally:
+        session.profile.duration = time.perf_counter() - start
+        _session.reset(token)
+        _exit_session()
+        session.finish()
+        if callback is not None:
+            callback(session.profile)
+
+
+class ProfilerMiddleware:
+    """ASGI middleware that profiles component calls per HTTP request.
+
+    Args:
+        app: ASGI application to wrap
+        callback: Called with each request's ``RenderProfile``
+        server_timing: Add a ``Server-Timing`` header with the slowest components
+        top: Number of components listed in the ``Server-Timing`` header
+
+    Example:
+        >>> app = FastHTML()
+        >>> app.add_middleware(ProfilerMiddleware, callback=export_profile)
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        callback: ProfileCallback | None = None,
+        server_timing: bool = True,
+        top: int = 5,
+    ):
+        self.app = app
+        self.callback = callback
+        self.server_timing = server_timing
+        self.top = top
+        instrument()
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope.get('method', 'GET')} {scope.get('path', '')}"
+        with profile(label, callback=self.callback) as prof:
+
+            async def send_wrapper(message: dict[str, Any]) -> None:
+                if self.server_timing and message["type"] == "http.response.start":
+                    timing = _server_timing(prof, self.top)
+                    if timing:
+                        headers = list(message.get("headers", []))
+                        headers.append((b"server-timing", timing.encode("latin-1")))
+                        message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+def _server_timing(prof: RenderProfile, top: int) -> str:
+    rows = sorted(prof.components.items(), key=lambda item: -item[1].self_time)[:top]
+    return ", ".join(
+        f'fs-{name};dur={stats.self_time * 1000:.2f};desc="{name} x{stats.calls}"'
+        for name, stats in rows
+    )
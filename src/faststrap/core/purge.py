@@ -0,0 +1,478 @@
+"""Purge Bootstrap's stylesheet down to the classes an app uses.
+
+Record the classes while exercising the app, save them, and let
+``add_bootstrap`` serve a stylesheet containing only the matching rules:
+
+    >>> with purge.collect() as usage:       # e.g. around the test suite
+    ...     purge.crawl(app, ["/", "/users", "/settings"], usage)
+    >>> usage.save("faststrap-classes.txt")
+    >>> add_bootstrap(app, purge_css="faststrap-classes.txt")
+
+Classes are recorded from the rendered output: the ``class`` attributes of
+every tree passed through ``to_xml``, ``render_html`` or streaming (covering
+literal ``cls=`` values in components and app code), cached fragments and
+compiled-template hits, plus every ``merge_classes`` call. Classes that Bootstrap's
+JavaScript adds at runtime are kept by :data:`SAFELIST`; add your own
+dynamic classes with ``safelist`` (``fnmatch`` patterns such as ``"text-bg-*"``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import re
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any
+
+import fastcore.xml as _fcxml
+
+from ..utils import icons as _icons
+from . import base, render
+
+# Classes added by Bootstrap's JavaScript (and htmx), never seen in server HTML
+SAFELIST: tuple[str, ...] = (
+    "active",
+    "show",
+    "showing",
+    "hide",
+    "hiding",
+    "fade",
+    "collapse",
+    "collapsing",
+    "collapsed",
+    "disabled",
+    "modal-open",
+    "modal-backdrop",
+    "modal-static",
+    "offcanvas-backdrop",
+    "dropdown-menu-end",
+    "was-validated",
+    "is-valid",
+    "is-invalid",
+    "tooltip",
+    "tooltip-inner",
+    "tooltip-arrow",
+    "popover",
+    "popover-arrow",
+    "popover-header",
+    "popover-body",
+    "bs-tooltip-*",
+    "bs-popover-*",
+    "carousel-item-*",
+    "htmx-*",
+)
+
+_CLASS_ATTR_RE = re.compile(r"""\sclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+_SELECTOR_CLASS_RE = re.compile(r"\.((?:[\w-]|\\.)+)")
+_PSEUDO_ARGS_RE = re.compile(r":(?:not|is|where|has)\(")
+_COMMENT_RE = re.compile(r"/\*(?!!).*?\*/", re.S)
+_SPACE_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|\s+""")
+_DECL_PUNCT_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|\s*([;:,{}])\s*""")
+
+# At-rules whose blocks hold rules (purged recursively); others are kept whole
+_GROUPING_AT_RULES = frozenset({"media", "supports", "container", "layer", "document"})
+
+
+class ClassUsage:
+    """Thread-safe set of CSS class names seen while rendering.
+
+    Example:
+        >>> usage = ClassUsage()
+        >>> usage.add("btn btn-primary")
+        >>> usage.add_html('<div class="card shadow-sm">')
+        >>> sorted(usage)
+        ['btn', 'btn-primary', 'card', 'shadow-sm']
+    """
+
+    def __init__(self, classes: Iterable[str] = ()):
+        self._classes: set[str] = set(classes)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._classes))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._classes
+
+    def add(self, *class_strings: str | None) -> None:
+        """Record space-separated class strings."""
+        names = [name for item in class_strings if item for name in item.split()]
+        with self._lock:
+            self._classes.update(names)
+
+    def add_icon(self, name: str) -> None:
+        """Record a Bootstrap icon name (stored as its ``bi-<name>`` class)."""
+        with self._lock:
+            self._classes.add(f"bi-{name}")
+
+    @property
+    def icons(self) -> list[str]:
+        """Names of the Bootstrap icons among the recorded classes."""
+        return [name[3:] for name in self if name.startswith("bi-") and len(name) > 3]
+
+    def add_html(self, html: str) -> None:
+        """Record the classes of every ``class`` attribute in ``html``."""
+        self.add(*(a or b or c for a, b, c in _CLASS_ATTR_RE.findall(html)))
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the classes to a text file, one per line."""
+        Path(path).write_text("\n".join(self) + "\n")
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> ClassUsage:
+        """Read classes saved with :meth:`save`."""
+        return cls(Path(path).read_text().split())
+
+
+_hook_lock = threading.Lock()
+_hook_users = 0
+_hook_state = threading.local()
+_original_to_xml = _fcxml._to_xml
+
+
+def _recording_to_xml(elm: Any, *args: Any, **kwargs: Any) -> str:
+    # fastcore's to_xml recurses through the module-level _to_xml; only the
+    # outermost call hands its output to the recorders
+    if getattr(_hook_state, "active", False):
+        return _original_to_xml(elm, *args, **kwargs)
+    _hook_state.active = True
+    try:
+        html = _original_to_xml(elm, *args, **kwargs)
+    finally:
+        _hook_state.active = False
+    render._record_html(html)
+    return html
+
+
+def _hook_to_xml(delta: int) -> None:
+    """Install ``_recording_to_xml`` while at least one ``collect`` block runs."""
+    global _hook_users
+    with _hook_lock:
+        _hook_users += delta
+        _fcxml._to_xml = _recording_to_xml if _hook_users else _original_to_xml
+
+
+@contextmanager
+def collect(usage: ClassUsage | None = None) -> Iterator[ClassUsage]:
+    """Record every class rendered while the block runs, and every icon.
+
+    Classes are taken from the rendered HTML (``to_xml``, ``render_html``,
+    streaming, fragment-cache and ``compile()`` hits), so literal ``cls=``
+    values are covered as well as ``merge_classes`` output.
+    Icons are recorded from ``Icon``, ``Button(icon=...)`` and ``ExportButton``,
+    so components wrapping them (``EmptyState``, ``StatCard``) are covered too.
+    Recording is process-wide while the block runs, so it also covers
+    requests served by other threads (e.g. a test client).
+
+    Args:
+        usage: ClassUsage to add to (default: a new one)
+
+    Yields:
+        The ClassUsage being filled
+    """
+    usage = usage if usage is not None else ClassUsage()
+    recorder: Callable[[str], None] = usage.add
+    icon_recorder: Callable[[str], None] = usage.add_icon
+    html_recorder: Callable[[str], None] = usage.add_html
+    base._class_recorders.append(recorder)
+    _icons._icon_recorders.append(icon_recorder)
+    render._html_recorders.append(html_recorder)
+    _hook_to_xml(+1)
+    try:
+        yield usage
+    finally:
+        _hook_to_xml(-1)
+        base._class_recorders.remove(recorder)
+        _icons._icon_recorders.remove(icon_recorder)
+        render._html_recorders.remove(html_recorder)
+
+
+async def _get(app: Any, path: str, headers: Sequence[tuple[bytes, bytes]]) -> str:
+    url_path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 0),
+        "path": url_path,
+        "raw_path": url_path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"testserver"), *headers],
+    }
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks).decode("utf-8", "replace")
+
+
+def crawl(
+    app: Any,
+    paths: Iterable[str],
+    usage: ClassUsage | None = None,
+    headers: dict[str, str] | None = None,
+) -> ClassUsage:
+    """GET each path from an ASGI app in-process and record the classes used.
+
+    Both the ``merge_classes`` calls made while rendering and the class
+    attributes of the returned HTML are recorded. Include HTMX partial
+    routes (pass ``headers={"HX-Request": "true"}`` for those) so classes
+    that only appear in swapped fragments are kept.
+
+    Args:
+        app: ASGI application (e.g. a FastHTML app)
+        paths: Paths to request, optionally with a query string
+        usage: ClassUsage to add to (default: a new one)
+        headers: Extra request headers
+
+    Returns:
+        The ClassUsage with the recorded classes
+    """
+    usage = usage if usage is not None else ClassUsage()
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+
+    async def run() -> None:
+        for path in paths:
+            usage.add_html(await _get(app, path, raw_headers))
+
+    with collect(usage):
+        asyncio.run(run())
+    return usage
+
+
+# ---------------------------------------------------------------------------
+# Stylesheet purging
+# ---------------------------------------------------------------------------
+
+
+def _skip_string(css: str, i: int) -> int:
+    """Index after the string literal starting at ``css[i]``."""
+    quote = css[i]
+    i += 1
+    while i < len(css) and css[i] != quote:
+        i += 2 if css[i] == "\\" else 1
+    return i + 1
+
+
+def _blocks(css: str) -> Iterator[tuple[str, str | None]]:
+    """Top-level ``(prelude, body)`` pairs; ``body`` is None for ``@x ...;`` statements.
+
+    Preserved ``/*! ... */`` comments come out as ``(comment, None)``.
+    """
+    i, n = 0, len(css)
+    while i < n:
+        if css[i].isspace():
+            i += 1
+            continue
+        if css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            if css.startswith("/*!", i):
+                yield css[i:end], None
+            i = end
+            continue
+        start, parens = i, 0
+        while i < n:
+            ch = css[i]
+            if ch in "\"'":
+                i = _skip_string(css, i)
+                continue
+            if ch == "(":
+                parens += 1
+            elif ch == ")":
+                parens -= 1
+            elif parens == 0 and ch in "{;":
+                break
+            i += 1
+        prelude = css[start:i].strip()
+        if i >= n or css[i] == ";":
+            if prelude:
+                yield prelude + ";", None
+            i += 1
+            continue
+        depth, body_start = 1, i + 1
+        i += 1
+        while i < n and depth:
+            ch = css[i]
+            if ch in "\"'":
+                i = _skip_string(css, i)
+                continue
+            if ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+            i += 1
+        yield prelude, css[body_start : i - 1]
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(prelude):
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(prelude[start:i])
+            start = i + 1
+    parts.append(prelude[start:])
+    return [" ".join(part.split()) for part in parts if part.strip()]
+
+
+def _required_classes(selector: str) -> list[str]:
+    """Classes an element tree must have for ``selector`` to match anything.
+
+    Arguments of ``:not()``, ``:is()``, ``:where()`` and ``:has()`` are
+    ignored, which can only keep more rules, never fewer.
+    """
+    stripped, i = [], 0
+    for match in _PSEUDO_ARGS_RE.finditer(selector):
+        if match.start() < i:
+            continue
+        stripped.append(selector[i : match.end() - 1])
+        depth, j = 1, match.end()
+        while j < len(selector) and depth:
+            depth += {"(": 1, ")": -1}.get(selector[j], 0)
+            j += 1
+        i = j
+    stripped.append(selector[i:])
+    # Drop attribute selectors: values such as [href$=".pdf"] are not classes
+    text = re.sub(r"\[[^\]]*\]", "", "".join(stripped))
+    return [re.sub(r"\\(.)", r"\1", name) for name in _SELECTOR_CLASS_RE.findall(text)]
+
+
+def _minify_declarations(body: str) -> str:
+    body = _COMMENT_RE.sub("", body)
+    body = _SPACE_RE.sub(lambda m: m.group(1) or " ", body)
+    body = _DECL_PUNCT_RE.sub(lambda m: m.group(1) or m.group(2), body)
+    return body.strip().rstrip(";")
+
+
+def purge_css(
+    css: str,
+    classes: Iterable[str],
+    safelist: Iterable[str] = SAFELIST,
+) -> str:
+    """Keep only the rules of ``css`` whose selectors can match the given classes.
+
+    A selector is kept when every class it requires is used (or matches a
+    safelist pattern); selectors without classes (elements, ``:root``,
+    attribute selectors) are always kept. ``@media``/``@supports`` blocks
+    are purged recursively and dropped when empty; ``@font-face``,
+    ``@keyframes`` and similar at-rules are kept whole. The result is
+    minified, except for preserved ``/*! ... */`` license comments.
+
+    Args:
+        css: Stylesheet text
+        classes: Class names in use
+        safelist: Class names or ``fnmatch`` patterns to keep regardless
+
+    Returns:
+        The purged, minified stylesheet
+    """
+    used = set(classes)
+    exact = {name for name in safelist if not any(ch in name for ch in "*?[")}
+    patterns = [name for name in safelist if name not in exact]
+    used |= exact
+    verdicts: dict[str, bool] = {}
+
+    def is_used(name: str) -> bool:
+        verdict = verdicts.get(name)
+        if verdict is None:
+            verdict = name in used or any(fnmatchcase(name, p) for p in patterns)
+            verdicts[name] = verdict
+        return verdict
+
+    def purge(text: str) -> str:
+        out: list[str] = []
+        for prelude, body in _blocks(text):
+            if body is None:
+                out.append(prelude + ("\n" if prelude.startswith("/*!") else ""))
+            elif prelude.startswith("@"):
+                name = prelude[1:].split(None, 1)[0].split("(", 1)[0].lower()
+                prelude = " ".join(prelude.split())
+                if name in _GROUPING_AT_RULES:
+                    inner = purge(body)
+                    if inner:
+                        out.append(f"{prelude}{{{inner}}}")
+                elif name.endswith("keyframes") or name == "font-face":
+                    out.append(f"{prelude}{{{_minify_block(body)}}}")
+                else:
+                    out.append(f"{prelude}{{{_minify_declarations(body)}}}")
+            else:
+                kept = [
+                    selector
+                    for selector in _split_selectors(prelude)
+                    if all(is_used(name) for name in _required_classes(selector))
+                ]
+                if kept:
+                    out.append(f"{','.join(kept)}{{{_minify_declarations(body)}}}")
+        return "".join(out)
+
+    def _minify_block(text: str) -> str:
+        # Keyframe selectors (from/to/50%) hold declarations; keep each step
+        inner = [
+            f"{' '.join(step.split())}{{{_minify_declarations(decls)}}}"
+            for step, decls in _blocks(text)
+            if decls is not None
+        ]
+        return "".join(inner) if inner else _minify_declarations(text)
+
+    return purge(css)
+
+
+def purged_stylesheet(
+    classes: Iterable[str],
+    directory: str | os.PathLike[str],
+    source: str = "css/bootstrap.min.css",
+    safelist: Iterable[str] = (),
+) -> str:
+    """Write the purged copy of ``source`` next to it and return its relative path.
+
+    The file name carries a hash of the class set, so apps using different
+    classes never share a file and an unchanged set is not purged again.
+
+    Args:
+        classes: Class names in use
+        directory: Static directory holding ``source``
+        source: Stylesheet path relative to ``directory``
+        safelist: Extra names or patterns kept on top of :data:`SAFELIST`
+
+    Returns:
+        Path of the purged stylesheet relative to ``directory``
+
+    Raises:
+        OSError: If ``source`` cannot be read or the result cannot be written
+    """
+    keep = sorted(set(classes))
+    extra = sorted(set(safelist))
+    key = hashlib.sha256("\n".join([*keep, "", *extra]).encode()).hexdigest()[:10]
+    stem = source.rsplit(".min.css", 1)[0].rsplit(".css", 1)[0]
+    relative = f"{stem}.purged-{key}.min.css"
+    root = Path(directory)
+    target = root / relative
+    if not target.exists():
+        css = (root / source).read_text(encoding="utf-8")
+        purged = purge_css(css, keep, (*SAFELIST, *extra))
+        from .static import _write_atomic
+
+        _write_atomic(target, purged.encode("utf-8"))
+    return relative
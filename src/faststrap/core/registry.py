@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 import warnings
 from collections.abc import Callable
 from typing import Any, TypeVar
@@ -11,6 +12,75 @@ _component_registry: dict[str, dict[str, Any]] = {}
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Static manifest of @register-decorated components: name -> (module, category).
+# Replaces walking the components package at import time; keep in sync with
+# the decorators (checked by tests/test_core/test_registry.py).
+COMPONENT_MANIFEST: dict[str, tuple[str, str]] = {
+    # Forms
+    "CloseButton": ("faststrap.components.forms.button", "forms"),
+    "Button": ("faststrap.components.forms.button", "forms"),
+    "ButtonGroup": ("faststrap.components.forms.buttongroup", "forms"),
+    "ButtonToolbar": ("faststrap.components.forms.buttongroup", "forms"),
+    "Checkbox": ("faststrap.components.forms.checks", "forms"),
+    "Radio": ("faststrap.components.forms.checks", "forms"),
+    "Switch": ("faststrap.components.forms.checks", "forms"),
+    "Range": ("faststrap.components.forms.checks", "forms"),
+    "FacetGroup": ("faststrap.components.forms.facets", "forms"),
+    "FacetRange": ("faststrap.components.forms.facets", "forms"),
+    "FacetSidebar": ("faststrap.components.forms.facets", "forms"),
+    "FileInput": ("faststrap.components.forms.file", "forms"),
+    "Input": ("faststrap.components.forms.input", "forms"),
+    "InputGroup": ("faststrap.components.forms.inputgroup", "forms"),
+    "InputGroupText": ("faststrap.components.forms.inputgroup", "forms"),
+    "FloatingLabel": ("faststrap.components.forms.inputgroup", "forms"),
+    "Select": ("faststrap.components.forms.select", "forms"),
+    # Display
+    "Badge": ("faststrap.components.display.badge", "display"),
+    "Card": ("faststrap.components.display.card", "display"),
+    "EmptyState": ("faststrap.components.display.empty_state", "display"),
+    "Figure": ("faststrap.components.display.figure", "display"),
+    "StatCard": ("faststrap.components.display.stat_card", "display"),
+    "Table": ("faststrap.components.display.table", "display"),
+    "THead": ("faststrap.components.display.table", "display"),
+    "TBody": ("faststrap.components.display.table", "display"),
+    "TRow": ("faststrap.components.display.table", "display"),
+    "TCell": ("faststrap.components.display.table", "display"),
+    "DataTable": ("faststrap.components.display.datatable", "display"),
+    "VirtualTable": ("faststrap.components.display.virtual_table", "display"),
+    "ExportButton": ("faststrap.components.display.export", "display"),
+    # Feedback
+    "Alert": ("faststrap.components.feedback.alert", "feedback"),
+    "ConfirmDialog": ("faststrap.components.feedback.confirm", "feedback"),
+    "Modal": ("faststrap.components.feedback.modal", "feedback"),
+    "Tooltip": ("faststrap.components.feedback.overlays", "feedback"),
+    "Popover": ("faststrap.components.feedback.overlays", "feedback"),
+    "Progress": ("faststrap.components.feedback.progress", "feedback"),
+    "ProgressBar": ("faststrap.components.feedback.progress", "feedback"),
+    "Spinner": ("faststrap.components.feedback.spinner", "feedback"),
+    "SimpleToast": ("faststrap.components.feedback.toast", "feedback"),
+    "Toast": ("faststrap.components.feedback.toast", "feedback"),
+    "ToastContainer": ("faststrap.components.feedback.toast", "feedback"),
+    # Layout
+    "Container": ("faststrap.components.layout.grid", "layout"),
+    "Row": ("faststrap.components.layout.grid", "layout"),
+    "Col": ("faststrap.components.layout.grid", "layout"),
+    "Hero": ("faststrap.components.layout.hero", "layout"),
+    # Navigation
+    "Accordion": ("faststrap.components.navigation.accordion", "navigation"),
+    "Breadcrumb": ("faststrap.components.navigation.breadcrumb", "navigation"),
+    "Drawer": ("faststrap.components.navigation.drawer", "navigation"),
+    "Dropdown": ("faststrap.components.navigation.dropdown", "navigation"),
+    "DropdownItem": ("faststrap.components.navigation.dropdown", "navigation"),
+    "DropdownDivider": ("faststrap.components.navigation.dropdown", "navigation"),
+    "ListGroup": ("faststrap.components.navigation.listgroup", "navigation"),
+    "ListGroupItem": ("faststrap.components.navigation.listgroup", "navigation"),
+    "Collapse": ("faststrap.components.navigation.listgroup", "navigation"),
+    "Navbar": ("faststrap.components.navigation.navbar", "navigation"),
+    "Pagination": ("faststrap.components.navigation.pagination", "navigation"),
+    "Tabs": ("faststrap.components.navigation.tabs", "navigation"),
+    "TabPane": ("faststrap.components.navigation.tabs", "navigation"),
+}
+
 
 def register(
     name: str | None = None,
@@ -53,17 +123,23 @@ def register(
 
 
 def get_registry() -> dict[str, dict[str, Any]]:
-    """Get copy of component registry."""
+    """Get copy of component registry (imports all manifest components)."""
+    autodiscover()
     return _component_registry.copy()
 
 
 def get_component(name: str) -> Callable[..., Any] | None:
     """Get component function by name."""
+    if name not in _component_registry and name in COMPONENT_MANIFEST:
+        importlib.import_module(COMPONENT_MANIFEST[name][0])
     return _component_registry.get(name, {}).get("func")
 
 
 def list_components(category: str | None = None) -> list[str]:
     """List all registered components, optionally filtered by category.
+
+    Answered from the static manifest without importing component modules.
+
     Args:
         category: Filter by category (layout, display, feedback, etc.)
     Returns:
@@ -72,38 +148,31 @@ def list_components(category: str | None = None) -> list[str]:
         >>> list_components(category="feedback")
         ['Alert', 'Toast', 'Modal', 'Spinner']
     """
+    categories = {name: entry[1] for name, entry in COMPONENT_MANIFEST.items()}
+    for name, meta in _component_registry.items():
+        categories.setdefault(name, meta.get("category"))
+
     if category is None:
-        return list(_component_registry.keys())
+        return list(categories)
 
-    return [name for name, meta in _component_registry.items() if meta.get("category") == category]
+    return [name for name, cat in categories.items() if cat == category]
 
 
 def autodiscover() -> None:
-    """Auto-discover and register all components."""
-    import importlib
-    import pkgutil
-
-    try:
-        from faststrap import components
-
-        # Recursively import all component modules
-        for module_info in pkgutil.walk_packages(
-            components.__path__, prefix="faststrap.components."
-        ):
-            try:
-                # Access the .name attribute
-                importlib.import_module(module_info.name)
-            except ImportError as e:
-                # Added stacklevel=2 so the warning points to the import context
-                warnings.warn(
-                    f"Could not import {module_info.name}: {e}",
-                    ImportWarning,
-                    stacklevel=2,
-                )
-
-    except ImportError:
-        pass  # Components not yet installed
-
-
-# Call autodiscover when registry is imported
-autodiscover()
+    """Import every module listed in the component manifest.
+
+    Components register themselves when their module is imported. This is no
+    longer run at import time; registry lookups import what they need.
+    """
+    for name, (module, _) in COMPONENT_MANIFEST.items():
+        if name in _component_registry:
+            continue
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            # Added stacklevel=2 so the warning points to the import context
+            warnings.warn(
+                f"Could not import {module}: {e}",
+                ImportWarning,
+                stacklevel=2,
+            )
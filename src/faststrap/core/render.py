@@ -0,0 +1,213 @@
+"""Direct-to-string HTML rendering.
+
+``to_xml`` serializes an FT tree by concatenating strings at every level and
+wrapping each intermediate result in a ``Safe`` object. ``render_html`` walks
+the tree once and appends escaped HTML to a single shared buffer instead,
+producing byte-identical output.
+
+Every Faststrap component returns a regular FT tree, so this works for all of
+them without a parallel per-component implementation:
+
+    >>> render_html(Card(Badge("New"), title="Inbox"))
+
+Use ``write_html`` to render several fragments into one buffer (for example
+all rows of a large table) and join once at the end.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Mapping
+from html import escape
+from typing import Any
+
+from fastcore.foundation import L
+from fastcore.xml import FT
+from fasthtml.common import Safe
+
+from .base import _class_recorders
+
+try:
+    from fastcore.xml import _block_tags, _ws_significant
+except ImportError:  # pragma: no cover - older fastcore releases
+    _block_tags = {
+        "div", "p", "ul", "ol", "li", "table", "thead", "tbody", "tfoot",
+        "html", "head", "body", "meta", "title", "!doctype", "input", "script", "link", "style",
+        "tr", "th", "td", "section", "article", "nav", "aside", "header",
+        "footer", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote",
+    }  # fmt: skip
+    _ws_significant = {"pre", "code", "textarea", "script"}
+
+
+# Callbacks receiving pre-rendered HTML met while rendering: Safe children,
+# cached fragments, compiled templates (see faststrap.core.purge.collect)
+_html_recorders: list[Callable[[str], None]] = []
+
+
+def _record_html(html: str) -> None:
+    for record in _html_recorders:
+        record(html)
+
+
+def escape_text(value: Any, do_escape: bool = True) -> str:
+    """Escape a text-node value exactly like ``to_xml`` does."""
+    if value is None:
+        return ""
+    if hasattr(value, "__html__"):
+        html = str(value.__html__())
+        if _html_recorders:
+            _record_html(html)
+        return html
+    if do_escape and isinstance(value, str):
+        return escape(value, quote=False)
+    return str(value)
+
+
+def render_attr(name: str, value: Any) -> str:
+    """Render a single ``name="value"`` pair exactly like ``to_xml`` does."""
+    if isinstance(value, bool):
+        return name if value else ""
+    if isinstance(value, str) and ("&" in value or "<" in value or ">" in value):
+        text = escape(value, quote=False)
+    elif isinstance(value, Mapping):
+        text = json.dumps(value)
+    elif hasattr(value, "__html__"):
+        text = value.__html__()
+    else:
+        text = str(value)
+    quote = '"'
+    if quote in text:
+        quote = "'"
+        if "'" in text:
+            text = text.replace("'", "&#39;")
+    return f"{name}={quote}{text}{quote}"
+
+
+def _tag_parts(elm: FT, lvl: int, indent: bool) -> tuple[bool, str, str, str, str]:
+    """Compute indentation and open/close tags for an element like ``to_xml``.
+
+    Returns ``(indent, sp, nl, open_tag, close_tag)`` where ``indent`` is the
+    (possibly disabled) indentation flag to pass on to the children.
+    """
+    tag, attrs = elm.tag, elm.attrs
+    if indent and (tag in _ws_significant or attrs.get("contenteditable") == "true"):
+        indent = False
+    if indent and tag in _block_tags:
+        sp, nl = " " * lvl, "\n"
+    else:
+        sp, nl = "", ""
+
+    stag = tag
+    if attrs:
+        if _class_recorders and attrs.get("class"):
+            for record in _class_recorders:
+                record(str(attrs["class"]))
+        sattrs = " ".join(
+            render_attr(k, v)
+            for k, v in attrs.items()
+            if v is not False and v is not None and (k == "_" or k[-1] != "_")
+        )
+        if sattrs:
+            stag = f"{tag} {sattrs}"
+    open_tag = f"<{stag}>" if stag else ""
+    close_tag = "" if elm.void_ else f"</{tag}>"
+    return indent, sp, nl, open_tag, close_tag
+
+
+def _is_leaf(children: tuple[Any, ...]) -> bool:
+    """Whether ``to_xml`` renders these children inline on one line."""
+    if not children:
+        return True
+    if len(children) == 1:
+        child = children[0]
+        return not isinstance(child, (list, tuple, L, FT)) and not hasattr(child, "__ft__")
+    return False
+
+
+def _write(elm: Any, buf: list[str], lvl: int, indent: bool, do_escape: bool) -> None:
+    if elm is None:
+        return
+    if hasattr(elm, "__ft__"):
+        elm = elm.__ft__()
+    if isinstance(elm, (tuple, L)):
+        for item in elm:
+            _write(item, buf, lvl, indent, do_escape)
+        return
+    if isinstance(elm, bytes):
+        buf.append(elm.decode("utf-8"))
+        return
+    if not isinstance(elm, FT):
+        buf.append(escape_text(elm, do_escape))
+        return
+
+    children = elm.children
+    indent, sp, nl, open_tag, close_tag = _tag_parts(elm, lvl, indent)
+
+    if not children:
+        buf.append(f"{sp}{open_tag}{nl}" if elm.void_ else f"{sp}{open_tag}{close_tag}{nl}")
+        return
+    if _is_leaf(children):
+        buf.append(f"{sp}{open_tag}{escape_text(children[0], do_escape)}{close_tag}{nl}")
+        return
+
+    buf.append(f"{sp}{open_tag}{nl}")
+    child_lvl = lvl + 2 if indent else 0
+    for child in children:
+        _write(child, buf, child_lvl, indent, do_escape)
+    if not elm.void_:
+        buf.append(f"{sp}{close_tag}{nl}")
+
+
+def write_html(
+    buf: list[str], *elms: Any, lvl: int = 0, indent: bool = True, do_escape: bool = True
+) -> None:
+    """Append the HTML for one or more elements to a shared buffer.
+
+    Args:
+        buf: List of strings to append to (join once when done)
+        *elms: FT elements, component results, tuples or plain values
+        lvl: Starting indentation level
+        indent: Pretty-print block elements like ``to_xml``
+        do_escape: Escape text content
+
+    Example:
+        >>> buf: list[str] = []
+        >>> for user in users:
+        ...     write_html(buf, TRow(TCell(user.name), TCell(user.email)))
+        >>> html = "".join(buf)
+    """
+    for i, elm in enumerate(elms):
+        if i:
+            buf.append("\n")
+        if isinstance(elm, (list, tuple, L, FT)) or hasattr(elm, "__ft__"):
+            _write(elm, buf, lvl, indent, do_escape)
+        elif isinstance(elm, bytes):
+            buf.append(elm.decode("utf-8"))
+        elif elm:
+            buf.append(str(elm))
+
+
+def render_html(*elms: Any, lvl: int = 0, indent: bool = True, do_escape: bool = True) -> Safe:
+    """Render elements to an HTML string in a single pass.
+
+    Drop-in replacement for ``to_xml`` that appends to one buffer instead of
+    building intermediate strings at every level of the tree.
+    On a 3000-row, 8-column table it is about 1.45-1.8x faster than
+    ``to_xml``, depending on the machine.
+
+    Args:
+        *elms: FT elements, component results, tuples or plain values
+        lvl: Starting indentation level
+        indent: Pretty-print block elements like ``to_xml``
+        do_escape: Escape text content
+
+    Returns:
+        Safe HTML string, byte-identical to ``to_xml(*elms)``
+
+    Example:
+        >>> render_html(Button("Save", variant="success"))
+        '<button class="btn btn-success">Save</button>'
+    """
+    buf: list[str] = []
+    write_html(buf, *elms, lvl=lvl, indent=indent, do_escape=do_escape)
+    return Safe("".join(buf))
@@ -0,0 +1,354 @@
+"""Precompressed, content-hashed static files.
+
+Text assets (Bootstrap CSS/JS, the icon stylesheet) are compressed once into
+``.br`` and ``.gz`` siblings, either at build time with :func:`precompress`
+or on first use when :class:`CompressedStaticFiles` is mounted. Each request
+then picks the best variant the client accepts and streams it from disk, so
+no CPU is spent compressing per request:
+
+    >>> app.mount("/static", CompressedStaticFiles(directory="static"), name="static")
+
+Brotli variants need the optional ``brotli`` (or ``brotlicffi``) package;
+without it only gzip variants are written, and ``.br`` files produced
+elsewhere (e.g. in a build step) are still served.
+
+Files can also be requested under a fingerprinted name carrying a hash of
+their content (``bootstrap.min.<hash>.css``, see :func:`hashed_url`). Such
+URLs change whenever the file does, so they are served with a one-year
+``immutable`` ``Cache-Control``; the plain names keep working.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import stat
+import tempfile
+import threading
+from collections.abc import Mapping
+from mimetypes import guess_type
+from pathlib import Path
+from typing import Any
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+# File types worth compressing (fonts and images are compressed already)
+COMPRESSIBLE_SUFFIXES = frozenset(
+    {".css", ".js", ".mjs", ".json", ".map", ".svg", ".txt", ".html", ".xml"}
+)
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS: tuple[tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+# Fingerprinted files: hex digits of the content hash and their Cache-Control
+HASH_LENGTH = 10
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Hashes persisted next to the assets, so other workers and restarts reuse them
+MANIFEST_NAME = ".faststrap-hashes.json"
+
+_HASHED_NAME_RE = re.compile(
+    rf"^(?P<stem>.+)\.(?P<digest>[0-9a-f]{{{HASH_LENGTH}}})(?P<suffix>\.\w+)$"
+)
+
+# absolute path -> (mtime_ns, size, digest)
+_HASHES: dict[str, tuple[int, int, str]] = {}
+_HASH_LOCK = threading.Lock()
+
+
+def _brotli() -> Any:
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi as brotli
+        except ImportError:
+            return None
+    return brotli
+
+
+def _write_atomic(target: Path, data: bytes, source: os.stat_result | None = None) -> None:
+    """Write ``data`` to ``target`` so concurrent workers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if source is not None:
+            # Same mode and mtime as the source: readable by the same servers, and
+            # Last-Modified matches while staleness stays detectable
+            os.chmod(tmp, stat.S_IMODE(source.st_mode))
+            os.utime(tmp, (source.st_atime, source.st_mtime))
+        else:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def precompress(
+    directory: str | os.PathLike[str],
+    min_size: int = 1024,
+    force: bool = False,
+) -> list[Path]:
+    """Write ``.br`` and ``.gz`` siblings for the text assets in ``directory``.
+
+    Variants that are up to date (not older than their source) are kept, so
+    repeated calls are cheap. Variants that would not be smaller than the
+    source are skipped.
+
+    Args:
+        directory: Directory to walk (recursively)
+        min_size: Smallest file size worth compressing, in bytes
+        force: Rewrite variants even when they are up to date
+
+    Returns:
+        Paths of the variants written
+
+    Example:
+        >>> precompress("static")  # e.g. in a Dockerfile or release script
+    """
+    brotli = _brotli()
+    written: list[Path] = []
+    for path in sorted(Path(directory).rglob("*")):
+        if path.suffix not in COMPRESSIBLE_SUFFIXES or not path.is_file():
+            continue
+        source = path.stat()
+        if source.st_size < min_size:
+            continue
+        data: bytes | None = None
+        for encoding, suffix in ENCODINGS:
+            if encoding == "br" and brotli is None:
+                continue
+            target = path.with_name(path.name + suffix)
+            if not force and target.exists() and target.stat().st_mtime >= source.st_mtime:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            if encoding == "br":
+                packed = brotli.compress(data, quality=11)
+            else:
+                packed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(packed) < len(data):
+                _write_atomic(target, packed, source)
+                written.append(target)
+    return written
+
+
+def _digest(path: str | os.PathLike[str]) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def file_hash(path: str | os.PathLike[str], stat_result: os.stat_result | None = None) -> str:
+    """Content hash of a file, recomputed only when its size or mtime changes."""
+    key = os.path.abspath(path)
+    st = stat_result or os.stat(key)
+    entry = _HASHES.get(key)
+    if entry is None or entry[:2] != (st.st_mtime_ns, st.st_size):
+        entry = (st.st_mtime_ns, st.st_size, _digest(key))
+        _HASHES[key] = entry
+    return entry[2]
+
+
+def asset_hashes(directory: str | os.PathLike[str]) -> dict[str, str]:
+    """Content hashes of every file in ``directory``, keyed by relative POSIX path.
+
+    Hashes are computed once and stored in a manifest inside ``directory``
+    (when writable); other workers and later restarts load it and only
+    re-hash files whose size or mtime changed.
+
+    Returns:
+        Relative path -> hash, e.g. ``{"css/bootstrap.min.css": "3f2a9c01de"}``
+    """
+    root = Path(directory).resolve()
+    manifest = root / MANIFEST_NAME
+    with _HASH_LOCK:
+        try:
+            stored = json.loads(manifest.read_text())
+        except (OSError, ValueError):
+            stored = {}
+        hashes: dict[str, str] = {}
+        entries: dict[str, list[Any]] = {}
+        changed = False
+        for path in sorted(root.rglob("*")):
+            if path.name.startswith(".") or path.suffix in (".br", ".gz") or not path.is_file():
+                continue
+            rel = path.relative_to(root).as_posix()
+            st = path.stat()
+            entry = stored.get(rel)
+            if isinstance(entry, list) and entry[:2] == [st.st_mtime_ns, st.st_size]:
+                _HASHES[str(path)] = (st.st_mtime_ns, st.st_size, entry[2])
+            else:
+                changed = True
+            digest = file_hash(path, st)
+            hashes[rel] = digest
+            entries[rel] = [st.st_mtime_ns, st.st_size, digest]
+        if changed or len(entries) != len(stored):
+            try:
+                _write_atomic(manifest, json.dumps(entries, indent=0, sort_keys=True).encode())
+            except OSError:  # read-only install: hashes stay per process
+                pass
+    return hashes
+
+
+def hashed_name(path: str, digest: str) -> str:
+    """Insert ``digest`` before the extension: ``css/app.css`` -> ``css/app.<digest>.css``."""
+    head, sep, name = path.rpartition("/")
+    stem, dot, suffix = name.rpartition(".")
+    fingerprinted = f"{stem}.{digest}.{suffix}" if dot and stem else f"{name}.{digest}"
+    return f"{head}{sep}{fingerprinted}"
+
+
+def hashed_url(base: str, path: str, hashes: Mapping[str, str] | None) -> str:
+    """URL of ``path`` under ``base``, fingerprinted when ``hashes`` has it."""
+    digest = hashes.get(path) if hashes else None
+    return f"{base.rstrip('/')}/{hashed_name(path, digest) if digest else path}"
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Content codings a client accepts, from its ``Accept-Encoding`` header.
+
+    Codings with ``q=0`` are excluded; ``*`` stands for every coding not
+    listed explicitly.
+    """
+    accepted: set[str] = set()
+    refused: set[str] = set()
+    wildcard = False
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality <= 0:
+            refused.add(name)
+        elif name == "*":
+            wildcard = True
+        else:
+            accepted.add(name)
+    if wildcard:
+        accepted.update(encoding for encoding, _ in ENCODINGS if encoding not in refused)
+    return accepted
+
+
+class CompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves precompressed ``.br``/``.gz`` variants.
+
+    For a compressible file, the first variant in :data:`ENCODINGS` that the
+    client accepts and that exists on disk (and is not older than the file)
+    is served with ``Content-Encoding``; otherwise the file itself. Responses
+    for compressible files carry ``Vary: Accept-Encoding`` either way, so
+    shared caches keep the variants apart.
+
+    Fingerprinted names (see :func:`hashed_url`) resolve to the plain file.
+    When the hash matches its current content the response is cached for a
+    year as ``immutable``; an outdated hash still gets the current file,
+    without the long-lived caching.
+
+    Args:
+        directory: Directory to serve
+        compress: Run :func:`precompress` on ``directory`` when created
+                  (skipped silently if the directory is read-only)
+        **kwargs: Other ``StaticFiles`` arguments
+
+    Example:
+        >>> app.mount("/assets", CompressedStaticFiles(directory="assets"), name="assets")
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str | os.PathLike[str] | None = None,
+        compress: bool = True,
+        **kwargs: Any,
+    ):
+        super().__init__(directory=directory, **kwargs)
+        # full path -> (source mtime, [(encoding, variant path, variant stat)])
+        self._variants: dict[str, tuple[float, list[tuple[str, str, os.stat_result]]]] = {}
+        if compress and directory is not None:
+            try:
+                precompress(directory)
+            except OSError:  # read-only install: serve whatever variants exist
+                pass
+
+    async def get_response(self, path: str, scope: Any) -> Response:
+        match = _HASHED_NAME_RE.match(path)
+        if match is not None and scope["method"] in ("GET", "HEAD"):
+            plain = match["stem"] + match["suffix"]
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, plain)
+            if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                current = await anyio.to_thread.run_sync(file_hash, full_path, stat_result)
+                response = self.file_response(full_path, stat_result, scope)
+                if current == match["digest"]:
+                    response.headers["cache-control"] = IMMUTABLE
+                return response
+        return await super().get_response(path, scope)
+
+    def _find_variants(
+        self, full_path: str, stat_result: os.stat_result
+    ) -> list[tuple[str, str, os.stat_result]]:
+        cached = self._variants.get(full_path)
+        if cached is not None and cached[0] == stat_result.st_mtime:
+            return cached[1]
+        found = []
+        for encoding, suffix in ENCODINGS:
+            try:
+                variant = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            if stat.S_ISREG(variant.st_mode) and variant.st_mtime >= stat_result.st_mtime:
+                found.append((encoding, full_path + suffix, variant))
+        self._variants[full_path] = (stat_result.st_mtime, found)
+        return found
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Any,
+        status_code: int = 200,
+    ) -> Response:
+        full_path = os.fspath(full_path)
+        if os.path.splitext(full_path)[1] not in COMPRESSIBLE_SUFFIXES:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        media_type = guess_type(full_path)[0] or "text/plain"
+        response: Response | None = None
+        if accepted:
+            for encoding, path, variant in self._find_variants(full_path, stat_result):
+                if encoding in accepted:
+                    response = FileResponse(
+                        path, status_code=status_code, stat_result=variant, media_type=media_type
+                    )
+                    response.headers["content-encoding"] = encoding
+                    break
+        if response is None:
+            response = FileResponse(
+                full_path, status_code=status_code, stat_result=stat_result, media_type=media_type
+            )
+        response.headers["vary"] = "Accept-Encoding"
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,242 @@
+"""Streaming HTML rendering.
+
+``iter_html`` walks a Faststrap/FT tree and yields HTML in chunks instead of
+materialising the whole document, so the first bytes of a very large page
+(e.g. a ``Table`` with 50k rows) can be sent while the rest is still being
+serialized. Joined, the chunks are byte-identical to ``to_xml``.
+
+``stream_page`` wraps page content in the same ``<html>``/``<head>``/``<body>``
+shell FastHTML uses (including headers registered by ``add_bootstrap``) and
+returns a Starlette ``StreamingResponse``. The ``<head>`` is always flushed as
+its own chunk so the browser can start fetching CSS and JS immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from fastcore.foundation import L
+from fastcore.xml import FT
+from fasthtml.common import Body, Head, Html, Title
+from starlette.responses import StreamingResponse
+
+from .render import _is_leaf, _tag_parts, _write
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+
+# Elements after which pending output is flushed regardless of chunk size
+_FLUSH_AFTER = frozenset({"head"})
+
+
+class _Chunker:
+    """Shared output buffer that tracks its size for chunked flushing."""
+
+    def __init__(self, chunk_size: int):
+        self.buf: list[str] = []
+        self.chunk_size = chunk_size
+        self._size = 0
+        self._mark = 0
+
+    def full(self) -> bool:
+        buf = self.buf
+        for piece in buf[self._mark :]:
+            self._size += len(piece)
+        self._mark = len(buf)
+        return self._size >= self.chunk_size
+
+    def flush(self) -> str:
+        chunk = "".join(self.buf)
+        self.buf.clear()
+        self._size = self._mark = 0
+        return chunk
+
+
+class _AsyncSource:
+    """Marker yielded by the sync walker when it reaches an async row source."""
+
+    def __init__(self, source: Any, lvl: int, indent: bool, do_escape: bool):
+        self.source = source
+        self.lvl = lvl
+        self.indent = indent
+        self.do_escape = do_escape
+
+    async def chunks(self) -> AsyncIterator[str]:
+        async for batch in self.source.__ft_abatches__():
+            buf: list[str] = []
+            for item in batch:
+                _write(item, buf, self.lvl, self.indent, self.do_escape)
+            if buf:
+                yield "".join(buf)
+
+
+_Chunk = str | _AsyncSource
+
+
+def _iter(elm: Any, out: _Chunker, lvl: int, indent: bool, do_escape: bool) -> Iterator[_Chunk]:
+    # Lazy row sources (see ``TBody(rows=...)``) are rendered one batch at a time
+    if hasattr(elm, "__ft_batches__"):
+        if elm.is_async:
+            if out.buf:
+                yield out.flush()
+            yield _AsyncSource(elm, lvl, indent, do_escape)
+            return
+        for batch in elm.__ft_batches__():
+            for item in batch:
+                _write(item, out.buf, lvl, indent, do_escape)
+            yield out.flush()
+        return
+    if hasattr(elm, "__ft__"):
+        elm = elm.__ft__()
+    if isinstance(elm, (tuple, L)):
+        for item in elm:
+            yield from _iter(item, out, lvl, indent, do_escape)
+        return
+    if not isinstance(elm, FT) or _is_leaf(elm.children):
+        _write(elm, out.buf, lvl, indent, do_escape)
+        if out.full():
+            yield out.flush()
+        return
+
+    indent, sp, nl, open_tag, close_tag = _tag_parts(elm, lvl, indent)
+    out.buf.append(f"{sp}{open_tag}{nl}")
+    child_lvl = lvl + 2 if indent else 0
+    for child in elm.children:
+        yield from _iter(child, out, child_lvl, indent, do_escape)
+    if not elm.void_:
+        out.buf.append(f"{sp}{close_tag}{nl}")
+
+    if elm.tag in _FLUSH_AFTER or out.full():
+        yield out.flush()
+
+
+def _chunks(
+    elms: tuple[Any, ...], chunk_size: int, indent: bool, do_escape: bool
+) -> Iterator[_Chunk]:
+    out = _Chunker(chunk_size)
+    for i, elm in enumerate(elms):
+        if i:
+            out.buf.append("\n")
+        if isinstance(elm, (list, tuple, L, FT)) or hasattr(elm, "__ft__"):
+            yield from _iter(elm, out, 0, indent, do_escape)
+        elif isinstance(elm, bytes):
+            out.buf.append(elm.decode("utf-8"))
+        elif elm:
+            out.buf.append(str(elm))
+    if out.buf:
+        yield out.flush()
+
+
+def iter_html(
+    *elms: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    indent: bool = True,
+    do_escape: bool = True,
+) -> Iterator[str]:
+    """Render elements to HTML incrementally, yielding chunks.
+
+    Lazy row sources (``TBody(rows=...)``) are consumed one batch at a time
+    and each batch is flushed as its own chunk. Async row sources require
+    :func:`aiter_html`.
+
+    Args:
+        *elms: FT elements, component results, tuples or plain values
+        chunk_size: Approximate number of characters per chunk
+        indent: Pretty-print block elements like ``to_xml``
+        do_escape: Escape text content
+
+    Yields:
+        HTML string chunks; ``"".join(chunks) == to_xml(*elms)``
+
+    Example:
+        >>> for chunk in iter_html(Table(TBody(*rows))):
+        ...     sock.send(chunk.encode())
+    """
+    for chunk in _chunks(elms, chunk_size, indent, do_escape):
+        if isinstance(chunk, _AsyncSource):
+            raise TypeError("Async row sources can only be rendered with aiter_html()")
+        if chunk:
+            yield chunk
+
+
+async def aiter_html(
+    *elms: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    indent: bool = True,
+    do_escape: bool = True,
+) -> AsyncIterator[str]:
+    """Async version of :func:`iter_html` for ASGI streaming responses.
+
+    Supports async row sources (async iterators, async DB cursors) and yields
+    control to the event loop between chunks so rendering a large page does
+    not block other requests served by the same worker.
+    """
+    for chunk in _chunks(elms, chunk_size, indent, do_escape):
+        if isinstance(chunk, _AsyncSource):
+            async for rows in chunk.chunks():
+                yield rows
+        elif chunk:
+            yield chunk
+            await asyncio.sleep(0)
+
+
+def stream_page(
+    *content: Any,
+    app: Any = None,
+    title: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Stream a full HTML page as a Starlette ``StreamingResponse``.
+
+    The page shell mirrors FastHTML's default response: ``app.hdrs`` (which
+    include the Bootstrap assets added by ``add_bootstrap``), ``app.htmlkw``,
+    ``app.bodykw`` and ``app.ftrs`` are all honoured.
+
+    Args:
+        *content: Body content (components, FT elements)
+        app: FastHTML app to take headers and html/body attributes from
+        title: Page title (defaults to ``app.title``)
+        chunk_size: Approximate number of characters per chunk
+        status_code: HTTP status code
+        headers: Extra HTTP response headers
+
+    Returns:
+        StreamingResponse with ``text/html`` media type
+
+    Example:
+        >>> @app.get("/report")
+        ... def report():
+        ...     return stream_page(Container(Table(TBody(*rows))), app=app, title="Report")
+    """
+    hdrs = _flatten(getattr(app, "hdrs", ()))
+    ftrs = _flatten(getattr(app, "ftrs", ()))
+    htmlkw = getattr(app, "htmlkw", None) or {}
+    bodykw = getattr(app, "bodykw", None) or {}
+    page_title = title if title is not None else getattr(app, "title", "")
+
+    page = Html(
+        Head(Title(page_title), *hdrs),
+        Body(*content, *ftrs, **bodykw),
+        **htmlkw,
+    )
+    return StreamingResponse(
+        aiter_html(page, chunk_size=chunk_size),
+        status_code=status_code,
+        media_type="text/html",
+        headers=headers,
+    )
+
+
+def _flatten(items: Any) -> tuple[Any, ...]:
+    if isinstance(items, (FT, str)):
+        return (items,)
+    result: list[Any] = []
+    for item in items:
+        if isinstance(item, (list, tuple)):
+            result.extend(item)
+        else:
+            result.append(item)
+    return tuple(result)
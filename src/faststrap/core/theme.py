@@ -4,11 +4,17 @@ This module provides:
 - Built-in color themes (10 themes)
 - Dark/Light/Auto mode support for all themes
 - Custom theme creation with mode support
-- Component defaults system
+- Component defaults system (global and context-local)
 """
 
 from __future__ import annotations
 
+import itertools
+import threading
+from collections.abc import Hashable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
 from typing import Any, Literal
 
 from fasthtml.common import Style
@@ -433,7 +439,7 @@ def list_builtin_themes() -> list[str]:
 # Component Defaults System
 # ============================================================================
 
-_COMPONENT_DEFAULTS: dict[str, dict[str, Any]] = {
+_BUILTIN_DEFAULTS: dict[str, dict[str, Any]] = {
     "Alert": {"variant": "primary", "dismissible": False},
     "Badge": {"variant": "primary", "pill": False},
     "Breadcrumb": {},
@@ -441,6 +447,7 @@ _COMPONENT_DEFAULTS: dict[str, dict[str, Any]] = {
     "Card": {"header_cls": "", "body_cls": "", "footer_cls": ""},
     "Drawer": {"placement": "start", "backdrop": True},
     "Dropdown": {"variant": "primary", "direction": "down"},
+    "Icon": {"mode": "font", "sprite_url": None},
     "Input": {"size": None, "input_type": "text"},
     "Modal": {"size": None, "centered": False, "scrollable": False},
     "Navbar": {"expand": "lg", "color_scheme": "light"},
@@ -452,17 +459,99 @@ _COMPONENT_DEFAULTS: dict[str, dict[str, Any]] = {
     "Toast": {"autohide": True, "delay": 5000},
 }
 
+# Defaults are stored as immutable snapshots. Writers build a new snapshot and
+# swap it in (bumping the version); readers never copy or lock.
+_DefaultsTable = Mapping[str, Mapping[str, Any]]
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(table: Mapping[str, Mapping[str, Any]]) -> _DefaultsTable:
+    return MappingProxyType(
+        {name: MappingProxyType(dict(values)) for name, values in table.items()}
+    )
+
+
+def _overlay(base: _DefaultsTable, overrides: _DefaultsTable) -> _DefaultsTable:
+    merged = dict(base)
+    for name, values in overrides.items():
+        merged[name] = MappingProxyType({**base.get(name, _EMPTY), **values})
+    return MappingProxyType(merged)
+
+
+_COMPONENT_DEFAULTS: _DefaultsTable = _freeze(_BUILTIN_DEFAULTS)
+_DEFAULTS_VERSION = 0
+_DEFAULTS_LOCK = threading.Lock()
+
+
+def _publish(table: _DefaultsTable) -> None:
+    global _COMPONENT_DEFAULTS, _DEFAULTS_VERSION
+    _COMPONENT_DEFAULTS = table
+    _DEFAULTS_VERSION += 1
+
+
+class _DefaultsScope:
+    """Overrides active in a ``component_defaults`` block, layered on a snapshot."""
+
+    def __init__(self, overrides: _DefaultsTable):
+        self.overrides = overrides
+        self._state: tuple[int, _DefaultsTable] = (-1, _EMPTY)
+        try:
+            key: Hashable = tuple(
+                (name, tuple(sorted(values.items(), key=lambda item: item[0])))
+                for name, values in sorted(overrides.items(), key=lambda item: item[0])
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable default values: never share cache entries with other scopes
+            key = ("scope", next(_scope_ids))
+        self.key = key
+
+    @property
+    def table(self) -> _DefaultsTable:
+        version, table = self._state
+        if version != _DEFAULTS_VERSION:
+            # Global defaults changed since the overlay was built: rebase it
+            version = _DEFAULTS_VERSION
+            table = _overlay(_COMPONENT_DEFAULTS, self.overrides)
+            self._state = (version, table)
+        return table
+
+
+_scope_ids = itertools.count()
+
+_scoped_defaults: ContextVar[_DefaultsScope | None] = ContextVar(
+    "faststrap_component_defaults", default=None
+)
+
+
+def _current_defaults() -> _DefaultsTable:
+    scope = _scoped_defaults.get()
+    return _COMPONENT_DEFAULTS if scope is None else scope.table
+
+
+def defaults_key() -> Hashable:
+    """Hashable token for the component defaults in effect in this context.
+
+    Equal tokens mean equal defaults: it changes with every
+    ``set_component_defaults`` call and differs between ``component_defaults``
+    blocks with different overrides. Used to key cached fragments.
+    """
+    scope = _scoped_defaults.get()
+    return _DEFAULTS_VERSION if scope is None else (_DEFAULTS_VERSION, scope.key)
+
 
 def get_component_defaults(component: str) -> dict[str, Any]:
     """Get default values for a component.
 
+    Includes overrides from an active ``component_defaults`` block.
+
     Args:
         component: Component name (e.g., "Button")
 
     Returns:
         Dict of default values
     """
-    return _COMPONENT_DEFAULTS.get(component, {}).copy()
+    return dict(_current_defaults().get(component, _EMPTY))
 
 
 def set_component_defaults(component: str, **defaults: Any) -> None:
@@ -476,9 +565,8 @@ def set_component_defaults(component: str, **defaults: Any) -> None:
         >>> set_component_defaults("Button", variant="outline-primary", size="sm")
         >>> # Now all Button() calls use these defaults unless overridden
     """
-    if component not in _COMPONENT_DEFAULTS:
-        _COMPONENT_DEFAULTS[component] = {}
-    _COMPONENT_DEFAULTS[component].update(defaults)
+    with _DEFAULTS_LOCK:
+        _publish(_overlay(_COMPONENT_DEFAULTS, {component: defaults}))
 
 
 def reset_component_defaults(component: str | None = None) -> None:
@@ -487,57 +575,74 @@ def reset_component_defaults(component: str | None = None) -> None:
     Args:
         component: Component name to reset, or None to reset all
     """
-    global _COMPONENT_DEFAULTS
-
-    original: dict[str, dict[str, Any]] = {
-        "Alert": {"variant": "primary", "dismissible": False},
-        "Badge": {"variant": "primary", "pill": False},
-        "Breadcrumb": {},
-        "Button": {"variant": "primary", "size": None, "outline": False},
-        "Card": {"header_cls": "", "body_cls": "", "footer_cls": ""},
-        "Drawer": {"placement": "start", "backdrop": True},
-        "Dropdown": {"variant": "primary", "direction": "down"},
-        "Input": {"size": None, "input_type": "text"},
-        "Modal": {"size": None, "centered": False, "scrollable": False},
-        "Navbar": {"expand": "lg", "color_scheme": "light"},
-        "Pagination": {"size": None, "align": "start"},
-        "Progress": {"variant": "primary", "striped": False, "animated": False},
-        "Select": {"size": None},
-        "Spinner": {"variant": "primary", "size": None, "spinner_type": "border"},
-        "Tabs": {"variant": "tabs", "fill": False, "justified": False},
-        "Toast": {"autohide": True, "delay": 5000},
-    }
+    with _DEFAULTS_LOCK:
+        if component is None:
+            _publish(_freeze(_BUILTIN_DEFAULTS))
+        elif component in _BUILTIN_DEFAULTS:
+            table = dict(_COMPONENT_DEFAULTS)
+            table[component] = MappingProxyType(dict(_BUILTIN_DEFAULTS[component]))
+            _publish(MappingProxyType(table))
 
-    if component is None:
-        _COMPONENT_DEFAULTS = original
-    elif component in original:
-        _COMPONENT_DEFAULTS[component] = original[component].copy()
 
+@contextmanager
+def component_defaults(**overrides: Mapping[str, Any]) -> Iterator[None]:
+    """Override component defaults for the current context only.
 
-def resolve_defaults(component: str, **kwargs: Any) -> dict[str, Any]:
+    Unlike ``set_component_defaults``, the overrides are stored in a
+    ``ContextVar``: they apply to the current request/task (and tasks it
+    spawns) and never leak into concurrent requests. Blocks can be nested;
+    inner overrides win.
+
+    Args:
+        **overrides: Mapping of component name to default values
+
+    Example:
+        >>> with component_defaults(Button={"variant": "dark"}, Card={"header_cls": "bg-dark"}):
+        ...     page = tenant_dashboard()  # Button() renders btn-dark here only
+    """
+    for name, values in overrides.items():
+        if not isinstance(values, Mapping):
+            raise ValueError(
+                f"Defaults for '{name}' must be a mapping, got {type(values).__name__}"
+            )
+
+    outer = _scoped_defaults.get()
+    layered = _freeze(overrides)
+    if outer is not None:
+        layered = _overlay(outer.overrides, layered)
+
+    token = _scoped_defaults.set(_DefaultsScope(layered))
+    try:
+        yield
+    finally:
+        _scoped_defaults.reset(token)
+
+
+def resolve_defaults(component: str, **kwargs: Any) -> Mapping[str, Any]:
     """Resolve component attributes by merging defaults with user arguments.
 
     Priority (highest to lowest):
     1. Explicit user arguments (if not None)
-    2. Global component defaults (set via set_component_defaults)
+    2. Context-local defaults (set via component_defaults)
+    3. Global component defaults (set via set_component_defaults)
 
     Args:
         component: Component name (e.g., "Button")
         **kwargs: Arguments passed by the user
 
     Returns:
-        Dict of resolved attributes
+        Read-only mapping of resolved attributes: the defaults snapshot itself
+        when no argument is set, otherwise the snapshot overlaid with them
 
     Example:
         >>> set_component_defaults("Button", variant="secondary")
         >>> resolve_defaults("Button", variant=None, size="lg")
         {"variant": "secondary", "size": "lg"}
     """
-    defaults = get_component_defaults(component)
-    resolved = defaults.copy()
-
-    for key, value in kwargs.items():
-        if value is not None:
-            resolved[key] = value
-
-    return resolved
+    scope = _scoped_defaults.get()
+    table = _COMPONENT_DEFAULTS if scope is None else scope.table
+    snapshot = table.get(component, _EMPTY)
+    overrides = {key: value for key, value in kwargs.items() if value is not None}
+    if not overrides:
+        return snapshot
+    return {**snapshot, **overrides}
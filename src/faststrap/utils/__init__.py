@@ -1,13 +1,28 @@
 """FastStrap utilities."""
 
-from .icons import Icon
-from .static_management import (
-    cleanup_static_resources,
-    get_faststrap_static_url,
-)
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .icons import Icon, IconSprite
+    from .static_management import (
+        cleanup_static_resources,
+        get_faststrap_static_url,
+    )
+
+_EXPORTS: dict[str, str] = {
+    "Icon": ".icons:Icon",
+    "IconSprite": ".icons:IconSprite",
+    "cleanup_static_resources": ".static_management:cleanup_static_resources",
+    "get_faststrap_static_url": ".static_management:get_faststrap_static_url",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "Icon",
+    "IconSprite",
     "cleanup_static_resources",
     "get_faststrap_static_url",
 ]
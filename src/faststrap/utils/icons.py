@@ -1,22 +1,107 @@
 """Bootstrap Icons utilities."""
 
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Literal
 
-from fasthtml.common import I
+from fasthtml.common import I, Safe, Svg
+from fasthtml.svg import Use
 
+from ..core.theme import resolve_defaults
 
-def Icon(name: str, **kwargs: Any) -> I:
+IconMode = Literal["font", "sprite"]
+
+# Callbacks receiving every rendered icon name (see faststrap.core.purge.collect)
+_icon_recorders: list[Callable[[str], None]] = []
+
+
+def record_icon(name: str) -> None:
+    """Report an icon name to the active usage recorders (no-op when none)."""
+    if _icon_recorders:
+        for record in _icon_recorders:
+            record(name)
+
+
+def icon_element(
+    name: str,
+    cls: str,
+    mode: IconMode | None = None,
+    sprite_url: str | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Render icon ``name`` with exactly the classes ``cls`` in the active icon mode.
+
+    In ``"font"`` mode this is an ``<i>`` styled by the icon font. In
+    ``"sprite"`` mode it is an ``<svg>`` referencing the ``#bi-<name>`` symbol
+    of an inline ``IconSprite`` or, with ``sprite_url``, of a sprite file.
+    """
+    record_icon(name)
+    cfg = resolve_defaults("Icon", mode=mode, sprite_url=sprite_url)
+    if cfg["mode"] != "sprite":
+        return I(cls=cls, **kwargs)
+    href = f"{cfg['sprite_url'] or ''}#bi-{name}"
+    kwargs.setdefault("fill", "currentColor")
+    return Svg(Use(href=href), cls=cls, width="1em", height="1em", **kwargs)
+
+
+def Icon(
+    name: str,
+    mode: IconMode | None = None,
+    sprite_url: str | None = None,
+    **kwargs: Any,
+) -> Any:
     """Create a Bootstrap Icon.
 
     Args:
         name: Icon name from Bootstrap Icons (e.g., 'heart', 'star-fill')
+        mode: "font" for an icon-font ``<i>``, "sprite" for an SVG ``<use>``
+              (default: the global setting, see ``add_bootstrap(icon_mode=...)``)
+        sprite_url: Sprite file URL in sprite mode (default: inline ``IconSprite``)
         **kwargs: Additional attributes
 
     Returns:
-        I element with Bootstrap icon class
+        I element with Bootstrap icon class, or an SVG element in sprite mode
 
     Example:
         >>> Icon("heart-fill", cls="text-danger")
     """
     cls = kwargs.pop("cls", "")
-    return I(cls=f"bi bi-{name} {cls}".strip(), **kwargs)
+    return icon_element(name, f"bi bi-{name} {cls}".strip(), mode, sprite_url, **kwargs)
+
+
+def _sprite_names(items: Iterable[Any]) -> Iterator[str]:
+    """Icon names from strings and from sprite icons found in component trees."""
+    for item in items:
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, (list, tuple)):
+            yield from _sprite_names(item)
+        elif getattr(item, "tag", None) == "use":
+            href = str(item.attrs.get("href", ""))
+            if "#bi-" in href:
+                yield href.rsplit("#bi-", 1)[1]
+        elif hasattr(item, "children"):
+            yield from _sprite_names(item.children)
+
+
+def IconSprite(*icons: Any, **kwargs: Any) -> Any:
+    """Inline SVG sprite sheet with the symbols referenced by sprite-mode icons.
+
+    Place it once per page (e.g. at the end of ``<body>``). Pass icon names,
+    or the page content itself to include exactly the icons it renders.
+
+    Args:
+        *icons: Icon names, or component trees to scan for sprite icons
+        **kwargs: Additional attributes for the hidden ``<svg>``
+
+    Returns:
+        Hidden ``<svg>`` element holding one ``<symbol>`` per icon
+
+    Example:
+        >>> content = Div(Button("Save", icon="floppy"), Icon("gear"))
+        >>> Main(content), IconSprite(content)
+    """
+    from ..core.icon_sprite import sprite_symbols
+
+    kwargs.setdefault("style", "display:none")
+    kwargs.setdefault("aria_hidden", "true")
+    return Svg(Safe(sprite_symbols(_sprite_names(icons))), **kwargs)
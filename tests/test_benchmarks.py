@@ -0,0 +1,61 @@
+"""Smoke tests for the benchmark suite in ``benchmarks/``."""
+
+import json
+from pathlib import Path
+
+from benchmarks import micro
+from benchmarks.compare import compare
+from benchmarks.run import main
+
+from faststrap.core.registry import COMPONENT_MANIFEST
+
+
+def test_micro_cases_cover_all_components():
+    """Every registered component has a micro-benchmark."""
+    assert set(COMPONENT_MANIFEST) <= set(micro.CASES)
+
+
+def test_baseline_covers_all_micro_cases():
+    """``--compare`` can only flag regressions for cases present in the baseline."""
+    baseline = json.loads((Path(micro.__file__).parent / "baseline.json").read_text())
+    assert set(micro.CASES) <= set(baseline["micro"])
+
+
+def test_micro_run_reports_metrics():
+    results = micro.run(min_time=0.001, only=["Button", "Badge"])
+    assert set(results) == {"Button", "Badge"}
+    for metrics in results.values():
+        assert metrics["calls_per_sec"] > 0
+        assert metrics["alloc_peak_bytes"] > 0
+        assert metrics["output_bytes"] > 0
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = {"micro": {"Button": {"calls_per_sec": 1000, "alloc_peak_bytes": 100}}}
+    current = {
+        "meta": {},
+        "micro": {"Button": {"calls_per_sec": 800, "alloc_peak_bytes": 105}},
+    }
+
+    regressions = compare(current, baseline, threshold=0.1)
+    assert [(r["metric"], r["change"]) for r in regressions] == [("calls_per_sec", -0.2)]
+    assert compare(current, baseline, threshold=0.25) == []
+
+
+def test_compare_ignores_new_cases_and_improvements():
+    baseline = {"macro": {"page": {"mean_ms": 10.0}}}
+    current = {"macro": {"page": {"mean_ms": 5.0}, "new page": {"mean_ms": 50.0}}}
+    assert compare(current, baseline) == []
+
+
+def test_cli_baseline_round_trip(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["--only", "micro", "--quick", "--baseline", str(baseline)]
+
+    assert main([*args, "--update-baseline"]) == 0
+    capsys.readouterr()
+    assert "Button" in json.loads(baseline.read_text())["micro"]
+
+    assert main([*args, "--threshold", "100"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert results["regressions"] == []
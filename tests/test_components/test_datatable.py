@@ -0,0 +1,200 @@
+"""Tests for the server-side DataTable component."""
+
+from types import SimpleNamespace
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import Column, DataTable, ListSource
+
+USERS = [
+    {"id": i, "name": f"User {i:02d}", "email": f"user{i}@example.com", "age": 20 + (i * 7) % 30}
+    for i in range(1, 61)
+]
+COLUMNS = [Column("id", "#"), Column("name"), Column("email", sortable=False), Column("age")]
+
+
+def fake_request(params=None, htmx_target=None):
+    headers = {}
+    if htmx_target:
+        headers = {"hx-request": "true", "hx-target": htmx_target}
+    return SimpleNamespace(query_params=params or {}, headers=headers)
+
+
+def render(**kwargs):
+    kwargs.setdefault("endpoint", "/users")
+    return DataTable(ListSource(USERS), COLUMNS, **kwargs)
+
+
+class TestListSource:
+    """In-memory data source."""
+
+    def test_filter_is_case_insensitive(self):
+        source = ListSource(USERS).filter("USER 1")
+        assert source.count() == 10  # User 10-19
+
+    def test_filter_search_keys(self):
+        source = ListSource(USERS, search_keys=["email"]).filter("User 05")
+        assert source.count() == 0
+
+    def test_sort_descending(self):
+        rows = list(ListSource(USERS).sort("id", descending=True).slice(0, 3))
+        assert [r["id"] for r in rows] == [60, 59, 58]
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_none_sorts_last(self, descending):
+        records = [{"v": 2}, {"v": None}, {"v": 1}]
+        rows = list(ListSource(records).sort("v", descending).slice(0, 3))
+        assert rows[-1]["v"] is None
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_mixed_types_keep_falsy_values(self, descending):
+        """The text-order fallback keeps 0/False apart from missing values."""
+        records = [{"v": "b"}, {"v": None}, {"v": 0}, {"v": False}, {"v": "a"}]
+        values = [r["v"] for r in ListSource(records).sort("v", descending).slice(0, 5)]
+        assert values[-1] is None
+        expected = ["0", "False", "a", "b"]
+        assert [str(v) for v in values[:-1]] == (expected[::-1] if descending else expected)
+
+    def test_objects_and_tuples(self):
+        objs = [SimpleNamespace(name="b"), SimpleNamespace(name="a")]
+        assert [o.name for o in ListSource(objs).sort("name").slice(0, 2)] == ["a", "b"]
+        tuples = [("x", 2), ("y", 1)]
+        assert list(ListSource(tuples).sort(1).slice(0, 1)) == [("y", 1)]
+        assert ListSource(tuples).filter("y").count() == 1
+
+
+class TestDataTableFullRender:
+    """Initial (non-HTMX) render."""
+
+    def test_structure(self):
+        html = to_xml(render(striped=True))
+        assert 'id="datatable"' in html
+        assert 'id="datatable-search"' in html
+        assert 'id="datatable-body"' in html
+        assert 'id="datatable-pager"' in html
+        assert 'class="table table-striped"' in html
+
+    def test_only_first_page_rendered(self):
+        html = to_xml(render(per_page=10))
+        assert "User 10" in html
+        assert "User 11" not in html
+        assert "Showing 1–10 of 60" in html
+
+    def test_sortable_headers_issue_htmx_requests(self):
+        html = to_xml(render())
+        assert 'hx-get="/users"' in html
+        assert """hx-vals='{"sort_by": "age"}'""" in html
+        assert 'hx-target="#datatable-body"' in html
+        assert 'hx-include="#datatable-state, #datatable-search"' in html
+        # Non-sortable column renders a plain header
+        assert '<th scope="col">Email</th>' in html
+
+    def test_search_input_debounced(self):
+        html = to_xml(render())
+        assert 'hx-trigger="input changed delay:300ms, search"' in html
+        assert 'name="q"' in html
+
+    def test_not_searchable(self):
+        html = to_xml(render(searchable=False))
+        assert "datatable-search" not in html
+
+    def test_empty_state(self):
+        html = to_xml(render(query="nobody"))
+        assert "No matching records" in html
+        assert 'colspan="4"' in html
+        assert "No results" in html
+
+    def test_custom_table_id(self):
+        html = to_xml(render(table_id="users"))
+        assert 'id="users-body"' in html
+        assert 'hx-target="#users-body"' in html
+
+    def test_formatter_and_cell_classes(self):
+        cols = [Column("age", formatter=lambda v: f"{v} yrs", cls="text-end", variant="info")]
+        html = to_xml(DataTable(ListSource(USERS[:1]), cols, endpoint="/u"))
+        assert '<td class="table-info text-end">27 yrs</td>' in html
+
+
+class TestDataTableState:
+    """State read from the request query string."""
+
+    def test_page_from_request(self):
+        html = to_xml(render(request=fake_request({"page": "2"}), per_page=10))
+        assert "User 11" in html
+        assert "User 01" not in html
+        assert "Showing 11–20 of 60" in html
+
+    def test_page_clamped(self):
+        html = to_xml(render(request=fake_request({"page": "99"}), per_page=25))
+        assert "Showing 51–60 of 60" in html
+        html = to_xml(render(request=fake_request({"page": "abc"}), per_page=25))
+        assert "Showing 1–25 of 60" in html
+
+    def test_sort_from_request(self):
+        html = to_xml(render(request=fake_request({"sort": "id", "dir": "desc"}), per_page=5))
+        assert html.index("User 60") < html.index("User 59")
+        assert 'aria-sort="descending"' in html
+        assert 'name="dir" value="desc"' in html
+
+    def test_sort_by_toggles_current_column(self):
+        req = fake_request({"sort": "id", "dir": "asc", "sort_by": "id"})
+        html = to_xml(render(request=req, per_page=5))
+        assert "User 60" in html
+
+    def test_sort_by_new_column_sorts_ascending(self):
+        req = fake_request({"sort": "id", "dir": "desc", "sort_by": "age"})
+        html = to_xml(render(request=req, per_page=5))
+        assert 'aria-sort="ascending"' in html
+        assert 'name="sort" value="age"' in html
+
+    def test_unsortable_column_ignored(self):
+        html = to_xml(render(request=fake_request({"sort": "email"}), per_page=5))
+        assert 'name="sort" value=""' in html
+        assert "aria-sort" not in html
+
+    def test_query_from_request(self):
+        html = to_xml(render(request=fake_request({"q": "user 5"})))
+        assert "Showing 1–10 of 10" in html  # User 50-59
+        assert 'value="user 5"' in html
+
+    def test_page_links_keep_sort_and_query(self):
+        """Pager hrefs work without HTMX (new tabs, no hx-boost)."""
+        req = fake_request({"sort": "age", "dir": "desc", "q": "user"})
+        html = to_xml(render(request=req, per_page=5))
+        assert 'href="/users?sort=age&amp;dir=desc&amp;q=user&amp;page=2"' in html
+
+    def test_explicit_arguments_override_request(self):
+        req = fake_request({"page": "3", "sort": "age"})
+        html = to_xml(render(request=req, page=1, sort="id", descending=True, per_page=5))
+        assert "User 60" in html
+
+
+class TestDataTablePartial:
+    """HTMX partial responses."""
+
+    def test_partial_returns_body_and_oob_pager(self):
+        req = fake_request({"page": "2"}, htmx_target="datatable-body")
+        result = render(request=req, per_page=10)
+        assert isinstance(result, tuple)
+        body, pager = result
+        assert to_xml(body).startswith("<tbody")
+        assert 'hx-swap-oob="true"' in to_xml(pager)
+        assert 'id="datatable-search"' not in to_xml(result)
+
+    def test_partial_includes_header_when_sort_changes(self):
+        req = fake_request({"sort_by": "age"}, htmx_target="datatable-body")
+        body, head, pager = render(request=req)
+        head_html = to_xml(head)
+        assert head_html.startswith("<thead")
+        assert 'hx-swap-oob="true"' in head_html
+        assert 'aria-sort="ascending"' in head_html
+
+    def test_other_htmx_targets_get_full_render(self):
+        req = fake_request({}, htmx_target="main")
+        assert 'id="datatable"' in to_xml(render(request=req))
+
+    def test_partial_flag(self):
+        assert isinstance(render(partial=True), tuple)
+        req = fake_request({}, htmx_target="datatable-body")
+        assert not isinstance(render(request=req, partial=False), tuple)
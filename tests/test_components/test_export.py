@@ -0,0 +1,185 @@
+"""Tests for streaming table exports and the ExportButton component."""
+
+import asyncio
+import csv
+import io
+import json
+import zipfile
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import Badge, Column, ExportButton, ListSource, export_response, iter_export
+
+ORDERS = [
+    {
+        "id": i,
+        "customer": f"Customer {i:03d}",
+        "total": i * 2.5,
+        "placed": date(2026, 1, 1 + i % 28),
+    }
+    for i in range(1, 251)
+]
+COLUMNS = [
+    Column("id", "#"),
+    Column("customer"),
+    Column("total", formatter=lambda v: f"${v:,.2f}"),
+    Column("placed", formatter=lambda d: d.strftime("%d %b")),
+]
+
+
+def fake_request(params=None):
+    return SimpleNamespace(query_params=params or {}, headers={})
+
+
+def read_body(response):
+    async def collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(collect())
+
+
+class TestIterExport:
+    """Encoding rows in batches."""
+
+    def test_csv_uses_labels_and_formatters(self):
+        data = b"".join(iter_export(ListSource(ORDERS), COLUMNS, "csv")).decode()
+        rows = list(csv.reader(io.StringIO(data)))
+        assert rows[0] == ["#", "Customer", "Total", "Placed"]
+        assert rows[1] == ["1", "Customer 001", "$2.50", "02 Jan"]
+        assert len(rows) == 251
+
+    def test_csv_is_streamed_in_batches(self):
+        chunks = list(iter_export(ListSource(ORDERS), COLUMNS, "csv", batch_size=100))
+        assert len(chunks) == 3
+
+    def test_source_read_one_slice_at_a_time(self):
+        calls = []
+
+        class Source(ListSource):
+            def slice(self, start, stop):
+                calls.append((start, stop))
+                return super().slice(start, stop)
+
+        chunks = iter_export(Source(ORDERS), COLUMNS, batch_size=100)
+        next(chunks)
+        assert calls == [(0, 100)]
+        list(chunks)
+        assert calls == [(0, 100), (100, 200), (200, 250)]
+
+    def test_plain_iterable_source(self):
+        records = ((i, f"row {i}") for i in range(5))
+        data = b"".join(iter_export(records, [Column(0, "N"), Column(1, "Label")])).decode()
+        assert data.splitlines()[-1] == "4,row 4"
+
+    def test_markup_formatter_exported_as_text(self):
+        cols = [Column("id", formatter=lambda v: Badge(f"#{v}"))]
+        data = b"".join(iter_export(ListSource(ORDERS[:1]), cols)).decode()
+        assert data.splitlines() == ["Id", "#1"]
+
+    def test_ndjson(self):
+        lines = b"".join(iter_export(ListSource(ORDERS[:3]), COLUMNS, "ndjson")).splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0]) == {
+            "#": 1,
+            "Customer": "Customer 001",
+            "Total": "$2.50",
+            "Placed": "02 Jan",
+        }
+
+    def test_ndjson_raw_values(self):
+        data = b"".join(iter_export(ListSource(ORDERS[:1]), COLUMNS, "ndjson", formatted=False))
+        assert json.loads(data) == {
+            "#": 1,
+            "Customer": "Customer 001",
+            "Total": 2.5,
+            "Placed": "2026-01-02",
+        }
+
+    def test_xlsx_package(self):
+        chunks = list(iter_export(ListSource(ORDERS), COLUMNS, "xlsx", formatted=False))
+        package = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        assert package.testzip() is None
+        assert "xl/workbook.xml" in package.namelist()
+        sheet = package.read("xl/worksheets/sheet1.xml").decode()
+        assert sheet.count("<row>") == 251
+        assert "<c><v>625.0</v></c>" in sheet
+        assert '<t xml:space="preserve">Customer 250</t>' in sheet
+
+    def test_xlsx_escapes_text(self):
+        data = b"".join(iter_export([{"a": "<b>&\x01"}], ["a"], "xlsx"))
+        sheet = zipfile.ZipFile(io.BytesIO(data)).read("xl/worksheets/sheet1.xml").decode()
+        assert "&lt;b&gt;&amp;<" in sheet
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            iter_export(ListSource(ORDERS), COLUMNS, "pdf")
+
+
+class TestExportResponse:
+    """Download responses following the table state."""
+
+    def test_headers(self):
+        response = export_response(ListSource(ORDERS), COLUMNS, "xlsx", filename="orders")
+        assert response.media_type.startswith("application/vnd.openxmlformats")
+        assert response.headers["content-disposition"] == 'attachment; filename="orders.xlsx"'
+
+    def test_format_from_request(self):
+        request = fake_request({"format": "ndjson"})
+        response = export_response(ListSource(ORDERS), COLUMNS, request=request)
+        assert response.media_type == "application/x-ndjson"
+
+    def test_filter_and_sort_from_request(self):
+        request = fake_request({"q": "customer 01", "sort": "total", "dir": "desc"})
+        data = read_body(export_response(ListSource(ORDERS), COLUMNS, request=request)).decode()
+        ids = [row[0] for row in csv.reader(io.StringIO(data))][1:]
+        assert ids == [str(i) for i in range(19, 9, -1)]
+
+    def test_unsortable_column_ignored(self):
+        cols = [Column("id"), Column("customer", sortable=False)]
+        request = fake_request({"sort": "customer", "dir": "desc"})
+        data = read_body(export_response(ListSource(ORDERS[:3]), cols, request=request)).decode()
+        assert data.splitlines()[1].startswith("1,")
+
+    def test_bad_format_from_request_is_a_client_error(self):
+        request = fake_request({"format": "exe"})
+        response = export_response(ListSource(ORDERS), COLUMNS, request=request)
+        assert response.status_code == 400
+        assert b"'exe'" in response.body
+
+    def test_bad_format_argument_rejected(self):
+        with pytest.raises(ValueError):
+            export_response(ListSource(ORDERS), COLUMNS, "exe", request=fake_request())
+
+
+class TestExportButton:
+    """Export link component."""
+
+    def test_link(self):
+        html = to_xml(ExportButton("/orders/export"))
+        assert 'href="/orders/export?format=csv"' in html
+        assert "download" in html
+        assert "btn btn-outline-secondary btn-sm" in html
+        assert "Export CSV" in html
+        assert "onclick" not in html
+
+    def test_carries_request_state(self):
+        request = fake_request({"q": "acme", "sort": "total", "dir": "desc", "page": "3"})
+        html = to_xml(ExportButton("/orders/export", "xlsx", request=request))
+        assert 'href="/orders/export?format=xlsx&amp;q=acme&amp;sort=total&amp;dir=desc"' in html
+
+    def test_follows_table_state(self):
+        html = to_xml(ExportButton("/orders/export", table_id="orders"))
+        assert "orders-state" in html and "orders-search" in html
+
+    def test_label_and_icon(self):
+        html = to_xml(ExportButton("/e", label="Download", icon=None, cls="ms-2"))
+        assert ">Download</a>" in html
+        assert "bi-" not in html
+        assert "ms-2" in html
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            ExportButton("/e", "pdf")
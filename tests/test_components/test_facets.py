@@ -0,0 +1,180 @@
+"""Tests for the bitmap facet index and the facet filter components."""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import FacetGroup, FacetIndex, FacetRange, FacetSidebar, ListSource
+
+PRODUCTS = [
+    {
+        "id": 1,
+        "name": "Tee",
+        "category": "Clothing",
+        "brand": "Acme",
+        "price": 29.99,
+        "sizes": ["S", "M"],
+    },
+    {
+        "id": 2,
+        "name": "Jeans",
+        "category": "Clothing",
+        "brand": "Denimco",
+        "price": 79.99,
+        "sizes": ["30", "32"],
+    },
+    {
+        "id": 3,
+        "name": "Runner",
+        "category": "Footwear",
+        "brand": "Acme",
+        "price": 89.99,
+        "sizes": ["9", "10"],
+    },
+    {
+        "id": 4,
+        "name": "Wallet",
+        "category": "Accessories",
+        "brand": "Leatherly",
+        "price": 39.99,
+        "sizes": [],
+    },
+    {
+        "id": 5,
+        "name": "Cap",
+        "category": "Accessories",
+        "brand": "Acme",
+        "price": 24.99,
+        "sizes": None,
+    },
+    {
+        "id": 6,
+        "name": "Boot",
+        "category": "Footwear",
+        "brand": "Denimco",
+        "price": None,
+        "sizes": ["9"],
+    },
+]
+
+
+def fake_request(params=None, headers=None):
+    return SimpleNamespace(query_params=params or {}, headers=headers or {})
+
+
+@pytest.fixture
+def index():
+    return FacetIndex(PRODUCTS, facets=["category", "brand", "sizes"], ranges=["price"])
+
+
+class TestFacetIndex:
+    """Bitmap intersections and counts."""
+
+    def test_no_selection(self, index):
+        result = index.search()
+        assert result.count() == 6
+        assert result.counts["category"] == {"Accessories": 2, "Clothing": 2, "Footwear": 2}
+        assert not result.active
+
+    def test_or_within_and_across_facets(self, index):
+        result = index.search({"category": ["Clothing", "Footwear"], "brand": ["Acme"]})
+        assert [p["id"] for p in result] == [1, 3]
+
+    def test_counts_ignore_own_facet(self, index):
+        result = index.search({"category": ["Footwear"]})
+        assert result.counts["category"] == {"Accessories": 2, "Clothing": 2, "Footwear": 2}
+        assert result.counts["brand"] == {"Acme": 1, "Denimco": 1, "Leatherly": 0}
+
+    def test_multi_valued_field(self, index):
+        result = index.search({"sizes": ["9"]})
+        assert [p["id"] for p in result] == [3, 6]
+        assert result.counts["category"]["Footwear"] == 2
+
+    def test_range(self, index):
+        result = index.search(ranges={"price": (25, 80)})
+        assert [p["id"] for p in result] == [1, 2, 4]
+        assert index.bounds["price"] == (24.99, 89.99)
+
+    def test_full_range_keeps_missing_values(self, index):
+        assert index.search(ranges={"price": (0, 100)}).count() == 6
+        assert not index.search(ranges={"price": (0, 100)}).ranges
+
+    def test_from_request(self, index):
+        request = fake_request({"category": ["Clothing", "Bogus"], "price_max": "50"})
+        result = index.search(request=request)
+        assert result.selected == {"category": ["Clothing"]}
+        assert result.ranges == {"price": (24.99, 50.0)}
+        assert [p["id"] for p in result] == [1]
+
+    def test_values_matched_as_text(self):
+        index = FacetIndex([{"year": 2024}, {"year": 2025}], facets=["year"])
+        assert index.search(request=fake_request({"year": "2025"})).selected == {"year": [2025]}
+
+    def test_slice_and_data_source(self, index):
+        result = index.search({"brand": ["Acme", "Denimco"]})
+        assert [p["id"] for p in result.slice(1, 3)] == [2, 3]
+        assert [p["id"] for p in result.sort("price", descending=True).slice(0, 2)] == [3, 2]
+        assert isinstance(result.filter("boot"), ListSource)
+
+    def test_matches_scan_on_large_catalog(self):
+        rng = random.Random(7)
+        records = [
+            {"c": rng.choice("abcde"), "b": rng.randrange(40), "p": rng.uniform(0, 500)}
+            for _ in range(5000)
+        ]
+        index = FacetIndex(records, facets=["c", "b"], ranges=["p"], resolution=16)
+        result = index.search({"c": ["a", "c"], "b": [3, 5, 8]}, {"p": (120, 340)})
+
+        def keep(r, c=("a", "c")):
+            return r["c"] in c and r["b"] in (3, 5, 8) and 120 <= r["p"] <= 340
+
+        expected = [r for r in records if keep(r)]
+        assert list(result) == expected
+        assert result.slice(10, 20) == expected[10:20]
+        assert result.counts["c"]["b"] == sum(1 for r in records if keep(r, ("b",)))
+
+    def test_requires_fields(self):
+        with pytest.raises(ValueError):
+            FacetIndex(PRODUCTS)
+
+
+class TestFacetComponents:
+    """FacetGroup, FacetRange and FacetSidebar rendering."""
+
+    def test_group(self, index):
+        result = index.search({"category": ["Footwear"]})
+        html = to_xml(FacetGroup("brand", result.counts["brand"], label="Brands"))
+        assert 'id="facet-brand"' in html
+        assert "<legend" in html and "Brands</legend>" in html
+        assert 'name="brand" value="Leatherly" disabled' in html
+        assert '<span class="badge rounded-pill text-bg-light float-end">1</span>' in html
+
+    def test_group_checked_and_hide_empty(self, index):
+        counts = index.search({"category": ["Footwear"]}).counts["brand"]
+        html = to_xml(FacetGroup("brand", counts, ["Acme"], hide_empty=True))
+        assert 'value="Acme" checked' in html
+        assert "Leatherly" not in html
+
+    def test_range(self):
+        html = to_xml(FacetRange("price", (24.99, 89.99), (30.0, 60), step=5))
+        assert 'name="price_min" min="24" max="90" value="30.0" step="5"' in html
+        assert 'name="price_max"' in html
+        assert "30 – 60</output>" in html
+
+    def test_sidebar(self, index):
+        html = to_xml(FacetSidebar(index.search(), "/shop", target="grid", cls="sticky-top"))
+        assert 'hx-get="/shop"' in html and 'hx-trigger="change"' in html
+        assert 'hx-target="#grid"' in html and 'hx-push-url="true"' in html
+        assert html.count("<fieldset") == 4
+        assert "Clear all" in html
+        assert "sticky-top" in html
+
+    def test_sidebar_partial_is_out_of_band(self, index):
+        headers = {"hx-request": "true", "hx-target": "facet-results"}
+        request = fake_request({"category": "Clothing"}, headers)
+        parts = FacetSidebar(index.search(request=request), "/shop", request=request)
+        assert isinstance(parts, tuple) and len(parts) == 4
+        assert all(part.attrs["hx-swap-oob"] == "true" for part in parts)
+        assert 'value="Clothing" checked' in to_xml(parts[0])
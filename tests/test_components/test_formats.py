@@ -0,0 +1,221 @@
+"""Tests for compiled column formatters."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import Badge, CellFormat, Column, Table, formats
+
+NOW = datetime(2026, 3, 15, 12, 0, 0)
+
+
+class TestNumberFormats:
+    """number, percent and currency."""
+
+    def test_number(self):
+        assert formats.number()(1234567) == "1,234,567"
+        assert formats.number(2)(1234.5) == "1,234.50"
+        assert formats.number(1, thousands=False)(1234.56) == "1234.6"
+
+    def test_percent(self):
+        assert formats.percent()(0.256) == "25.6%"
+        assert formats.percent(0)(1) == "100%"
+
+    def test_currency(self):
+        assert formats.currency()(1234.5) == "$1,234.50"
+        assert formats.currency()(-5) == "-$5.00"
+        assert formats.currency("€", after=True)(5) == "5.00\u00a0€"
+
+    def test_missing_values(self):
+        fmt = formats.number(na="—")
+        assert fmt(None) == "—"
+        assert fmt(float("nan")) == "—"
+        assert fmt.batch([1, None, 2]) == ["1", "—", "2"]
+
+    def test_non_numeric_passthrough(self):
+        assert formats.number()("n/a") == "n/a"
+
+    def test_pandas_na_is_missing(self):
+        """pandas.NA compares to NA, which raises TypeError in a boolean context."""
+
+        def ne(self, other):
+            return self
+
+        def truth(self):
+            raise TypeError("boolean value of NA is ambiguous")
+
+        attrs = {"__ne__": ne, "__bool__": truth, "__module__": "pandas._libs.missing"}
+        na = type("NAType", (), attrs)()
+
+        fmt = formats.number(na="—")
+        assert fmt(na) == "—"
+        assert fmt.batch([1, na]) == ["1", "—"]
+
+    @pytest.mark.parametrize("error", [TypeError, ValueError])
+    def test_values_without_truthy_comparison_are_formatted(self, error):
+        """Only pandas.NA is blanked; other values whose comparison fails are shown."""
+
+        class Ambiguous:
+            def __bool__(self):
+                raise error("ambiguous")
+
+        class Cell:
+            def __ne__(self, other):
+                return Ambiguous()
+
+            def __str__(self):
+                return "cell"
+
+        assert formats.number(na="—")(Cell()) == "cell"
+
+
+class TestDateFormats:
+    """date_format and relative_time."""
+
+    def test_date_format(self):
+        fmt = formats.date_format("%d %b %Y")
+        assert fmt(date(2026, 1, 2)) == "02 Jan 2026"
+        assert fmt("2026-01-02T10:00:00") == "02 Jan 2026"
+        assert fmt("soon") == "soon"
+
+    def test_date_format_caches_distinct_values(self):
+        fmt = formats.date_format()
+        days = [date(2026, 1, 1 + i % 3) for i in range(300)]
+        assert fmt.batch(days)[:3] == ["2026-01-01", "2026-01-02", "2026-01-03"]
+        assert len(fmt._memo) == 3
+
+    def test_relative_time(self):
+        fmt = formats.relative_time(now=NOW)
+        assert fmt(NOW - timedelta(seconds=10)) == "just now"
+        assert fmt(NOW - timedelta(minutes=5)) == "5 minutes ago"
+        assert fmt(NOW - timedelta(minutes=58)) == "1 hour ago"
+        assert fmt(NOW - timedelta(hours=30)) == "1 day ago"
+        assert fmt(NOW + timedelta(days=3)) == "in 3 days"
+        assert fmt(NOW - timedelta(days=45)) == "2026-01-29"
+
+    def test_relative_time_aware_values(self):
+        now = NOW.replace(tzinfo=timezone.utc)
+        fmt = formats.relative_time(now=now)
+        assert fmt(now - timedelta(hours=2)) == "2 hours ago"
+        assert fmt.batch([NOW - timedelta(hours=3), None]) == ["3 hours ago", ""]
+
+
+class TestLabelsAndSpecs:
+    """labels and format spec strings."""
+
+    def test_labels(self):
+        fmt = formats.labels({"ok": "Healthy", "err": "Failing"})
+        assert fmt.batch(["ok", "err", "new", None]) == ["Healthy", "Failing", "new", ""]
+        assert formats.labels({}, default="?")("x") == "?"
+
+    def test_labels_with_components(self):
+        fmt = formats.labels({"ok": Badge("OK", variant="success")})
+        assert "badge" in to_xml(fmt("ok"))
+
+    def test_compile_format(self):
+        assert formats.compile_format(",.2f")(1234.5) == "1,234.50"
+        assert formats.compile_format("{:>5}")("ab") == "   ab"
+        assert formats.compile_format(".0%")(0.5) == "50%"
+        assert formats.compile_format("%Y/%m")(date(2026, 5, 1)) == "2026/05"
+
+    def test_column_compiles_spec_strings(self):
+        col = Column("price", formatter=",.2f")
+        assert isinstance(col.formatter, CellFormat)
+        assert col.format(1000) == "1,000.00"
+
+
+class TestTableIntegration:
+    """Bulk builders apply compiled formatters per column."""
+
+    records = [
+        {"amount": i * 1000.5, "day": date(2026, 1, 1 + i % 5), "status": ["ok", "err"][i % 2]}
+        for i in range(40)
+    ]
+
+    def test_same_output_as_functions(self):
+        compiled = [
+            Column("amount", formatter=formats.currency()),
+            Column("day", formatter=formats.date_format("%d %b")),
+            Column("status", formatter=formats.labels({"ok": "Up", "err": "Down"})),
+        ]
+        functions = [
+            Column("amount", formatter=lambda v: f"${v:,.2f}"),
+            Column("day", formatter=lambda d: d.strftime("%d %b")),
+            Column("status", formatter={"ok": "Up", "err": "Down"}.get),
+        ]
+        assert to_xml(Table.from_records(self.records, compiled)) == to_xml(
+            Table.from_records(self.records, functions)
+        )
+
+    def test_cache_keys_by_type(self):
+        """1, True and 1.0 are equal dict keys but must not share a memo entry."""
+
+        class Repr(CellFormat):
+            def _format(self, value):
+                return repr(value)
+
+        assert Repr(cache=True).batch([1, True, 1.0, 1]) == ["1", "True", "1.0", "1"]
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            CellFormat()
+
+    def test_batch_called_once_per_column(self):
+        calls = []
+
+        class Upper(CellFormat):
+            def _format(self, value):
+                return value.upper()
+
+            def batch(self, values):
+                calls.append(len(values))
+                return super().batch(values)
+
+        Table.from_records(self.records, [Column("status", formatter=Upper())])
+        assert calls == [40]
+
+
+@pytest.fixture
+def np():
+    return pytest.importorskip("numpy")
+
+
+class TestNumPy:
+    """Vectorized formatting of NumPy columns."""
+
+    def test_float_array(self, np):
+        values = np.array([1234.5, np.nan, -2.0])
+        assert formats.currency().batch(values) == ["$1,234.50", "", "-$2.00"]
+
+    def test_numeric_array_formats_each_distinct_value_once(self, np):
+        calls = []
+
+        class Counting(formats.NumberFormat):
+            def _format(self, value):
+                calls.append(value)
+                return super()._format(value)
+
+        values = np.array([2.5, 1.0, 2.5, np.nan, 1.0, 2.5])
+        assert Counting(1).batch(values) == ["2.5", "1.0", "2.5", "", "1.0", "2.5"]
+        assert sorted(calls) == [1.0, 2.5]
+        calls.clear()
+        Counting(1, cache=False).batch(values)
+        assert len(calls) == 5
+
+    def test_pandas_nullable_column(self, np):
+        pd = pytest.importorskip("pandas")
+        values = pd.array([1, None, 3], dtype="Int64")
+        assert formats.number(na="—").batch(pd.Series(values)) == ["1", "—", "3"]
+
+    def test_cached_array_formats_distinct_values(self, np):
+        fmt = formats.labels({1: "one", 2: "two"})
+        assert fmt.batch(np.array([1, 2, 1, 3])) == ["one", "two", "one", "3"]
+
+    def test_datetime64(self, np):
+        values = np.array(["2026-01-02", "NaT"], dtype="datetime64[ns]")
+        assert formats.date_format("%d/%m").batch(values) == ["02/01", ""]
+
+    def test_from_arrays_passes_arrays(self, np):
+        html = to_xml(Table.from_arrays([np.array([0.5, 0.25])], [Column("x", formatter=".0%")]))
+        assert "<td>50%</td>" in html and "<td>25%</td>" in html
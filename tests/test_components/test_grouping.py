@@ -0,0 +1,146 @@
+"""Tests for grouped tables with subtotals."""
+
+import re
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import Column, Table, formats, group_records
+
+SALES = [
+    {"region": "EMEA", "country": "FR", "rep": "Ana", "revenue": 100, "deals": 2},
+    {"region": "EMEA", "country": "DE", "rep": "Ben", "revenue": 250, "deals": 1},
+    {"region": "AMER", "country": "US", "rep": "Cy", "revenue": 400, "deals": 4},
+    {"region": "EMEA", "country": "FR", "rep": "Dee", "revenue": 50, "deals": 1},
+    {"region": "AMER", "country": "CA", "rep": "Eli", "revenue": 75, "deals": None},
+]
+COLUMNS = ["country", "rep", Column("revenue", formatter=formats.currency(), cls="text-end")]
+
+
+class TestGroupRecords:
+    """Single-pass grouping and aggregation."""
+
+    def test_groups_in_first_appearance_order(self):
+        root = group_records(SALES, "region", {"revenue": "sum"})
+        assert [g.key for g in root.children] == ["EMEA", "AMER"]
+        assert [g.totals["revenue"] for g in root.children] == [400, 475]
+        assert root.totals["revenue"] == 875
+        assert root.count == 5
+
+    def test_nested_levels(self):
+        root = group_records(SALES, ["region", "country"], {"revenue": "sum"})
+        emea = root.children[0]
+        assert [(g.key, g.count, g.totals["revenue"]) for g in emea.children] == [
+            ("FR", 2, 150),
+            ("DE", 1, 250),
+        ]
+        assert emea.records == []
+        assert [r["rep"] for r in emea.children[0].records] == ["Ana", "Dee"]
+        assert emea.children[0].path == ("EMEA", "FR")
+
+    def test_aggregates(self):
+        root = group_records(
+            SALES,
+            "region",
+            {"revenue": "mean", "deals": "max", "rep": "count", "country": lambda v: len(set(v))},
+        )
+        amer = root.children[1].totals
+        assert amer == {"revenue": 237.5, "deals": 4, "rep": 2, "country": 2}
+
+    def test_missing_values_skipped(self):
+        root = group_records(SALES, "region", {"deals": "sum"})
+        assert root.children[1].totals["deals"] == 4
+
+    def test_mean_ignores_missing_values(self):
+        root = group_records(SALES, "region", {"deals": "mean"})
+        assert root.children[1].totals["deals"] == 4
+        assert root.totals["deals"] == 2
+        records = [{"k": "a", "v": 10}, {"k": "a", "v": None}, {"k": "a", "v": 20}]
+        assert group_records(records, "k", {"v": "mean"}).totals["v"] == 15
+        assert group_records([{"k": "a", "v": None}], "k", {"v": "mean"}).totals["v"] is None
+
+    def test_sorted_groups(self):
+        root = group_records(SALES, "country", sort=True)
+        assert [g.key for g in root.children] == ["CA", "DE", "FR", "US"]
+
+    def test_single_pass(self):
+        reads = []
+
+        def records():
+            for record in SALES:
+                reads.append(record["rep"])
+                yield record
+
+        group_records(records(), ["region", "country"], {"revenue": "sum"})
+        assert len(reads) == len(SALES)
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            group_records(SALES, [])
+        with pytest.raises(ValueError):
+            group_records(SALES, "region", {"revenue": "median"})
+
+
+class TestFromGroups:
+    """Table.from_groups rendering."""
+
+    def test_sections_and_subtotals(self):
+        html = to_xml(Table.from_groups(SALES, COLUMNS, by="region", aggregates={"revenue": "sum"}))
+        assert html.count("<tbody") == 2
+        assert html.count('class="table-group-divider"') == 2
+        assert "EMEA subtotal" in html
+        assert '<td class="text-end">$400.00</td>' in html
+        assert re.search(r"<tfoot>\s*<tr class=\"faststrap-total fw-bold\">", html)
+        assert '<td class="text-end">$875.00</td>' in html
+
+    def test_group_header_shows_count(self):
+        html = to_xml(Table.from_groups(SALES, COLUMNS, by="region"))
+        assert 'scope="rowgroup"' in html
+        assert "EMEA<span" in html and "(3)" in html
+
+    def test_nested_groups(self):
+        html = to_xml(
+            Table.from_groups(
+                SALES, COLUMNS, by=["region", "country"], aggregates={"revenue": "sum"}
+            )
+        )
+        assert html.index("FR subtotal") < html.index("DE subtotal") < html.index("EMEA subtotal")
+        assert "padding-left: 1.75rem" in html
+
+    def test_collapsible(self):
+        html = to_xml(
+            Table.from_groups(
+                SALES, COLUMNS, by="region", aggregates={"revenue": "sum"}, collapsible=True
+            )
+        )
+        targets = re.findall(r'data-bs-target="#([^"]+)"', html)
+        assert len(targets) == 2
+        for target in targets:
+            assert f'<tbody id="{target}" class="collapse show">' in html
+        assert 'aria-expanded="true"' in html
+
+    def test_collapsed(self):
+        html = to_xml(
+            Table.from_groups(SALES, COLUMNS, by="region", collapsible=True, collapsed=True)
+        )
+        assert 'class="collapse"' in html
+        assert 'aria-expanded="false"' in html
+
+    def test_without_subtotals_or_total(self):
+        html = to_xml(
+            Table.from_groups(
+                SALES,
+                COLUMNS,
+                by="region",
+                aggregates={"revenue": "sum"},
+                subtotals=False,
+                total_label=None,
+            )
+        )
+        assert "subtotal" not in html
+        assert "<tfoot>" not in html
+
+    def test_rows_keep_keys_and_table_options(self):
+        html = to_xml(Table.from_groups(SALES, COLUMNS, by="region", key="rep", striped=True))
+        assert '<tr id="row-Ana">' in html
+        assert 'class="table table-striped"' in html
@@ -1,8 +1,11 @@
 """Tests for Pagination component."""
 
-from fasthtml.common import to_xml
+import re
 
-from faststrap.components.navigation import Pagination
+from fasthtml.common import Div, to_xml
+
+from faststrap.components.navigation import Pagination, page_fragment, page_url
+from faststrap.core.cache import FragmentCache
 
 
 def test_pagination_basic():
@@ -126,3 +129,168 @@ def test_pagination_aria_label():
     html = to_xml(pagination)
 
     assert 'aria-label="Page navigation"' in html
+
+
+def test_pagination_preserves_query_params():
+    """Existing query parameters in base_url are kept; only page is replaced."""
+    html = to_xml(Pagination(2, 5, base_url="/items?q=red+shoes&page=2&sort=price"))
+
+    assert "/items?q=red+shoes&amp;page=3&amp;sort=price" in html
+    assert "/items?q=red+shoes&amp;page=1&amp;sort=price" in html
+
+
+def test_pagination_page_param():
+    """The page query parameter name is configurable."""
+    html = to_xml(Pagination(1, 3, base_url="/items", page_param="p"))
+
+    assert "/items?p=2" in html
+
+
+def test_pagination_default_links_are_relative_queries():
+    """Without base_url, links only change the query string."""
+    html = to_xml(Pagination(1, 3))
+
+    assert 'href="?page=2"' in html
+
+
+def test_page_url():
+    """page_url sets, replaces and removes query parameters."""
+    assert page_url("/a?x=1&page=2", page=3) == "/a?x=1&page=3"
+    assert page_url("/a?after=c1&x=1", after=None, before="c0") == "/a?x=1&before=c0"
+    assert page_url("https://h/a?x=1#top", page=2) == "https://h/a?x=1&page=2#top"
+
+
+def test_pagination_cursor_mode():
+    """Cursor mode renders prev/next links from opaque cursors without a total."""
+    html = to_xml(Pagination(before="b64:abc", after="b64:xyz", base_url="/events?page=4&q=x"))
+
+    assert "/events?q=x&amp;before=b64%3Aabc" in html
+    assert "/events?q=x&amp;after=b64%3Axyz" in html
+    assert "page=" not in html
+    assert 'aria-label="Previous"' in html and 'aria-label="Next"' in html
+
+
+def test_pagination_cursor_mode_edges():
+    """Missing cursors disable the corresponding link."""
+    first = to_xml(Pagination(after="c1", base_url="/e"))
+    assert first.count("disabled") == 1
+    assert "/e?after=c1" in first
+
+    last = to_xml(Pagination(cursor=True, before="c9", base_url="/e?after=c8"))
+    assert "/e?before=c9" in last
+    assert "after=" not in last.replace("/e?after=c8", "")
+
+
+def test_pagination_cursor_first_and_jumps():
+    """Cursor mode supports a First link and caller-supplied jump links."""
+    html = to_xml(
+        Pagination(
+            before="c5",
+            after="c6",
+            base_url="/e?q=x&after=c4",
+            show_first_last=True,
+            jumps={"2023": "y2023", "2024": "y2024"},
+        )
+    )
+
+    assert 'href="/e?q=x" aria-label="First"' in html
+    assert "/e?q=x&amp;after=y2023" in html
+    assert ">2024</a>" in html
+
+
+def test_pagination_cursor_first_without_base_url():
+    """Without a base_url, First drops the cursor instead of reloading the current URL."""
+    html = to_xml(Pagination(before="c5", after="c6", show_first_last=True))
+
+    assert 'href="?" aria-label="First"' in html
+    assert 'href=""' not in html
+
+
+def test_pagination_approximate_total():
+    """An estimated total is shown as ~N and never disables Next."""
+    html = to_xml(Pagination(40, 40, approximate=True, show_first_last=True, base_url="/t"))
+
+    assert "of ~40" in html
+    assert "/t?page=41" in html
+    assert "»" not in html
+
+
+def test_pagination_cursor_approximate_total():
+    """Cursor mode can display an approximate page count."""
+    html = to_xml(Pagination(after="c1", total_pages=12500, approximate=True))
+
+    assert "~12,500 pages" in html
+
+
+def test_pagination_requires_total_in_page_mode():
+    """Page mode without total_pages is rejected."""
+    import pytest
+
+    with pytest.raises(ValueError):
+        Pagination(2, cursor=False)
+
+
+def test_pagination_htmx_links():
+    """HTMX mode adds hx-get/hx-target/hx-push-url and keeps the href."""
+    html = to_xml(Pagination(2, 5, base_url="/items?q=x", htmx=True, target="#results"))
+
+    assert 'href="/items?q=x&amp;page=3"' in html
+    assert 'hx-get="/items?q=x&amp;page=3"' in html
+    assert 'hx-target="#results"' in html
+    assert html.count('hx-push-url="true"') == 6  # previous, next and four inactive pages
+    assert "<script>" not in html
+
+
+def test_pagination_htmx_without_push_url():
+    """push_url=False keeps the address bar unchanged."""
+    html = to_xml(Pagination(1, 3, htmx=True, push_url=False, swap="outerHTML"))
+
+    assert 'hx-push-url="false"' in html
+    assert 'hx-swap="outerHTML"' in html
+    assert 'hx-target="body"' in html
+
+
+def test_pagination_plain_links_have_no_htmx():
+    """Without htmx the links are plain hrefs."""
+    assert "hx-get" not in to_xml(Pagination(2, 5))
+
+
+def test_pagination_prefetch_marks_adjacent_pages():
+    """Only links to the previous and next page are prefetched."""
+    html = to_xml(Pagination(3, 9, base_url="/p", target="#list", prefetch=True))
+
+    marked = re.findall(r'<a href="([^"]+)"[^>]*data-fs-prefetch="true"', html)
+    assert sorted(set(marked)) == ["/p?page=2", "/p?page=4"]
+    assert 'hx-get="/p?page=5"' in html
+    assert html.count("window.faststrapPrefetch") == 2
+    assert "htmx.swap" in html
+
+
+def test_pagination_prefetch_cursor_mode():
+    """Cursor mode prefetches the before/after pages."""
+    html = to_xml(Pagination(before="a", after="b", base_url="/e", prefetch=True))
+
+    marked = re.findall(r'<a href="([^"]+)"[^>]*data-fs-prefetch="true"', html)
+    assert marked == ["/e?before=a", "/e?after=b"]
+
+
+def test_pagination_prefetch_served_from_fragment_cache():
+    """A prefetched page rendered through page_fragment() is reused by the real request."""
+    store = FragmentCache()
+    renders = []
+
+    @page_fragment(cache=store)
+    def results(page):
+        renders.append(page)
+        return Div(f"page {page}", Pagination(page, 9, target="#results", prefetch=True))
+
+    prefetched = results(4)
+    clicked = results(4)
+
+    assert renders == [4]
+    assert clicked is prefetched
+    assert "data-fs-prefetch" in clicked
+
+    assert store.invalidate("pagination") == 1
+    results(4)
+    assert renders == [4, 4]
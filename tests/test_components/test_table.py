@@ -1,8 +1,13 @@
 """Tests for Table component."""
 
+import asyncio
+from types import SimpleNamespace
+
+import pytest
 from fasthtml.common import to_xml
 
-from faststrap.components.display import Table, TBody, TCell, THead, TRow
+from faststrap import aiter_html, iter_html
+from faststrap.components.display import Badge, Column, Table, TBody, TCell, THead, TRow
 
 
 class TestTableBasic:
@@ -259,3 +264,191 @@ class TestTableCustomization:
         html = to_xml(table)
         assert 'data-page="1"' in html
         assert 'data-total="100"' in html
+
+
+class TestTableLazyRows:
+    """Test lazy row sources (rows=..., row_mapper=...)."""
+
+    records = [{"name": f"user{i}", "email": f"u{i}@example.com"} for i in range(10)]
+
+    @staticmethod
+    def to_row(record):
+        return TRow(TCell(record["name"]), TCell(record["email"]))
+
+    def test_tbody_rows_match_eager_rendering(self):
+        """Lazy rows render exactly like rows passed up front."""
+        lazy = TBody(rows=iter(self.records), row_mapper=self.to_row)
+        assert to_xml(lazy) == to_xml(TBody(rows=self.records, row_mapper=self.to_row))
+        assert "<td>user9</td>" in to_xml(TBody(rows=self.records, row_mapper=self.to_row))
+
+    def test_tbody_default_row_mapper(self):
+        """Records without a mapper become one plain cell per value."""
+        html = to_xml(TBody(rows=[("a", 1), ("b", 2)]))
+        assert "<td>a</td>" in html
+        assert "<td>2</td>" in html
+
+    def test_tbody_rows_after_children(self):
+        """Lazy rows follow any explicit children."""
+        html = to_xml(TBody(TRow(TCell("first")), rows=[("second",)]))
+        assert html.index("first") < html.index("second")
+
+    def test_table_rows_are_streamed_in_batches(self):
+        """Records are pulled lazily, one batch per chunk."""
+        pulled = []
+
+        def records():
+            for record in self.records:
+                pulled.append(record)
+                yield record
+
+        table = Table(rows=records(), row_mapper=self.to_row, batch_size=4)
+        chunks = iter_html(table)
+
+        first = next(chunks)
+        assert "<table" in first
+        assert len(pulled) == 4
+
+        rest = "".join(chunks)
+        assert len(pulled) == 10
+        expected = to_xml(Table(rows=self.records, row_mapper=self.to_row))
+        assert first + rest == expected
+
+    def test_table_async_rows(self):
+        """Async iterators (e.g. DB cursors) stream through aiter_html."""
+
+        async def cursor():
+            for record in self.records:
+                yield record
+
+        async def render():
+            table = Table(rows=cursor(), row_mapper=self.to_row, batch_size=3)
+            return [chunk async for chunk in aiter_html(table)]
+
+        chunks = asyncio.run(render())
+        expected = to_xml(Table(rows=self.records, row_mapper=self.to_row))
+        assert "".join(chunks) == expected
+        assert len(chunks) >= 4
+
+    def test_async_rows_require_async_renderer(self):
+        """Async sources cannot be rendered synchronously."""
+
+        async def cursor():
+            yield {"name": "x", "email": "y"}
+
+        with pytest.raises(TypeError):
+            list(iter_html(TBody(rows=cursor())))
+        with pytest.raises(TypeError):
+            to_xml(TBody(rows=cursor()))
+
+    def test_invalid_batch_size(self):
+        """batch_size must be positive."""
+        with pytest.raises(ValueError):
+            TBody(rows=[], batch_size=0)
+
+
+class TestTableBulkBuilders:
+    """Table.from_records / from_columns / from_arrays."""
+
+    records = [
+        {"name": "Alice", "balance": 1234.5, "note": None},
+        {"name": "Bob <admin>", "balance": -3.0, "note": "vip"},
+    ]
+    columns = [
+        Column("name"),
+        Column("balance", formatter="{:,.2f}".format, cls="text-end", variant="success"),
+        Column("note", header_cls="w-25"),
+    ]
+
+    def expected(self, **kwargs):
+        """The same table built with TRow/TCell."""
+        return to_xml(
+            Table(
+                THead(
+                    TRow(
+                        TCell("Name", header=True, scope="col"),
+                        TCell("Balance", header=True, scope="col"),
+                        TCell("Note", header=True, scope="col", cls="w-25"),
+                    )
+                ),
+                TBody(
+                    TRow(
+                        TCell("Alice"),
+                        TCell("1,234.50", cls="text-end", variant="success"),
+                        TCell(""),
+                    ),
+                    TRow(
+                        TCell("Bob <admin>"),
+                        TCell("-3.00", cls="text-end", variant="success"),
+                        TCell("vip"),
+                    ),
+                ),
+                **kwargs,
+            )
+        )
+
+    def test_from_records_matches_component_tree(self):
+        """Bulk output is identical to the equivalent TRow/TCell tree."""
+        html = to_xml(Table.from_records(self.records, self.columns, striped=True))
+        assert html == self.expected(striped=True)
+        assert "Bob &lt;admin&gt;" in html
+
+    def test_from_records_tuples_and_objects(self):
+        """Tuples are read by index and objects by attribute."""
+        tuples = [("Alice", 1234.5, None), ("Bob <admin>", -3.0, "vip")]
+        cols = [
+            Column(0, "Name"),
+            Column(1, "Balance", formatter="{:,.2f}".format, cls="text-end", variant="success"),
+            Column(2, "Note", header_cls="w-25"),
+        ]
+        assert to_xml(Table.from_records(tuples, cols)) == self.expected()
+
+        objects = [SimpleNamespace(**r) for r in self.records]
+        assert to_xml(Table.from_records(objects, self.columns)) == self.expected()
+
+    def test_from_records_infers_columns(self):
+        """Without columns, the keys of the first mapping are used."""
+        html = to_xml(Table.from_records([{"first_name": "Ada"}]))
+        assert '<th scope="col">First Name</th>' in html
+        assert "<td>Ada</td>" in html
+
+    def test_from_records_empty_and_no_header(self):
+        """Empty inputs render an empty body; header=False omits the thead."""
+        assert "<tbody></tbody>" in to_xml(Table.from_records([], ["name"]))
+        assert "<thead" not in to_xml(Table.from_records(self.records, ["name"], header=False))
+
+    def test_from_columns(self):
+        """Column-oriented dicts produce the same table."""
+        data = {
+            "name": ["Alice", "Bob <admin>"],
+            "balance": [1234.5, -3.0],
+            "note": [None, "vip"],
+        }
+        assert to_xml(Table.from_columns(data, self.columns)) == self.expected()
+
+    def test_from_columns_length_mismatch(self):
+        """Columns of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            Table.from_columns({"a": [1, 2], "b": [1]})
+
+    def test_from_arrays(self):
+        """Positional arrays are matched to columns by position."""
+        arrays = [["Alice", "Bob <admin>"], [1234.5, -3.0], [None, "vip"]]
+        assert to_xml(Table.from_arrays(arrays, self.columns)) == self.expected()
+        with pytest.raises(ValueError):
+            Table.from_arrays(arrays, ["only one"])
+
+    def test_from_arrays_numpy(self):
+        """NumPy arrays (1-D columns or a 2-D matrix) are converted to Python scalars."""
+        np = pytest.importorskip("numpy")
+        matrix = np.arange(6).reshape(3, 2)
+        html = to_xml(Table.from_arrays(matrix, ["x", "y"]))
+        assert "<td>4</td>" in html and "<td>5</td>" in html
+        html = to_xml(Table.from_arrays([np.array([1.5]), np.array([2])], ["a", "b"]))
+        assert "<td>1.5</td>" in html
+
+    def test_formatter_may_return_components(self):
+        """Formatters can return FT components or tuples of children."""
+        cols = [Column("name", formatter=lambda v: (Badge(v), " x"))]
+        html = to_xml(Table.from_records([{"name": "new"}], cols))
+        expected = to_xml(Table(TBody(TRow(TCell(Badge("new"), " x")))))
+        assert expected.split("<tbody>")[1] in html
@@ -0,0 +1,147 @@
+"""Tests for keyed rows and incremental table diffs."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import Table, TableSnapshot, TCell, TRow, diff_rows
+from faststrap.components.display import row_id
+
+
+def rows(data):
+    return [TRow(TCell(name), TCell(status), key=key) for key, name, status in data]
+
+
+BASE = [(1, "web-1", "up"), (2, "web-2", "up"), (3, "db-1", "up"), (4, "cache", "up")]
+
+
+class TestKeyedRows:
+    """TRow(key=...) and row ids."""
+
+    def test_key_sets_row_id(self):
+        assert 'id="row-42"' in to_xml(TRow(TCell("x"), key=42))
+
+    def test_explicit_id_wins(self):
+        assert 'id="custom"' in to_xml(TRow(TCell("x"), key=42, id="custom"))
+
+    def test_row_id_escapes_selector_characters(self):
+        assert row_id("a@b.io") == "row-a_40_b_2e_io"
+        assert row_id("a_b") != row_id("a b")
+        assert row_id("srv-1") == "row-srv-1"
+
+    def test_from_records_key(self):
+        html = to_xml(Table.from_records([{"id": 7, "name": "x"}], ["name"], key="id"))
+        assert '<tr id="row-7">' in html
+
+
+class TestTableSnapshot:
+    """Diffing snapshots into out-of-band swaps."""
+
+    def test_no_changes(self):
+        snapshot = TableSnapshot("body", rows(BASE))
+        assert snapshot.update(rows(BASE)) == ()
+        assert not snapshot.diff(rows(BASE))
+
+    def test_changed_row_replaced(self):
+        snapshot = TableSnapshot("body", rows(BASE))
+        new = list(BASE)
+        new[2] = (3, "db-1", "down")
+        updates = snapshot.update(rows(new))
+        assert len(updates) == 1
+        html = to_xml(updates[0])
+        assert html.startswith("<template>")
+        assert 'id="row-3"' in html and 'hx-swap-oob="true"' in html
+        assert "down" in html and "web-1" not in html
+
+    def test_removed_row_deleted(self):
+        snapshot = TableSnapshot("body", rows(BASE))
+        updates = snapshot.update(rows(BASE[:1] + BASE[2:]))
+        assert len(updates) == 1
+        html = to_xml(updates[0])
+        assert 'id="row-2"' in html and 'hx-swap-oob="delete"' in html
+
+    def test_inserted_row_positioned_after_predecessor(self):
+        snapshot = TableSnapshot("body", rows(BASE))
+        new = BASE[:2] + [(9, "web-3", "up")] + BASE[2:]
+        (update,) = snapshot.update(rows(new))
+        html = to_xml(update)
+        assert 'hx-swap-oob="afterend:#row-2"' in html
+        assert '<tr id="row-9">' in html
+
+    def test_inserted_first_row(self):
+        snapshot = TableSnapshot("body", rows(BASE))
+        (update,) = snapshot.update(rows([(0, "lb", "up")] + BASE))
+        assert 'hx-swap-oob="afterbegin:#body"' in to_xml(update)
+
+    def test_consecutive_inserts_chain(self):
+        snapshot = TableSnapshot("body", rows(BASE), max_ratio=1)
+        new = BASE + [(5, "a", "up"), (6, "b", "up")]
+        updates = [to_xml(u) for u in snapshot.update(rows(new))]
+        assert 'afterend:#row-4"' in updates[0]
+        assert 'afterend:#row-5"' in updates[1]
+
+    def test_snapshot_tracks_latest_state(self):
+        snapshot = TableSnapshot("body", rows(BASE))
+        changed = [(1, "web-1", "down")] + BASE[1:]
+        assert len(snapshot.update(rows(changed))) == 1
+        assert snapshot.update(rows(changed)) == ()
+
+    def test_reorder_replaces_body(self):
+        snapshot = TableSnapshot("body", rows(BASE))
+        (update,) = snapshot.update(rows(list(reversed(BASE))))
+        html = to_xml(update)
+        assert 'hx-swap-oob="innerHTML:#body"' in html
+        assert html.count("<tr") == 4
+
+    def test_large_change_replaces_body(self):
+        snapshot = TableSnapshot("body", rows(BASE), max_ratio=0.25)
+        new = [(k, n, "down") for k, n, _ in BASE[:2]] + BASE[2:]
+        (update,) = snapshot.update(rows(new))
+        assert "innerHTML:#body" in to_xml(update)
+
+    def test_caller_rows_not_mutated(self):
+        snapshot = TableSnapshot("body", rows(BASE))
+        new = rows([(1, "web-1", "down")] + BASE[1:])
+        snapshot.update(new)
+        assert "hx-swap-oob" not in to_xml(new[0])
+
+    def test_rows_require_keys(self):
+        with pytest.raises(ValueError):
+            TableSnapshot("body", [TRow(TCell("x"))])
+        with pytest.raises(ValueError):
+            TableSnapshot("body", rows([(1, "a", "b"), (1, "c", "d")]))
+
+    def test_payload_is_small(self):
+        data = [(i, f"host-{i}", "up") for i in range(1000)]
+        snapshot = TableSnapshot("body", rows(data))
+        data[500] = (500, "host-500", "down")
+        payload = "".join(to_xml(u) for u in snapshot.update(rows(data)))
+        full = to_xml(Table(*rows(data)))
+        assert len(payload) * 100 < len(full)
+
+
+def test_diff_rows_stateless():
+    updates = diff_rows(rows(BASE), rows(BASE[1:]), "body")
+    assert 'hx-swap-oob="delete"' in to_xml(updates[0])
+
+
+def test_fingerprints_are_stable_across_processes():
+    """Snapshots kept in a session must diff the same on another worker."""
+    script = (
+        "from faststrap import TableSnapshot, TCell, TRow;"
+        "print(TableSnapshot('body', [TRow(TCell('web-1'), key=1)]).fingerprints)"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
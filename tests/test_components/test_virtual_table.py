@@ -0,0 +1,152 @@
+"""Tests for the VirtualTable component."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import Column, ListSource, VirtualTable
+from faststrap.components.display.virtual_table import MAX_SCROLL_HEIGHT
+
+RECORDS = [{"id": i, "event": f"event {i}"} for i in range(10_000)]
+
+
+def fetch(start, stop):
+    fetch.calls.append((start, stop))
+    return RECORDS[start:stop]
+
+
+fetch.calls = []
+
+
+def fake_request(params=None, htmx=True):
+    headers = {"hx-request": "true", "hx-target": "vtable-body"} if htmx else {}
+    return SimpleNamespace(query_params=params or {}, headers=headers)
+
+
+def render(**kwargs):
+    kwargs.setdefault("total", len(RECORDS))
+    return VirtualTable(fetch, ["id", "event"], endpoint="/log", **kwargs)
+
+
+def body_rows(html):
+    return re.findall(r"<td>(\d+)</td>", html)
+
+
+class TestVirtualTableRender:
+    """Full render of the viewport."""
+
+    def test_viewport(self):
+        html = to_xml(render(height=400))
+        assert 'id="vtable"' in html
+        assert "height: 400px; overflow-y: auto" in html
+        assert "<style>" in html
+        assert 'id="vtable-body"' in html
+
+    def test_only_window_is_rendered(self):
+        fetch.calls.clear()
+        html = to_xml(render(window=100))
+        assert fetch.calls == [(0, 100)]
+        rows = body_rows(html)
+        assert rows[0] == "0" and rows[-1] == "99"
+        assert len(rows) == 100
+
+    def test_spacers_replace_hidden_rows(self):
+        html = to_xml(render(start=500, window=100, row_height=40))
+        assert "height: 20000px" in html  # 500 rows above
+        assert f"height: {(10_000 - 600) * 40}px" in html
+
+    def test_no_spacer_at_edges(self):
+        html = to_xml(render(start=0, window=100))
+        assert html.count("faststrap-vspacer") == 2  # CSS rule + bottom spacer
+        html = to_xml(render(start=9_900, window=100))
+        assert html.count("faststrap-vspacer") == 2  # CSS rule + top spacer
+
+    def test_small_dataset_has_no_triggers(self):
+        html = to_xml(VirtualTable(ListSource(RECORDS[:10]), ["id"], endpoint="/log"))
+        assert "hx-get" not in html
+        assert len(body_rows(html)) == 10
+
+    def test_sentinels_trigger_next_and_previous_windows(self):
+        html = to_xml(render(start=1_000, window=100, height=410, row_height=41))
+        triggers = re.findall(r'hx-trigger="intersect once root:#vtable"', html)
+        assert len(triggers) == 4  # two spacers, two sentinel rows
+        assert "start: 1000}" in html
+        assert 'hx-target="#vtable-body"' in html
+
+    def test_window_too_small(self):
+        with pytest.raises(ValueError):
+            render(window=20, height=600, row_height=41)
+
+    def test_total_required_for_callback(self):
+        with pytest.raises(ValueError):
+            VirtualTable(fetch, ["id"], endpoint="/log")
+
+    def test_column_formatters(self):
+        cols = [Column("id", formatter=lambda v: f"#{v}", cls="text-end")]
+        html = to_xml(VirtualTable(ListSource(RECORDS), cols, endpoint="/log"))
+        assert '<td class="text-end">#0</td>' in html
+
+
+class TestVirtualTableScrolling:
+    """Partial responses for scroll requests."""
+
+    def test_partial_returns_tbody(self):
+        result = render(request=fake_request({"start": "0", "top": "0"}))
+        assert to_xml(result).startswith("<tbody")
+
+    def test_scroll_position_centers_window(self):
+        # Row at the top of the viewport: (top - header) / row_height = 5000
+        top = str(5_000 * 41 + 41)
+        html = to_xml(render(request=fake_request({"start": "0", "top": top}), window=200))
+        rows = [int(r) for r in body_rows(html)]
+        assert rows[0] < 5_000 < rows[-1]
+        assert len(rows) == 200
+        assert 'data-start="' + str(rows[0]) + '"' in html
+
+    def test_window_clamped_at_end(self):
+        html = to_xml(render(request=fake_request({"top": "99999999"}), window=200))
+        rows = body_rows(html)
+        assert rows[-1] == "9999"
+
+    def test_start_parameter_without_scroll(self):
+        html = to_xml(render(request=fake_request({"start": "300"}, htmx=False), window=100))
+        assert body_rows(html)[0] == "300"
+        assert 'id="vtable"' in html
+
+    def test_dom_stays_bounded(self):
+        for top in range(0, 10_000 * 41, 97_331):
+            html = to_xml(render(request=fake_request({"top": str(top)}), window=120))
+            assert len(body_rows(html)) == 120
+
+
+class TestVirtualTableCompression:
+    """Very tall tables compress the spacers."""
+
+    total = 1_000_000
+
+    def render(self, **kwargs):
+        return VirtualTable(
+            lambda start, stop: ({"id": i} for i in range(start, stop)),
+            ["id"],
+            endpoint="/log",
+            total=self.total,
+            **kwargs,
+        )
+
+    def test_scroll_height_capped(self):
+        html = to_xml(self.render())
+        heights = [int(h) for h in re.findall(r"height: (\d+)px; padding", html)]
+        assert sum(heights) + 200 * 41 <= MAX_SCROLL_HEIGHT
+        assert "hx-on::after-settle" in html
+
+    def test_scroll_reanchored_after_swap(self):
+        html = to_xml(self.render(request=fake_request({"start": "0", "top": "4000000"})))
+        assert "data-scroll-top=" in html
+        rows = [int(r) for r in body_rows(html)]
+        assert rows[0] > 400_000
+
+    def test_last_row_reachable(self):
+        html = to_xml(self.render(request=fake_request({"top": str(MAX_SCROLL_HEIGHT)})))
+        assert body_rows(html)[-1] == str(self.total - 1)
@@ -0,0 +1,196 @@
+"""Tests for the fragment cache."""
+
+import re
+import time
+
+import pytest
+from fasthtml.common import Div, Safe, to_xml
+
+from faststrap import Badge, Button, Card, Hero, Modal, cache, component_defaults, id_scope
+from faststrap.core.cache import FragmentCache
+
+
+@pytest.fixture
+def store():
+    return FragmentCache(maxsize=3)
+
+
+def test_fragment_decorator_memoizes_by_arguments(store):
+    """Decorated functions render once per argument set."""
+    calls = []
+
+    @cache.fragment(cache=store)
+    def PricingCard(plan, price=0):
+        calls.append(plan)
+        return Card(f"${price}", title=plan)
+
+    first = PricingCard("Pro", price=10)
+    second = PricingCard("Pro", price=10)
+    PricingCard("Team", price=20)
+
+    assert calls == ["Pro", "Team"]
+    assert first is second
+    assert isinstance(first, Safe)
+    assert first == to_xml(Card("$10", title="Pro"))
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 2
+
+
+def test_fragment_splices_into_ft_tree(store):
+    """Cached HTML is embedded without re-escaping."""
+
+    @cache.fragment(cache=store)
+    def NewBadge():
+        return Badge("New")
+
+    html = to_xml(Div(NewBadge()))
+    assert '<span class="badge text-bg-primary">New</span>' in html
+
+
+def test_fragment_lru_eviction(store):
+    """The least recently used entry is evicted past maxsize."""
+    for i in range(3):
+        store.set(i, Badge(str(i)))
+    store.get(0)
+    store.set(3, Badge("3"))
+
+    assert 1 not in store
+    assert 0 in store
+    assert store.stats()["evictions"] == 1
+    assert len(store) == 3
+
+
+def test_fragment_ttl_expiry(store, monkeypatch):
+    """Entries expire after their TTL."""
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    store.set("hero", Hero("Welcome"), ttl=10)
+    assert store.get("hero") is not None
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert store.get("hero") is None
+    assert len(store) == 0
+
+
+def test_fragment_invalidate_by_tag(store):
+    """Tag invalidation removes every tagged entry."""
+    store.set("nav", Badge("nav"), tags=("layout",))
+    store.set("footer", Badge("footer"), tags=("layout", "footer"))
+    store.set("card", Badge("card"), tags=("pricing",))
+
+    assert store.invalidate("layout") == 2
+    assert "nav" not in store
+    assert "card" in store
+
+
+def test_fragment_invalidate_single_call(store):
+    """Decorated functions expose per-argument invalidation."""
+
+    @cache.fragment(cache=store)
+    def Greeting(name):
+        return Badge(name)
+
+    Greeting("Ada")
+    assert Greeting.invalidate("Ada") is True
+    assert Greeting.invalidate("Ada") is False
+
+
+def test_fragment_unhashable_arguments_bypass_cache(store):
+    """Unhashable arguments render without caching."""
+
+    @cache.fragment(cache=store)
+    def Tags(items):
+        return Div(*[Badge(i) for i in items])
+
+    assert Tags(["a", "b"]) == to_xml(Div(Badge("a"), Badge("b")))
+    assert len(store) == 0
+
+
+def test_fragment_context_manager(store):
+    """The block form caches explicitly keyed content."""
+    for _ in range(2):
+        with cache.fragment("footer", tags=("layout",), cache=store) as frag:
+            if not frag.cached:
+                frag.set(Div("Footer"))
+
+    assert frag.cached
+    assert "<div><div>Footer</div>" in to_xml(Div(frag))
+    assert store.stats()["hits"] == 1
+
+
+def test_default_cache_helpers():
+    """Module-level helpers operate on the default cache."""
+    cache.clear()
+
+    @cache.fragment(tags=("demo",))
+    def Demo():
+        return Badge("demo")
+
+    Demo()
+    Demo()
+    assert cache.stats()["hits"] == 1
+    assert cache.invalidate("demo") == 1
+    cache.clear()
+
+
+def test_fragment_keys_are_type_tagged(store):
+    """Equal values of different types are cached separately."""
+
+    @cache.fragment(cache=store)
+    def Value(value):
+        return Badge(repr(value))
+
+    assert [Value(v) for v in (1, True, 1.0, (1,), (True,))] == [
+        to_xml(Badge(r)) for r in ("1", "True", "1.0", "(1,)", "(True,)")
+    ]
+    assert len(store) == 3  # maxsize
+
+
+def test_fragment_keys_follow_component_defaults(store):
+    """Fragments rendered under one tenant's defaults are not served to another."""
+
+    @cache.fragment(cache=store)
+    def Save():
+        return Button("Save")
+
+    with component_defaults(Button={"variant": "dark"}):
+        dark = Save()
+    with component_defaults(Button={"variant": "success"}):
+        success = Save()
+    plain = Save()
+
+    assert "btn-dark" in dark and "btn-success" in success and "btn-primary" in plain
+    with component_defaults(Button={"variant": "dark"}):
+        assert Save() == dark
+    assert store.stats()["hits"] == 1
+    assert Save.invalidate() is True
+    assert len(store) == 0
+
+
+def test_fragment_block_keys_follow_component_defaults(store):
+    """The block form is keyed by the active defaults too."""
+    for variant in ("dark", "light"):
+        with component_defaults(Button={"variant": variant}):
+            with cache.fragment("toolbar", cache=store) as frag:
+                assert not frag.cached
+                frag.set(Button("Go"))
+        assert f"btn-{variant}" in frag.html
+
+
+def test_cached_fragments_use_content_hashed_ids(store):
+    """Cached IDs never collide with the page's counter IDs."""
+
+    @cache.fragment(cache=store)
+    def SignupModal():
+        return Modal("Body", title="Sign up")
+
+    with id_scope():
+        page = to_xml(Div(Modal("Page", title="Sign up"), SignupModal()))
+        with cache.fragment("footer-modal", cache=store) as frag:
+            frag.set(Modal("Footer", title="Help"))
+        block = frag.html
+
+    ids = re.findall(r'id="(modal-[0-9a-f]+)"', page + block)
+    assert ids[0] == "modal-1"
+    assert len(set(ids)) == 3
+    assert all(len(modal_id) == len("modal-") + 8 for modal_id in ids[1:])
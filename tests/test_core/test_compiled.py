@@ -0,0 +1,85 @@
+"""Tests for compiled component templates."""
+
+from fasthtml.common import Div, Safe, to_xml
+
+import faststrap
+from faststrap import Badge, Button, Card, Icon, TCell, compile
+
+
+def test_compiled_button_matches_normal_path():
+    """Compiled output is byte-identical to to_xml of the component."""
+    save = compile(Button, variant="success", size="sm")
+
+    html = save("Save", id="save-1", hx_post="/items/1")
+
+    assert html == to_xml(
+        Button("Save", variant="success", size="sm", id="save-1", hx_post="/items/1")
+    )
+    assert 'hx-post="/items/1"' in html
+
+
+def test_compiled_template_is_reused():
+    """One template is built per call signature."""
+    cell = compile(TCell)
+
+    for value in ("a", "b", 3, 4.5):
+        assert cell(value) == to_xml(TCell(value))
+
+    assert len(cell._templates) == 1
+    assert cell._templates[(1, ())] is not None
+
+
+def test_compiled_escapes_text_and_attributes():
+    """Dynamic values are escaped exactly like the FT path."""
+    link = compile(Button, as_="a")
+
+    text = "a<b & 'c\""
+    href = "/search?q=\"x\"&y='z'"
+
+    assert link(text, href=href) == to_xml(Button(text, as_="a", href=href))
+
+
+def test_compiled_falls_back_for_non_scalar_values():
+    """FT children, booleans and None go through the normal path."""
+    badge = compile(Badge, variant="info")
+
+    assert badge(Icon("star")) == to_xml(Badge(Icon("star"), variant="info"))
+    assert badge("x", hidden=True) == to_xml(Badge("x", variant="info", hidden=True))
+    assert badge("x", id=None) == to_xml(Badge("x", variant="info", id=None))
+    assert badge._templates == {}
+    assert isinstance(badge(Icon("star")), Safe)
+
+
+def test_compiled_falls_back_for_transformed_slots():
+    """Slots merged into other values (e.g. class lists) are not templated."""
+    icon = compile(Icon, cls="text-danger")
+
+    assert icon("heart") == to_xml(Icon("heart", cls="text-danger"))
+    assert icon._templates[(1, ())] is None
+    assert isinstance(icon("heart"), Safe)
+
+    button = compile(Button)
+    assert button("x", variant="danger") == to_xml(Button("x", variant="danger"))
+    assert button._templates[(1, ("variant",))] is None
+
+
+def test_compiled_nested_component():
+    """Slots nested inside component structure are filled in place."""
+    card = compile(Card, header="Stats")
+
+    assert card("Body", title="Title") == to_xml(Card("Body", header="Stats", title="Title"))
+
+
+def test_compiled_output_splices_into_ft_tree():
+    """Compiled output is Safe and is not re-escaped when embedded."""
+    badge = compile(Badge)
+    html = to_xml(Div(badge("New")))
+
+    assert '<span class="badge text-bg-primary">New</span>' in html
+    assert "&lt;span" not in html
+
+
+def test_compile_not_star_exported():
+    """``from faststrap import *`` must not shadow the builtin compile()."""
+    assert faststrap.compile is compile
+    assert "compile" not in faststrap.__all__
@@ -0,0 +1,100 @@
+"""Tests for SVG sprite icons."""
+
+import pytest
+from fasthtml.common import Div, FastHTML, to_xml
+
+from faststrap import Button, Icon, IconSprite, StatCard, add_bootstrap, get_assets
+from faststrap.core.icon_sprite import SPRITE_STYLE, sprite_file, sprite_symbols
+from faststrap.core.theme import component_defaults, reset_component_defaults
+
+from .test_static import fetch
+
+
+@pytest.fixture(autouse=True)
+def _reset_icon_defaults():
+    yield
+    reset_component_defaults("Icon")
+
+
+class TestSymbols:
+    """Glyph outlines read from the bundled WOFF font."""
+
+    def test_symbol_markup(self):
+        markup = sprite_symbols(["house", "bi-gear", "no-such-icon"])
+        assert markup.count("<symbol") == 2
+        assert '<symbol id="bi-gear" viewBox="0 0 300 300"><path d="M' in markup
+        assert markup.index("bi-gear") < markup.index("bi-house")
+        assert markup.endswith('Z"/></symbol>')
+
+    def test_sprite_file_cached_by_icon_set(self, tmp_path):
+        relative = sprite_file(["house", "gear"], tmp_path)
+        assert relative.startswith("icons/bootstrap-icons.sprite-") and relative.endswith(".svg")
+        sheet = (tmp_path / relative).read_text()
+        assert sheet.startswith('<svg xmlns="http://www.w3.org/2000/svg"><symbol id="bi-gear"')
+        assert sprite_file(["bi-gear", "house"], tmp_path) == relative
+        assert sprite_file(["house"], tmp_path) != relative
+
+
+class TestSpriteMode:
+    """Icon rendering and sprite companions."""
+
+    def test_icon_font_mode_unchanged(self):
+        assert to_xml(Icon("heart", cls="text-danger")) == '<i class="bi bi-heart text-danger"></i>'
+
+    def test_icon_sprite_mode(self):
+        html = to_xml(Icon("heart", mode="sprite", cls="text-danger", aria_label="Like"))
+        assert html.startswith('<svg class="bi bi-heart text-danger"')
+        assert 'width="1em" height="1em"' in html and 'fill="currentColor"' in html
+        assert '<use href="#bi-heart"></use>' in html and 'aria-label="Like"' in html
+
+    def test_sprite_url(self):
+        html = to_xml(Icon("heart", mode="sprite", sprite_url="/static/icons.svg"))
+        assert '<use href="/static/icons.svg#bi-heart"></use>' in html
+
+    def test_components_follow_global_mode(self):
+        with component_defaults(Icon={"mode": "sprite"}):
+            button = to_xml(Button("Save", icon="floppy"))
+            card = to_xml(StatCard("Users", "12", icon=Icon("people")))
+        assert '<svg class="bi bi-floppy me-2"' in button and "<i " not in button
+        assert '<use href="#bi-people"></use>' in card
+
+    def test_inline_sprite_scans_content(self):
+        with component_defaults(Icon={"mode": "sprite"}):
+            content = Div(Button("Save", icon="floppy"), [Icon("gear")], Icon("house"))
+        html = to_xml(IconSprite(content, "star"))
+        assert html.startswith('<svg style="display:none" aria-hidden="true">')
+        assert [n for n in ("floppy", "gear", "house", "star") if f'id="bi-{n}"' in html] == [
+            "floppy",
+            "gear",
+            "house",
+            "star",
+        ]
+        assert html.count("<symbol") == 4
+
+
+class TestSpriteAssets:
+    """Header and add_bootstrap wiring."""
+
+    def test_get_assets_drops_icon_font(self):
+        for use_cdn in (True, False):
+            html = "".join(to_xml(a) for a in get_assets(use_cdn=use_cdn, icon_mode="sprite"))
+            assert "bootstrap-icons" not in html
+            assert SPRITE_STYLE in html
+            assert "bootstrap.min.css" in html
+
+    def test_add_bootstrap_serves_sprite_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("faststrap.core.assets.get_static_path", lambda: tmp_path)
+        app = FastHTML()
+        add_bootstrap(app, icon_mode="sprite", sprite_icons=["house"], include_favicon=False)
+        html = to_xml(Icon("house"))
+        assert '<use href="/static/icons/bootstrap-icons.sprite-' in html
+        url = html.split('href="', 1)[1].split("#", 1)[0]
+        status, headers, body = fetch(app, url)
+        assert status == 200 and headers["content-type"].startswith("image/svg+xml")
+        assert b'<symbol id="bi-house"' in body
+        assert not any("bootstrap-icons" in to_xml(h) for h in app.hdrs)
+
+    def test_add_bootstrap_inline_sprite_on_cdn(self):
+        app = FastHTML()
+        add_bootstrap(app, use_cdn=True, icon_mode="sprite", sprite_icons=["house"])
+        assert '<use href="#bi-house"></use>' in to_xml(Icon("house"))
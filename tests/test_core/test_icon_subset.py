@@ -0,0 +1,90 @@
+"""Tests for icon usage recording and Bootstrap Icons subsetting."""
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import Button, EmptyState, Icon, StatCard, get_assets, purge
+from faststrap.core import icon_subset
+from faststrap.core.icon_subset import icon_names, icon_stylesheet
+
+ICONS_CSS = (
+    "/*! Bootstrap Icons */@font-face{font-display:block;font-family:bootstrap-icons;"
+    'src:url("fonts/bootstrap-icons.woff2?abc") format("woff2"),'
+    'url("fonts/bootstrap-icons.woff?abc") format("woff")}'
+    ".bi::before,[class^=bi-]::before{display:inline-block}"
+    '.bi-gear::before{content:"\\f3e5"}.bi-house::before{content:"\\f425"}'
+    '.bi-star::before{content:"\\f588"}'
+)
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "css" / "fonts").mkdir(parents=True)
+    (tmp_path / "css" / "bootstrap-icons.min.css").write_text(ICONS_CSS)
+    (tmp_path / "css" / "fonts" / "bootstrap-icons.woff2").write_bytes(b"full-font")
+    return tmp_path
+
+
+class TestIconUsage:
+    """Recording rendered icons."""
+
+    def test_components_record_icons(self):
+        with purge.collect() as usage:
+            to_xml(Button("Save", icon="floppy"))
+            to_xml(EmptyState(Icon("inbox"), title="Nothing here"))
+            to_xml(StatCard("Users", "1,204", icon=Icon("people")))
+        assert usage.icons == ["floppy", "inbox", "people"]
+        assert "bi-floppy" in usage
+
+    def test_icon_names(self):
+        assert icon_names(["bi-house", "house", "bi", "gear"]) == ["gear", "house"]
+
+
+class TestIconStylesheet:
+    """Subset stylesheet and font."""
+
+    def test_keeps_only_used_rules(self, static_dir, monkeypatch):
+        monkeypatch.setattr(icon_subset, "_subsetter", lambda: None)
+        relative = icon_stylesheet(["house", "bi-gear", "unknown"], static_dir)
+        assert relative.startswith("css/bootstrap-icons.subset-")
+        css = (static_dir / relative).read_text()
+        assert ".bi-house::before" in css and ".bi-gear::before" in css
+        assert "bi-star" not in css
+        assert "[class^=bi-]::before{display:inline-block}" in css
+        assert 'url("fonts/bootstrap-icons.woff2?abc")' in css
+
+    def test_subset_font_linked(self, static_dir, monkeypatch):
+        seen = {}
+
+        def fake_subset(source, codepoints):
+            seen["codepoints"] = set(codepoints)
+            return b"subset-font"
+
+        monkeypatch.setattr(icon_subset, "_subsetter", lambda: object())
+        monkeypatch.setattr(icon_subset, "subset_font", fake_subset)
+        css = (static_dir / icon_stylesheet(["star"], static_dir)).read_text()
+        assert seen["codepoints"] == {0xF588}
+        fonts = list((static_dir / "css" / "fonts").glob("bootstrap-icons.subset-*.woff2"))
+        assert len(fonts) == 1 and fonts[0].read_bytes() == b"subset-font"
+        assert f'src:url("fonts/{fonts[0].name}") format("woff2")}}' in css
+        assert "woff?abc" not in css
+
+    def test_font_subsetting_with_fonttools(self, tmp_path):
+        pytest.importorskip("fontTools.subset")
+        if icon_subset._subsetter() is None:
+            pytest.skip("brotli is required to write WOFF2")
+        from faststrap.utils.static_management import get_static_path
+
+        source = get_static_path() / "css" / "fonts" / "bootstrap-icons.woff2"
+        font = icon_subset.subset_font(source, [0xF425])
+        assert font[:4] == b"wOF2" and len(font) < source.stat().st_size / 10
+
+    def test_get_assets_links_subset(self, static_dir, monkeypatch):
+        monkeypatch.setattr(icon_subset, "_subsetter", lambda: None)
+        monkeypatch.setattr("faststrap.core.assets.get_static_path", lambda: static_dir)
+        (static_dir / "classes.txt").write_text("bi\nbi-house\nbtn\n")
+        assets = get_assets(use_cdn=False, subset_icons=static_dir / "classes.txt")
+        html = "".join(to_xml(a) for a in assets)
+        assert "/static/css/bootstrap-icons.subset-" in html
+        assert "/static/css/bootstrap-icons.min.css" not in html
+        assert "/static/css/bootstrap.min.css" in html
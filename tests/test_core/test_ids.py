@@ -0,0 +1,146 @@
+"""Tests for deterministic ID generation."""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+from fasthtml.common import to_xml
+
+from faststrap import (
+    Accordion,
+    AccordionItem,
+    Drawer,
+    Modal,
+    Navbar,
+    id_scope,
+    set_id_provider,
+    unique_id,
+)
+from faststrap.core.ids import _current_scope, counter_id
+
+
+@pytest.fixture(autouse=True)
+def restore_provider():
+    yield
+    set_id_provider(counter_id)
+
+
+def _page():
+    return (
+        Modal("Body", title="Hello"),
+        Drawer("Menu", title="Nav"),
+        Accordion(AccordionItem("One", title="First")),
+        Navbar("Links", brand="Brand"),
+    )
+
+
+def test_identical_inputs_render_identical_html():
+    """Components without explicit IDs render deterministically per scope."""
+    with id_scope():
+        first = to_xml(_page())
+    with id_scope():
+        second = to_xml(_page())
+
+    assert first == second
+    assert 'id="modal-1"' in first
+    assert 'id="drawer-1"' in first
+    assert 'id="accordion-1"' in first
+    assert 'data-bs-target="#navbar-1"' in first
+
+
+def test_counter_ids_are_unique_within_scope():
+    """Repeated components get distinct IDs."""
+    with id_scope():
+        html = to_xml((Modal("A"), Modal("B"), Modal("C")))
+
+    for i in (1, 2, 3):
+        assert f'id="modal-{i}"' in html
+
+
+def test_explicit_ids_are_respected():
+    """Caller-supplied IDs bypass the provider."""
+    with id_scope():
+        html = to_xml(Modal("Body", modal_id="confirm"))
+        assert unique_id("modal") == "modal-1"
+
+    assert 'id="confirm"' in html
+
+
+def test_hash_strategy_is_order_independent():
+    """Content-hashed IDs do not depend on render order."""
+    with id_scope("hash"):
+        a_first = unique_id("modal", "A")
+        unique_id("modal", "B")
+    with id_scope("hash"):
+        unique_id("modal", "B")
+        a_second = unique_id("modal", "A")
+
+    assert a_first == a_second
+    assert a_first.startswith("modal-")
+
+
+def test_hash_strategy_deduplicates_identical_content():
+    """Identical content within a scope still yields unique IDs."""
+    with id_scope("hash"):
+        first = unique_id("drawer", "Menu")
+        second = unique_id("drawer", "Menu")
+
+    assert second == f"{first}-2"
+
+
+def test_custom_provider():
+    """Any callable can be plugged in globally."""
+    set_id_provider(lambda scope, prefix, content: f"{prefix}-custom-{scope.next(prefix)}")
+
+    with id_scope():
+        assert unique_id("modal") == "modal-custom-1"
+
+
+def test_unknown_strategy():
+    """Unknown strategy names raise ValueError."""
+    with pytest.raises(ValueError):
+        set_id_provider("random")
+
+
+def test_each_async_task_gets_its_own_scope():
+    """Concurrent requests (tasks) count independently."""
+
+    async def render():
+        return unique_id("modal")
+
+    async def main():
+        return await asyncio.gather(render(), render())
+
+    first, second = asyncio.run(main())
+    assert first == second
+
+
+def test_implicit_scope_counts_in_place():
+    """Outside id_scope the implicit scope is created once and then mutated."""
+
+    def render():
+        unique_id("modal")
+        scope = _current_scope.get()
+        unique_id("modal")
+        return scope, _current_scope.get()
+
+    before, after = contextvars.copy_context().run(render)
+    assert before is after
+    assert after.counters["modal"] == 2
+
+
+def test_implicit_scope_is_copied_per_thread():
+    """A thread inheriting the implicit scope does not mutate the parent's counters."""
+
+    def render():
+        first = unique_id("drawer")
+        context = contextvars.copy_context()
+        results = []
+        worker = threading.Thread(target=lambda: results.append(context.run(unique_id, "drawer")))
+        worker.start()
+        worker.join()
+        return first, results[0], unique_id("drawer")
+
+    first, in_thread, second = contextvars.copy_context().run(render)
+    assert (first, in_thread, second) == ("drawer-1", "drawer-2", "drawer-2")
@@ -0,0 +1,53 @@
+"""Tests for lazy top-level imports (PEP 562)."""
+
+import subprocess
+import sys
+
+import pytest
+
+import faststrap
+
+
+def _modules_after(code: str) -> set[str]:
+    script = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(out.stdout.split())
+
+
+def test_import_faststrap_is_lightweight():
+    """Import-time regression guard: nothing heavy is imported up front."""
+    modules = _modules_after("import faststrap")
+    heavy = {
+        "fasthtml.common",
+        "starlette.staticfiles",
+        "faststrap.core.assets",
+        "faststrap.core.registry",
+        "pkgutil",
+    }
+    assert not heavy & modules
+    assert not any(m.startswith("faststrap.components.") for m in modules)
+
+
+def test_component_access_imports_only_its_category():
+    modules = _modules_after("from faststrap import Button")
+    assert "faststrap.components.forms.button" in modules
+    assert "faststrap.components.navigation" not in modules
+    assert "faststrap.core.assets" not in modules
+
+
+@pytest.mark.parametrize("name", [n for n in faststrap.__all__ if not n.startswith("__")])
+def test_all_public_names_resolve(name):
+    assert getattr(faststrap, name) is not None
+    assert name in dir(faststrap)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no_such_component"):
+        faststrap.no_such_component  # noqa: B018
+
+
+def test_star_import():
+    namespace: dict = {}
+    exec("from faststrap import *", namespace)
+    assert namespace["Button"] is faststrap.Button
+    assert namespace["cache"].fragment is faststrap.cache.fragment
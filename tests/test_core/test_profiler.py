@@ -0,0 +1,165 @@
+"""Tests for the per-component render profiler."""
+
+import asyncio
+import json
+
+import pytest
+from fasthtml.common import FastHTML, to_xml
+
+import faststrap
+from faststrap.components.forms import button as button_module
+from faststrap.core.profiler import (
+    ProfilerMiddleware,
+    instrument,
+    is_instrumented,
+    profile,
+    uninstrument,
+)
+
+
+@pytest.fixture(autouse=True)
+def _uninstrument():
+    uninstrument()
+    yield
+    uninstrument()
+
+
+def test_components_untouched_until_instrumented():
+    """Disabled profiling leaves the plain component functions in place."""
+    assert not is_instrumented()
+    assert not hasattr(faststrap.Button, "__faststrap_profiled__")
+
+
+def test_instrument_and_uninstrument_round_trip():
+    original = faststrap.Button
+    instrument()
+    assert faststrap.Button.__faststrap_profiled__ is True
+    assert button_module.Button.__faststrap_profiled__ is True
+    assert faststrap.Button.__wrapped__ is original
+
+    uninstrument()
+    assert faststrap.Button is original
+    assert button_module.Button is original
+
+
+def test_profile_records_calls_and_output():
+    with profile("page") as prof:
+        faststrap.Card(faststrap.Button("A"), faststrap.Button("B"), title="T")
+
+    button = prof.components["Button"]
+    card = prof.components["Card"]
+    assert button.calls == 2
+    assert card.calls == 1
+    assert button.bytes > 0 and button.nodes == 2
+    assert card.bytes > prof.components["Button"].bytes
+    assert card.cumulative >= card.self_time >= 0
+    assert prof.duration > 0
+
+
+def test_profile_removes_wrappers_after_last_block():
+    """profile() instruments only for its duration unless instrument() was called."""
+    original = faststrap.Button
+    with profile():
+        with profile():
+            assert is_instrumented()
+        assert is_instrumented()
+    assert not is_instrumented()
+    assert faststrap.Button is original
+
+    instrument()
+    with profile():
+        pass
+    assert is_instrumented()
+
+
+def test_profile_leaves_lazy_rows_unconsumed():
+    """Measuring output must not drain a generator row source before the real render."""
+    with profile() as prof:
+        body = faststrap.TBody(rows=([n, n * 2] for n in range(3)))
+
+    html = to_xml(faststrap.Table(body))
+    assert html.count("<tr>") == 3
+    assert prof.components["TBody"].calls == 1
+    assert prof.components["TBody"].bytes == 0
+
+
+def test_profile_accepts_async_row_sources():
+    async def records():
+        yield [1, 2]
+
+    with profile() as prof:
+        faststrap.TBody(rows=records())
+
+    assert prof.components["TBody"].calls == 1
+
+
+def test_profile_self_time_excludes_nested_components():
+    """Modal builds a CloseButton internally; it is a child, not self time."""
+    with profile() as prof:
+        faststrap.Modal("Body", title="Title", modal_id="m")
+
+    modal = prof.components["Modal"]
+    assert prof.components["CloseButton"].calls == 1
+    assert modal.self_time <= modal.cumulative
+
+
+def test_calls_outside_profile_are_not_recorded():
+    with profile() as prof:
+        pass
+    faststrap.Badge("x")
+    assert prof.components == {}
+
+
+def test_report_and_json():
+    with profile("home") as prof:
+        faststrap.Badge("New")
+
+    text = prof.report()
+    assert text.startswith("home:")
+    assert "Badge" in text
+
+    data = json.loads(prof.to_json())
+    assert data["label"] == "home"
+    assert data["components"]["Badge"]["calls"] == 1
+
+
+def test_callback_receives_profile():
+    received = []
+    with profile(callback=received.append) as prof:
+        faststrap.Badge("x")
+    assert received == [prof]
+
+
+def test_profiles_are_isolated_between_tasks():
+    async def render(count):
+        with profile() as prof:
+            for _ in range(count):
+                faststrap.Badge("x")
+                await asyncio.sleep(0)
+        return prof.components["Badge"].calls
+
+    async def main():
+        return await asyncio.gather(render(1), render(3))
+
+    assert asyncio.run(main()) == [1, 3]
+
+
+def test_middleware_profiles_each_request():
+    from benchmarks.asgi import AsgiClient
+
+    app = FastHTML()
+
+    @app.get("/")
+    def home():
+        return faststrap.Card(faststrap.Button("Go"), title="Home")
+
+    received = []
+    client = AsgiClient(ProfilerMiddleware(app, callback=received.append))
+    try:
+        status, _ = client.get("/")
+    finally:
+        client.close()
+
+    assert status == 200
+    assert received[0].label == "GET /"
+    assert received[0].components["Card"].calls == 1
@@ -0,0 +1,170 @@
+"""Tests for class-usage collection and stylesheet purging."""
+
+import warnings
+
+import pytest
+from fasthtml.common import FastHTML, to_xml
+
+from faststrap import (
+    Accordion,
+    AccordionItem,
+    Button,
+    Card,
+    Navbar,
+    Toast,
+    cache,
+    compile,
+    get_assets,
+    purge,
+)
+from faststrap.core.cache import FragmentCache
+from faststrap.core.purge import ClassUsage, purge_css, purged_stylesheet
+from faststrap.core.render import render_html
+
+CSS = """@charset "UTF-8";/*! License */
+:root{--bs-blue:#0d6efd}
+body { margin : 0 ; font-family : "Segoe UI" , sans-serif }
+.btn{display:inline-block}
+.btn-primary,.btn-danger{color:#fff}
+.card > .card-body{padding:1rem}
+.modal.fade .modal-dialog{transition:transform .3s}
+.form-control:not(.is-foo):focus{outline:0}
+a[href$=".pdf"]{color:red}
+@media (min-width:768px){.col-md-4{width:33%}.alert{padding:0}}
+@media print{.alert{display:none}}
+@keyframes spin{from{transform:rotate(0)}to{transform:rotate(360deg)}}
+.content::after{content:"a , b { }"}
+"""
+
+
+class TestClassUsage:
+    """Recording classes."""
+
+    def test_add_and_html(self):
+        usage = ClassUsage()
+        usage.add("btn  btn-primary", None, "")
+        usage.add_html("<div class=\"card shadow-sm\"><p class='lead'><i class=bi></i>")
+        assert list(usage) == ["bi", "btn", "btn-primary", "card", "lead", "shadow-sm"]
+        assert "card" in usage and len(usage) == 6
+
+    def test_save_load(self, tmp_path):
+        ClassUsage(["b", "a"]).save(tmp_path / "classes.txt")
+        assert list(ClassUsage.load(tmp_path / "classes.txt")) == ["a", "b"]
+
+    def test_collect_records_components(self):
+        with purge.collect() as usage:
+            to_xml(Button("Save", variant="success"))
+        assert "btn-success" in usage
+        to_xml(Card("Body"))
+        assert "card" not in usage
+
+    def test_collect_records_literal_classes(self):
+        """Classes written as literal ``cls=`` values inside components are kept."""
+        with purge.collect() as usage:
+            to_xml(Navbar(brand="Shop"))
+            render_html(Toast("Saved"))
+            to_xml(Accordion(AccordionItem("Body", title="One")))
+        assert {"navbar-toggler", "navbar-toggler-icon", "navbar-collapse", "navbar-brand"} <= set(
+            usage
+        )
+        assert {"toast-body", "accordion-collapse", "container"} <= set(usage)
+        css = ".navbar{display:flex}.navbar-toggler{padding:0}.toast-body{padding:1rem}.unused{}"
+        purged = purge_css(css, usage, safelist=())
+        assert ".navbar-toggler{" in purged and ".toast-body{" in purged
+        assert ".unused" not in purged
+
+    def test_collect_records_cached_and_compiled_output(self):
+        """Fragment-cache and compiled-template hits skip merge_classes but are recorded."""
+        store = FragmentCache()
+
+        @cache.fragment(cache=store)
+        def Nav():
+            return Navbar(brand="Shop")
+
+        save = compile(Button, variant="success")
+        Nav()
+        save("Warm up")
+        with purge.collect() as usage:
+            Nav()
+            save("Save")
+        assert store.hits == 1
+        assert {"navbar-toggler", "btn", "btn-success"} <= set(usage)
+
+    def test_crawl(self):
+        app = FastHTML()
+
+        @app.get("/")
+        def home():
+            return Card("Hi", cls="my-card")
+
+        usage = purge.crawl(app, ["/"])
+        assert {"card", "card-body", "my-card"} <= set(usage)
+
+
+class TestPurgeCss:
+    """Rule selection and minification."""
+
+    def test_keeps_used_rules_only(self):
+        out = purge_css(CSS, ["btn", "btn-danger", "card", "card-body", "content"], safelist=())
+        assert out.startswith('@charset "UTF-8";/*! License */')
+        assert ":root{--bs-blue:#0d6efd}" in out
+        assert 'body{margin:0;font-family:"Segoe UI",sans-serif}' in out
+        assert ".btn-danger{color:#fff}" in out and "btn-primary" not in out
+        assert ".card > .card-body{padding:1rem}" in out
+        assert "modal" not in out and "col-md-4" not in out
+        assert 'a[href$=".pdf"]{color:red}' in out
+        assert "@media" not in out
+        assert "@keyframes spin{from{transform:rotate(0)}to{transform:rotate(360deg)}}" in out
+        assert '.content::after{content:"a , b { }"}' in out
+
+    def test_media_blocks_purged_recursively(self):
+        out = purge_css(CSS, ["col-md-4"], safelist=())
+        assert "@media (min-width:768px){.col-md-4{width:33%}}" in out
+        assert "@media print" not in out
+
+    def test_negated_classes_not_required(self):
+        assert ".form-control:not(.is-foo):focus" in purge_css(CSS, ["form-control"], ())
+
+    def test_safelist_patterns(self):
+        out = purge_css(CSS, ["modal-dialog"], safelist=("modal", "f*"))
+        assert ".modal.fade .modal-dialog" in out
+        assert ".modal.fade .modal-dialog" not in purge_css(CSS, ["modal-dialog"], safelist=())
+
+    def test_default_safelist_keeps_javascript_classes(self):
+        assert ".modal.fade .modal-dialog" in purge_css(CSS, ["modal", "modal-dialog"])
+
+
+class TestPurgedStylesheet:
+    """Generated files and asset wiring."""
+
+    def test_file_named_by_class_set(self, tmp_path):
+        (tmp_path / "css").mkdir()
+        (tmp_path / "css" / "bootstrap.min.css").write_text(CSS)
+        first = purged_stylesheet(["btn"], tmp_path)
+        assert first.startswith("css/bootstrap.purged-") and first.endswith(".min.css")
+        assert ".btn{" in (tmp_path / first).read_text()
+        assert purged_stylesheet(["btn"], tmp_path) == first
+        assert purged_stylesheet(["btn", "card"], tmp_path) != first
+
+    def test_get_assets_links_purged_file(self, tmp_path, monkeypatch):
+        (tmp_path / "css").mkdir()
+        (tmp_path / "css" / "bootstrap.min.css").write_text(CSS)
+        monkeypatch.setattr("faststrap.core.assets.get_static_path", lambda: tmp_path)
+        (tmp_path / "classes.txt").write_text("btn\n")
+        html = "".join(
+            to_xml(a) for a in get_assets(use_cdn=False, purge_css=tmp_path / "classes.txt")
+        )
+        assert "/static/css/bootstrap.purged-" in html
+        assert "/static/css/bootstrap.min.css" not in html
+
+    def test_falls_back_to_full_stylesheet(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("faststrap.core.assets.get_static_path", lambda: tmp_path / "missing")
+        with pytest.warns(RuntimeWarning, match="purged stylesheet"):
+            assets = get_assets(use_cdn=False, purge_css=["btn"])
+        assert "/static/css/bootstrap.min.css" in "".join(to_xml(a) for a in assets)
+
+    def test_cdn_mode_ignores_purge(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            html = "".join(to_xml(a) for a in get_assets(use_cdn=True, purge_css=["btn"]))
+        assert "cdn.jsdelivr.net" in html
@@ -0,0 +1,64 @@
+"""Tests for the component registry and its static manifest."""
+
+import importlib
+import pkgutil
+import subprocess
+import sys
+
+import faststrap.components
+from faststrap.core.registry import (
+    COMPONENT_MANIFEST,
+    get_component,
+    get_registry,
+    list_components,
+)
+
+
+def _registered_in_package():
+    """Walk the components package (what autodiscover used to do at import)."""
+    found = {}
+    for info in pkgutil.walk_packages(
+        faststrap.components.__path__, prefix="faststrap.components."
+    ):
+        module = importlib.import_module(info.name)
+        for value in vars(module).values():
+            meta = getattr(value, "__faststrap_metadata__", None)
+            if meta is not None and value.__module__ == info.name:
+                found[value.__name__] = (info.name, meta["category"])
+    return found
+
+
+def test_manifest_matches_registered_components():
+    """The static manifest lists exactly the @register-decorated components."""
+    assert COMPONENT_MANIFEST == _registered_in_package()
+
+
+def test_get_component_imports_on_demand():
+    from faststrap import Modal
+
+    assert get_component("Modal") is Modal
+    assert get_component("DoesNotExist") is None
+
+
+def test_list_components_by_category():
+    assert set(list_components()) >= {"Button", "Card", "Modal", "Table"}
+    assert "Modal" in list_components(category="feedback")
+    assert "Button" not in list_components(category="feedback")
+    assert set(list_components(category="layout")) == {"Container", "Row", "Col", "Hero"}
+
+
+def test_get_registry_contains_metadata():
+    registry = get_registry()
+    assert registry["Drawer"]["requires_js"] is True
+    assert registry["Dropdown"]["category"] == "navigation"
+    assert registry["Badge"]["requires_js"] is False
+
+
+def test_registry_import_does_not_import_components():
+    code = (
+        "import sys, faststrap.core.registry as r; "
+        "r.list_components(); "
+        "print(any(m.startswith('faststrap.components.') for m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,157 @@
+"""Conformance tests for the direct-to-string renderer."""
+
+import pytest
+from fasthtml.common import Div, P, Pre, Safe, Script, to_xml
+
+from faststrap import (
+    Accordion,
+    AccordionItem,
+    Alert,
+    Badge,
+    Breadcrumb,
+    Button,
+    ButtonGroup,
+    ButtonToolbar,
+    Card,
+    Checkbox,
+    CloseButton,
+    Col,
+    Collapse,
+    ConfirmDialog,
+    Container,
+    Drawer,
+    Dropdown,
+    DropdownDivider,
+    DropdownItem,
+    EmptyState,
+    Figure,
+    FileInput,
+    FloatingLabel,
+    Hero,
+    Icon,
+    Input,
+    InputGroup,
+    InputGroupText,
+    ListGroup,
+    ListGroupItem,
+    Modal,
+    Navbar,
+    Pagination,
+    Popover,
+    Progress,
+    ProgressBar,
+    Radio,
+    Range,
+    Row,
+    Select,
+    SimpleToast,
+    Spinner,
+    StatCard,
+    Switch,
+    Table,
+    TabPane,
+    Tabs,
+    TBody,
+    TCell,
+    THead,
+    Toast,
+    ToastContainer,
+    Tooltip,
+    TRow,
+    compile,
+    render_html,
+    write_html,
+)
+
+COMPONENTS = {
+    "Accordion": lambda: Accordion(
+        AccordionItem("One", title="First", expanded=True),
+        AccordionItem("Two", title="Second"),
+    ),
+    "Alert": lambda: Alert("Heads up <b>", variant="warning", dismissible=True),
+    "Badge": lambda: Badge("New", variant="info", pill=True),
+    "Breadcrumb": lambda: Breadcrumb(("Home", "/"), ("Library", None, True)),
+    "Button": lambda: Button("Save", icon="check", hx_post="/save", data={"x": 1}),
+    "ButtonGroup": lambda: ButtonGroup(Button("A"), Button("B"), size="sm"),
+    "ButtonToolbar": lambda: ButtonToolbar(ButtonGroup(Button("A")), ButtonGroup(Button("B"))),
+    "Card": lambda: Card("Body", title="Title", header="Header", footer="Footer"),
+    "Checkbox": lambda: Checkbox("agree", label="I agree", checked=True),
+    "CloseButton": lambda: CloseButton(white=True),
+    "Collapse": lambda: Collapse(P("Hidden"), collapse_id="more"),
+    "ConfirmDialog": lambda: ConfirmDialog("Delete?", dialog_id="confirm"),
+    "Container": lambda: Container(Row(Col("A", md=6), Col("B", md=6)), fluid=True),
+    "Drawer": lambda: Drawer("Menu", title="Nav", drawer_id="drawer"),
+    "Dropdown": lambda: Dropdown(
+        DropdownItem("One", href="/1"), DropdownDivider(), "Two", label="More"
+    ),
+    "EmptyState": lambda: EmptyState(icon="inbox", title="Nothing", description="Empty"),
+    "Figure": lambda: Figure("/img.png", caption="Caption", alt="Alt"),
+    "FileInput": lambda: FileInput("upload", label="File", multiple=True),
+    "FloatingLabel": lambda: FloatingLabel("email", label="Email", input_type="email"),
+    "Hero": lambda: Hero("Welcome", subtitle="Sub", cta=Button("Go")),
+    "Icon": lambda: Icon("heart-fill", cls="text-danger"),
+    "Input": lambda: Input("name", label="Name", placeholder="Jane", required=True),
+    "InputGroup": lambda: InputGroup(InputGroupText("@"), Input("user")),
+    "ListGroup": lambda: ListGroup(ListGroupItem("A", active=True), ListGroupItem("B")),
+    "Modal": lambda: Modal("Body", title="Title", modal_id="modal", footer=Button("OK")),
+    "Navbar": lambda: Navbar(Div("Links"), brand="Brand", id="nav"),
+    "Pagination": lambda: Pagination(3, 10, base_url="/items", show_first_last=True),
+    "Popover": lambda: Popover("Title", "Content", Button("Pop")),
+    "Progress": lambda: Progress(40, variant="success", label="40%"),
+    "ProgressBar": lambda: ProgressBar(25, striped=True),
+    "Radio": lambda: Radio("choice", label="One", value="1"),
+    "Range": lambda: Range("volume", label="Volume", min_val=0, max_val=10),
+    "Select": lambda: Select("pick", ("a", "A"), ("b", "B", True), label="Pick"),
+    "SimpleToast": lambda: SimpleToast("Saved", title="Done"),
+    "Spinner": lambda: Spinner(variant="danger", size="sm"),
+    "StatCard": lambda: StatCard("Users", 1200, icon="people", trend="+5%"),
+    "Switch": lambda: Switch("on", label="Enabled"),
+    "Table": lambda: Table(
+        THead(TRow(TCell("Name", header=True, scope="col"))),
+        TBody(TRow(TCell("Alice & Bob")), TRow(TCell("Carol", colspan=2)), divider=True),
+        striped=True,
+        responsive=True,
+    ),
+    "Tabs": lambda: Tabs(("home", "Home", True), ("profile", "Profile")),
+    "TabPane": lambda: TabPane("Content", tab_id="home", active=True),
+    "Toast": lambda: Toast("Hello", title="Note"),
+    "ToastContainer": lambda: ToastContainer(Toast("One"), position="top-end"),
+    "Tooltip": lambda: Tooltip("Tip", Button("Hover")),
+}
+
+
+@pytest.mark.parametrize("name", sorted(COMPONENTS))
+def test_render_html_matches_to_xml(name):
+    """render_html is byte-identical to to_xml for every component."""
+    tree = COMPONENTS[name]()
+
+    assert render_html(tree) == to_xml(tree)
+    assert render_html(tree, indent=False) == to_xml(tree, indent=False)
+
+
+def test_render_html_edge_cases():
+    """Whitespace-significant tags, quoting and raw values match to_xml."""
+    tree = Div(
+        Pre("  keep\n  spacing  "),
+        Script("if (a < b) {}"),
+        Div('it\'s "quoted"', title='it\'s "quoted"'),
+        Div(Safe("<b>raw</b>"), None, ("a", "b"), 5),
+        contenteditable="true",
+    )
+
+    assert render_html(tree) == to_xml(tree)
+    assert render_html("plain", tree) == to_xml("plain", tree)
+    assert render_html(tree, do_escape=False) == to_xml(tree, do_escape=False)
+
+
+def test_write_html_shared_buffer():
+    """Multiple fragments can be appended to one buffer."""
+    rows = [TRow(TCell(str(i))) for i in range(3)]
+    cell = compile(TCell)
+    buf: list[str] = []
+
+    for row in rows:
+        write_html(buf, row)
+    cell.write(buf, "extra")
+
+    assert "".join(buf) == "".join(to_xml(r) for r in rows) + to_xml(TCell("extra"))
@@ -0,0 +1,204 @@
+"""Tests for precompressed static files."""
+
+import asyncio
+import gzip
+import json
+import os
+import re
+
+import pytest
+
+from faststrap import CompressedStaticFiles, get_assets, precompress
+from faststrap.core import static
+from faststrap.core.static import (
+    IMMUTABLE,
+    MANIFEST_NAME,
+    accepted_encodings,
+    asset_hashes,
+    hashed_name,
+    hashed_url,
+)
+
+CSS = b".btn{color:red}\n" * 400
+
+
+def fetch(app, path, headers=None):
+    """Issue a GET request to an ASGI app; return (status, headers, body)."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}, body
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_bytes(CSS)
+    (tmp_path / "tiny.js").write_bytes(b"let a=1;")
+    (tmp_path / "font.woff2").write_bytes(b"\x00" * 4096)
+    return tmp_path
+
+
+class TestPrecompress:
+    """Writing compressed siblings."""
+
+    def test_writes_gzip_sibling(self, static_dir):
+        written = precompress(static_dir)
+        target = static_dir / "css" / "site.css.gz"
+        assert target in written
+        assert gzip.decompress(target.read_bytes()) == CSS
+        assert target.stat().st_mtime == (static_dir / "css" / "site.css").stat().st_mtime
+
+    def test_skips_small_and_binary_files(self, static_dir):
+        precompress(static_dir)
+        assert not (static_dir / "tiny.js.gz").exists()
+        assert not (static_dir / "font.woff2.gz").exists()
+
+    def test_up_to_date_variants_kept(self, static_dir):
+        precompress(static_dir)
+        assert precompress(static_dir) == []
+        source = static_dir / "css" / "site.css"
+        source.write_bytes(CSS + b"a{}")
+        os.utime(source, (source.stat().st_mtime + 10,) * 2)
+        assert static_dir / "css" / "site.css.gz" in precompress(static_dir)
+
+
+class TestAcceptEncoding:
+    """Header parsing."""
+
+    def test_parse(self):
+        assert accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+        assert accepted_encodings("br;q=0, gzip;q=0.5") == {"gzip"}
+        assert accepted_encodings("*, br;q=0") == {"gzip"}
+        assert accepted_encodings("") == set()
+
+
+class TestCompressedStaticFiles:
+    """Negotiated responses."""
+
+    def test_serves_gzip_variant(self, static_dir):
+        app = CompressedStaticFiles(directory=static_dir)
+        status, headers, body = fetch(app, "/css/site.css", {"Accept-Encoding": "gzip, br"})
+        assert status == 200
+        assert headers["content-encoding"] == "gzip"
+        assert headers["vary"] == "Accept-Encoding"
+        assert headers["content-type"].startswith("text/css")
+        assert int(headers["content-length"]) == len(body) < len(CSS)
+        assert gzip.decompress(body) == CSS
+
+    def test_prefers_brotli_when_present(self, static_dir):
+        (static_dir / "css" / "site.css.br").write_bytes(b"brotli-bytes")
+        app = CompressedStaticFiles(directory=static_dir)
+        _, headers, body = fetch(app, "/css/site.css", {"Accept-Encoding": "gzip, br"})
+        assert headers["content-encoding"] == "br"
+        assert body == b"brotli-bytes"
+
+    def test_identity_for_other_clients(self, static_dir):
+        app = CompressedStaticFiles(directory=static_dir)
+        _, headers, body = fetch(app, "/css/site.css")
+        assert "content-encoding" not in headers
+        assert headers["vary"] == "Accept-Encoding"
+        assert body == CSS
+
+    def test_stale_variant_ignored(self, static_dir):
+        app = CompressedStaticFiles(directory=static_dir, compress=False)
+        (static_dir / "css" / "site.css.gz").write_bytes(gzip.compress(b"old"))
+        source = static_dir / "css" / "site.css"
+        os.utime(static_dir / "css" / "site.css.gz", (source.stat().st_mtime - 10,) * 2)
+        _, headers, body = fetch(app, "/css/site.css", {"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in headers and body == CSS
+
+    def test_not_modified_keeps_vary(self, static_dir):
+        app = CompressedStaticFiles(directory=static_dir)
+        _, headers, _ = fetch(app, "/css/site.css", {"Accept-Encoding": "gzip"})
+        status, headers, _ = fetch(
+            app, "/css/site.css", {"Accept-Encoding": "gzip", "If-None-Match": headers["etag"]}
+        )
+        assert status == 304
+        assert headers["vary"] == "Accept-Encoding"
+
+    def test_binary_files_untouched(self, static_dir):
+        app = CompressedStaticFiles(directory=static_dir)
+        _, headers, _ = fetch(app, "/font.woff2", {"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in headers
+        assert "vary" not in headers
+
+
+class TestHashedAssets:
+    """Content-hashed URLs with immutable caching."""
+
+    def test_hashed_name(self):
+        assert (
+            hashed_name("css/bootstrap.min.css", "abc1234567") == "css/bootstrap.min.abc1234567.css"
+        )
+        assert hashed_name("LICENSE", "abc1234567") == "LICENSE.abc1234567"
+        assert (
+            hashed_url("/static/", "app.js", {"app.js": "0123456789"})
+            == "/static/app.0123456789.js"
+        )
+        assert hashed_url("/static", "app.js", None) == "/static/app.js"
+
+    def test_hashes_follow_content(self, static_dir):
+        before = asset_hashes(static_dir)
+        assert set(before) == {"css/site.css", "tiny.js", "font.woff2"}
+        assert len(before["css/site.css"]) == 10
+        source = static_dir / "css" / "site.css"
+        source.write_bytes(CSS + b"a{}")
+        os.utime(source, (source.stat().st_mtime + 10,) * 2)
+        after = asset_hashes(static_dir)
+        assert after["css/site.css"] != before["css/site.css"]
+        assert after["tiny.js"] == before["tiny.js"]
+
+    def test_manifest_shared_between_processes(self, static_dir):
+        hashes = asset_hashes(static_dir)
+        stored = json.loads((static_dir / MANIFEST_NAME).read_text())
+        assert stored["tiny.js"][2] == hashes["tiny.js"]
+        # A valid manifest entry is trusted without re-reading the file
+        stored["tiny.js"][2] = "feedc0ffee"
+        (static_dir / MANIFEST_NAME).write_text(json.dumps(stored))
+        static._HASHES.clear()
+        assert asset_hashes(static_dir)["tiny.js"] == "feedc0ffee"
+
+    def test_hashed_request_is_immutable(self, static_dir):
+        app = CompressedStaticFiles(directory=static_dir)
+        url = hashed_url("", "css/site.css", asset_hashes(static_dir))
+        status, headers, body = fetch(app, url, {"Accept-Encoding": "gzip"})
+        assert status == 200
+        assert headers["cache-control"] == IMMUTABLE
+        assert headers["content-encoding"] == "gzip"
+        assert gzip.decompress(body) == CSS
+
+    def test_outdated_hash_served_without_immutable(self, static_dir):
+        app = CompressedStaticFiles(directory=static_dir)
+        status, headers, body = fetch(app, "/tiny.0123456789.js")
+        assert status == 200 and body == b"let a=1;"
+        assert "cache-control" not in headers
+
+    def test_plain_request_still_works(self, static_dir):
+        app = CompressedStaticFiles(directory=static_dir)
+        status, headers, _ = fetch(app, "/tiny.js")
+        assert status == 200 and "cache-control" not in headers
+
+    def test_get_assets_hashed_urls(self):
+        html = "".join(str(a) for a in get_assets(use_cdn=False, hash_assets=True))
+        assert re.search(r"/static/css/bootstrap\.min\.[0-9a-f]{10}\.css", html)
+        assert re.search(r"/static/js/bootstrap\.bundle\.min\.[0-9a-f]{10}\.js", html)
+        plain = "".join(str(a) for a in get_assets(use_cdn=False))
+        assert "/static/css/bootstrap.min.css" in plain
@@ -0,0 +1,88 @@
+"""Tests for the streaming HTML renderer."""
+
+import asyncio
+
+from fasthtml.common import FastHTML, to_xml
+from starlette.testclient import TestClient
+
+from faststrap import (
+    Card,
+    Container,
+    Table,
+    TBody,
+    TCell,
+    TRow,
+    add_bootstrap,
+    aiter_html,
+    iter_html,
+    stream_page,
+)
+
+
+def _big_table(rows=500):
+    return Container(
+        Table(TBody(*[TRow(TCell(f"r{i}"), TCell(str(i)), TCell("x & y")) for i in range(rows)]))
+    )
+
+
+def test_iter_html_matches_to_xml():
+    """Joined chunks are byte-identical to to_xml."""
+    tree = _big_table()
+    chunks = list(iter_html(tree, chunk_size=1024))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == to_xml(tree)
+    assert all(chunks)
+
+
+def test_iter_html_chunk_size_is_respected():
+    """Chunks are flushed once they reach the configured size."""
+    chunks = list(iter_html(_big_table(), chunk_size=2048))
+
+    # Each chunk overshoots by at most one row
+    assert all(len(c) < 2048 + 200 for c in chunks)
+
+
+def test_aiter_html_matches_to_xml():
+    """The async generator yields the same HTML."""
+    tree = _big_table(50)
+
+    async def collect():
+        return [chunk async for chunk in aiter_html(tree, chunk_size=512)]
+
+    assert "".join(asyncio.run(collect())) == to_xml(tree)
+
+
+def test_stream_page_flushes_head_first():
+    """stream_page includes add_bootstrap headers and flushes <head> on its own."""
+    app = FastHTML()
+    add_bootstrap(app, use_cdn=True)
+
+    response = stream_page(Card("Hello"), app=app, title="Report")
+
+    async def first_chunk():
+        return await response.body_iterator.__anext__()
+
+    head = asyncio.run(first_chunk())
+    assert head.startswith("<!doctype html>")
+    assert head.rstrip().endswith("</head>")
+    assert "bootstrap.min.css" in head
+    assert "<title>Report</title>" in head
+
+
+def test_stream_page_response():
+    """stream_page works as a route response."""
+    app = FastHTML()
+    add_bootstrap(app, use_cdn=True)
+
+    @app.get("/")
+    def home():
+        return stream_page(_big_table(100), app=app)
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert 'data-bs-theme="light"' in response.text
+    assert "<td>r99</td>" in response.text
+    assert response.text.rstrip().endswith("</html>")
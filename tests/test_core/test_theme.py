@@ -1,10 +1,14 @@
+import asyncio
+
 import pytest
 from fasthtml.common import FastHTML
 
 from faststrap.core.assets import add_bootstrap
 from faststrap.core.theme import (
     Theme,
+    component_defaults,
     get_builtin_theme,
+    get_component_defaults,
     reset_component_defaults,
     resolve_defaults,
     set_component_defaults,
@@ -68,6 +72,20 @@ def test_resolve_defaults_mechanics():
     reset_component_defaults()
 
 
+def test_resolve_defaults_does_not_copy_without_overrides():
+    """Calls without explicit arguments get the read-only snapshot itself."""
+    reset_component_defaults()
+
+    first = resolve_defaults("Button", variant=None, size=None)
+    assert resolve_defaults("Button", variant=None) is first
+    with pytest.raises(TypeError):
+        first["variant"] = "danger"  # type: ignore[index]
+
+    overlaid = resolve_defaults("Button", variant="danger")
+    assert overlaid["variant"] == "danger"
+    assert first["variant"] == "primary"
+
+
 def test_add_bootstrap_integration():
     """Test add_bootstrap API with various themes and modes."""
     app = FastHTML()
@@ -98,3 +116,64 @@ def test_slot_classes_resolution():
     assert res["header_cls"] == "custom-header"
 
     reset_component_defaults()
+
+
+def test_component_defaults_scope():
+    """Context-local defaults apply inside the block only and nest."""
+    reset_component_defaults()
+
+    with component_defaults(Button={"variant": "dark"}):
+        assert resolve_defaults("Button", variant=None)["variant"] == "dark"
+        assert resolve_defaults("Button", variant="info")["variant"] == "info"
+
+        with component_defaults(Button={"size": "sm"}, Card={"header_cls": "bg-dark"}):
+            res = resolve_defaults("Button", variant=None, size=None)
+            assert res["variant"] == "dark"
+            assert res["size"] == "sm"
+            assert get_component_defaults("Card")["header_cls"] == "bg-dark"
+
+        assert resolve_defaults("Button", size=None)["size"] is None
+
+    assert resolve_defaults("Button", variant=None)["variant"] == "primary"
+
+
+def test_component_defaults_follow_global_changes():
+    """Scoped overrides are rebased when the global snapshot changes."""
+    reset_component_defaults()
+
+    with component_defaults(Button={"variant": "dark"}):
+        set_component_defaults("Button", size="lg")
+        res = resolve_defaults("Button", variant=None, size=None)
+        assert res["variant"] == "dark"
+        assert res["size"] == "lg"
+
+    reset_component_defaults()
+
+
+def test_component_defaults_isolated_between_tasks():
+    """Concurrent tasks see only their own overrides."""
+    reset_component_defaults()
+
+    async def render(variant):
+        with component_defaults(Button={"variant": variant}):
+            await asyncio.sleep(0)
+            return resolve_defaults("Button", variant=None)["variant"]
+
+    async def main():
+        return await asyncio.gather(render("dark"), render("light"), render("info"))
+
+    assert asyncio.run(main()) == ["dark", "light", "info"]
+    assert resolve_defaults("Button", variant=None)["variant"] == "primary"
+
+
+def test_component_defaults_snapshots_are_immutable():
+    """Returned defaults are copies; snapshots cannot be mutated."""
+    reset_component_defaults()
+
+    defaults = get_component_defaults("Button")
+    defaults["variant"] = "danger"
+    assert resolve_defaults("Button")["variant"] == "primary"
+
+    with pytest.raises(ValueError):
+        with component_defaults(Button="dark"):
+            pass